@@ -1,6 +1,17 @@
 
-from .bins_applier import BinApplier
+from .bins_applier import MISSING_LABEL, SINGLE_BIN_LABEL, BinApplier, bin_codes
 from .tree_binner import TreeBinner
 from .quantile_binner import QuantileBinner
+from .quantile_sketch import QuantileSketch
+from .monotonic_binner import MonotonicBinner
 
-__all__ = ["BinApplier", "TreeBinner", "QuantileBinner"]
\ No newline at end of file
+__all__ = [
+    "BinApplier",
+    "bin_codes",
+    "MISSING_LABEL",
+    "SINGLE_BIN_LABEL",
+    "TreeBinner",
+    "QuantileBinner",
+    "QuantileSketch",
+    "MonotonicBinner",
+]
\ No newline at end of file
@@ -1,5 +1,84 @@
 import pandas as pd
-from typing import List
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from model_track.utils import code_dtype
+
+
+MISSING_LABEL = "N/A"
+# bin único de uma feature sem cortes (binner que não achou split)
+SINGLE_BIN_LABEL = "(-inf, inf)"
+
+
+def bin_codes(values: np.ndarray, bins: List[float]) -> np.ndarray:
+    """
+    Códigos inteiros dos bins para um array numérico.
+
+    Intervalos fechados à direita (mesma regra do pd.cut):
+    - código 0            => x <= bins[0]
+    - código i            => bins[i-1] < x <= bins[i]
+    - código len(bins)    => x > bins[-1]
+    - código len(bins)+1  => valor ausente (reservado para "N/A")
+
+    values é um array float (NaN = ausente). Os códigos usam o menor
+    dtype inteiro capaz de representá-los e são decodificados por
+    BinApplier.labels(bins).
+    """
+    n_codes = len(bins) + 2
+    codes = np.searchsorted(np.asarray(bins, dtype=float), values, side="left")
+    codes = codes.astype(code_dtype(n_codes), copy=False)
+    codes[np.isnan(values)] = n_codes - 1
+    return codes
+
+
+def _decode(codes: np.ndarray, labels: List[str], output: str):
+    """Converte códigos no formato de saída pedido (sem índice)."""
+    if output == "codes":
+        return codes
+    if output == "category":
+        return pd.Categorical.from_codes(codes, categories=labels)
+    # Indexa o array de labels pelos códigos ("N/A" já incluso)
+    return np.asarray(labels, dtype=object)[codes]
+
+
+def _check_output(output: str):
+    if output not in ("object", "category", "codes"):
+        raise ValueError(
+            "output must be one of 'object', 'category' or 'codes'"
+        )
+
+
+def _chunk_column(chunk, column: str) -> np.ndarray:
+    """Coluna numérica (float, NaN para ausentes) de um chunk pandas ou Arrow."""
+    if isinstance(chunk, pd.DataFrame):
+        if column not in chunk.columns:
+            raise ValueError(f"Column '{column}' not found in chunk")
+        return chunk[column].to_numpy(dtype=float, na_value=np.nan)
+
+    # pyarrow.RecordBatch / Table: só a coluna pedida é convertida
+    index = chunk.schema.get_field_index(column)
+    if index < 0:
+        raise ValueError(f"Column '{column}' not found in chunk")
+    array = chunk.column(index).to_numpy(zero_copy_only=False)
+    return np.asarray(array, dtype=float)
+
+
+def _chunk_frame(chunk, columns: List[str]) -> pd.DataFrame:
+    """Colunas repassadas sem alteração (ex.: ids) como DataFrame."""
+    if isinstance(chunk, pd.DataFrame):
+        missing = [c for c in columns if c not in chunk.columns]
+        if missing:
+            raise ValueError(f"Columns not found in chunk: {missing}")
+        return chunk[columns].reset_index(drop=True)
+
+    data = {}
+    for column in columns:
+        index = chunk.schema.get_field_index(column)
+        if index < 0:
+            raise ValueError(f"Column '{column}' not found in chunk")
+        data[column] = chunk.column(index).to_pandas()
+    return pd.DataFrame(data)
 
 
 class BinApplier:
@@ -8,6 +87,10 @@ class BinApplier:
 
     df: DataFrame base
     apply(column, bins) -> retorna uma Series com labels em string
+    apply(column, bins, output="category" | "codes") -> saída compacta
+    apply_many({column: bins}) -> retorna códigos inteiros + tabela de labels
+    apply_stream(chunks, bins) / to_parquet(chunks, bins, path)
+        -> modo streaming sobre chunks pandas ou RecordBatches do Arrow
     """
 
     def __init__(self, df: pd.DataFrame):
@@ -18,13 +101,11 @@ class BinApplier:
     # ------------------------
     # VALIDAÇÃO DOS BINS
     # ------------------------
-    def _validate_bins(self, bins: List[float]):
+    @staticmethod
+    def _validate_bins(bins: List[float]):
         if not isinstance(bins, list):
             raise ValueError("Bins must be a list of numeric values")
 
-        if len(bins) < 1:
-            raise ValueError("Must provide at least one bin edge")
-
         if sorted(bins) != bins:
             raise ValueError("Bins must be sorted ascending")
 
@@ -34,12 +115,17 @@ class BinApplier:
     # ------------------------
     # GERAR LABELS
     # ------------------------
-    def _generate_labels(self, bins: List[float]) -> List[str]:
+    @staticmethod
+    def _generate_labels(bins: List[float]) -> List[str]:
         """
         Regras:
+        - sem cortes => "(-inf, inf)" (bin único)
         - 1 bin  => "<= x", "> x"
         - n bins => "<= b0", "(b0,b1]", "(b1,b2]", ..., "> b_last"
         """
+        if len(bins) == 0:
+            return [SINGLE_BIN_LABEL]
+
         if len(bins) == 1:
             edge = bins[0]
             return [f"<= {edge}", f"> {edge}"]
@@ -55,22 +141,197 @@ class BinApplier:
     # ------------------------
     # APLICAÇÃO DOS BINS
     # ------------------------
-    def apply(self, column: str, bins: List[float]) -> pd.Series:
+    @staticmethod
+    def labels(bins: List[float]) -> List[str]:
+        """
+        Dicionário fixo de labels: a posição i corresponde ao código i.
+        O último label ("N/A") é reservado para valores ausentes.
+        Não depende do DataFrame: BinApplier.labels(bins) também funciona.
+        """
+        BinApplier._validate_bins(bins)
+        return BinApplier._generate_labels(bins) + [MISSING_LABEL]
+
+    def apply(
+        self,
+        column: str,
+        bins: List[float],
+        output: str = "object",
+    ) -> pd.Series:
+        """
+        Aplica os bins em uma coluna.
+
+        output:
+        - "object"   => labels em string (comportamento original)
+        - "category" => pd.Categorical com os labels como categorias
+        - "codes"    => códigos inteiros compactos (int8/int16),
+                        decodificados por labels(bins)
+        """
         if column not in self.df.columns:
             raise ValueError(f"Column '{column}' not found in DataFrame")
 
-        self._validate_bins(bins)
+        _check_output(output)
 
-        labels = self._generate_labels(bins)
-        cut_edges = [-float("inf")] + bins + [float("inf")]
+        # labels construídos uma única vez por conjunto de bins
+        labels = self.labels(bins)
+        codes = bin_codes(self._numeric_values(column), bins)
 
-        # pd.cut gera categorias → converteremos p/ string depois
-        binned = pd.cut(
-            self.df[column],
-            bins=cut_edges,
-            labels=labels,
-            include_lowest=True
+        return pd.Series(
+            _decode(codes, labels, output),
+            index=self.df.index,
+            name=column,
         )
 
-        # Converte para string e substitui NaN por "N/A"
-        return binned.astype(object).where(binned.notna(), "N/A")
\ No newline at end of file
+    # ------------------------
+    # APLICAÇÃO EM VÁRIAS COLUNAS
+    # ------------------------
+    def _numeric_values(self, column: str) -> np.ndarray:
+        return self.df[column].to_numpy(dtype=float, na_value=np.nan)
+
+    def apply_many(
+        self,
+        bins: Dict[str, List[float]],
+        n_jobs: Optional[int] = 1,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Aplica bins em várias colunas com np.searchsorted, sem gerar strings.
+
+        Parameters
+        ----------
+        bins : Dict[str, List[float]]
+            Mapeamento {coluna: pontos de corte}.
+        n_jobs : int, optional
+            Número de threads usadas para processar as colunas
+            (1 = sequencial, None ou -1 = todos os núcleos).
+
+        Returns
+        -------
+        Tuple[pd.DataFrame, pd.DataFrame]
+            - DataFrame de códigos inteiros compactos (int8/int16),
+              com o mesmo índice de df e uma coluna por feature.
+            - Tabela de labels compartilhada com colunas
+              ['feature', 'code', 'label']. O último código de cada
+              feature é reservado para valores ausentes ("N/A").
+        """
+        for column, column_bins in bins.items():
+            if column not in self.df.columns:
+                raise ValueError(f"Column '{column}' not found in DataFrame")
+            self._validate_bins(column_bins)
+
+        columns = list(bins)
+
+        def encode(column: str) -> np.ndarray:
+            return bin_codes(self._numeric_values(column), bins[column])
+
+        if n_jobs == 1 or len(columns) <= 1:
+            encoded = [encode(c) for c in columns]
+        else:
+            workers = None if n_jobs in (None, -1) else n_jobs
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                encoded = list(executor.map(encode, columns))
+
+        codes = pd.DataFrame(dict(zip(columns, encoded)), index=self.df.index)
+
+        return codes, self._label_table(bins)
+
+    @staticmethod
+    def _label_table(bins: Dict[str, List[float]]) -> pd.DataFrame:
+        label_rows = []
+        for column, column_bins in bins.items():
+            labels = BinApplier.labels(column_bins)
+            label_rows.extend(
+                (column, code, label) for code, label in enumerate(labels)
+            )
+        return pd.DataFrame(label_rows, columns=["feature", "code", "label"])
+
+    # ------------------------
+    # MODO STREAMING
+    # ------------------------
+    @staticmethod
+    def apply_stream(
+        chunks: Iterable,
+        bins: Dict[str, List[float]],
+        output: str = "codes",
+        keep_columns: Optional[List[str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Aplica bins já calculados chunk a chunk, sem carregar a base inteira.
+
+        Parameters
+        ----------
+        chunks : Iterable[pd.DataFrame or pyarrow.RecordBatch]
+            Ex.: pd.read_csv(..., chunksize=...) ou
+            pyarrow.parquet.ParquetFile(...).iter_batches().
+        bins : Dict[str, List[float]]
+            Mapeamento {coluna: pontos de corte}.
+        output : str
+            "codes" (padrão), "category" ou "object", como em apply().
+        keep_columns : List[str], optional
+            Colunas repassadas sem alteração (ex.: chave, safra).
+
+        Yields
+        ------
+        pd.DataFrame
+            Um DataFrame por chunk (índice 0..n-1), com keep_columns
+            seguidas de uma coluna por feature.
+
+        Notes
+        -----
+        Só as colunas de bins (e keep_columns) de cada chunk são
+        convertidas, então o pico de memória depende do tamanho do chunk,
+        não do tamanho da base.
+        """
+        _check_output(output)
+        keep_columns = list(keep_columns or [])
+
+        # labels validados e construídos uma única vez
+        labels = {column: BinApplier.labels(b) for column, b in bins.items()}
+
+        for chunk in chunks:
+            frame = _chunk_frame(chunk, keep_columns)
+            for column, column_bins in bins.items():
+                codes = bin_codes(_chunk_column(chunk, column), column_bins)
+                frame[column] = _decode(codes, labels[column], output)
+            yield frame
+
+    @staticmethod
+    def to_parquet(
+        chunks: Iterable,
+        bins: Dict[str, List[float]],
+        path: str,
+        output: str = "codes",
+        keep_columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Versão de apply_stream que grava cada chunk em um arquivo parquet
+        assim que é processado (requer pyarrow).
+
+        Returns
+        -------
+        pd.DataFrame
+            Tabela de labels ['feature', 'code', 'label'], como em
+            apply_many, para decodificar os códigos gravados.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:  # pragma: no cover - depende do ambiente
+            raise ImportError("to_parquet requires pyarrow to be installed") from exc
+
+        writer = None
+        try:
+            for frame in BinApplier.apply_stream(chunks, bins, output, keep_columns):
+                if writer is None:
+                    table = pa.Table.from_pandas(frame, preserve_index=False)
+                    writer = pq.ParquetWriter(path, table.schema)
+                else:
+                    # schema do primeiro chunk (evita divergência de tipos
+                    # em colunas repassadas, ex.: chunk todo nulo)
+                    table = pa.Table.from_pandas(
+                        frame, schema=writer.schema, preserve_index=False
+                    )
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return BinApplier._label_table(bins)
@@ -0,0 +1,223 @@
+import numpy as np
+
+
+class MonotonicBinner:
+    """
+    Generates binning cut points with monotonic WOE.
+
+    The feature is first split into fine quantile pre-bins and counted in
+    a single pass. Everything else runs on the per-bin event/non-event
+    count vectors:
+
+    1. pool-adjacent-violators merges neighbours until the event rate is
+       strictly monotonic;
+    2. bins smaller than min_bin_size are merged into the neighbour with
+       the closest event rate;
+    3. adjacent bins whose separation adds less than min_iv to the
+       Information Value are merged.
+
+    Merging adjacent bins never breaks monotonicity, so the result is
+    monotonic after every step. bins_ follows the same convention as
+    TreeBinner / QuantileBinner and can be used with BinApplier.
+
+    Parameters
+    ----------
+    n_prebins: int
+        Number of fine quantile pre-bins.
+    min_bin_size: float
+        Minimum share of observations per final bin.
+    min_iv: float
+        Minimum IV gain required to keep two adjacent bins apart.
+    direction: str
+        "ascending", "descending" or "auto" (keeps the highest IV).
+    epsilon: float
+        Protection against division by zero (same role as in WoeCalculator).
+    """
+
+    def __init__(
+        self,
+        n_prebins=20,
+        min_bin_size=0.05,
+        min_iv=0.0,
+        direction="auto",
+        epsilon=1e-8,
+    ):
+        self.n_prebins = n_prebins
+        self.min_bin_size = min_bin_size
+        self.min_iv = min_iv
+        self.direction = direction
+        self.epsilon = epsilon
+        self.bins_ = []
+        self.n_event_ = np.empty(0)
+        self.n_non_event_ = np.empty(0)
+        self.iv_ = 0.0
+
+    def _prepare_data(self, df, feature, target, event_value):
+        """Drops rows with missing feature or target and flags events."""
+        series = df[feature]
+        valid = series.notna() & df[target].notna()
+
+        x = series[valid].astype(float).values
+        is_event = (df.loc[valid, target] == event_value).values
+
+        return x, is_event
+
+    def fit(self, df, feature, target, event_value=1):
+        """
+        Builds the pre-bins, counts events per pre-bin and runs the
+        monotonic merging on the counts.
+        """
+        x, is_event = self._prepare_data(df, feature, target, event_value)
+
+        if len(x) == 0:
+            self.bins_ = []
+            return self
+
+        quantiles = np.linspace(0, 1, self.n_prebins + 1)[1:-1]
+        edges = np.unique(np.quantile(x, quantiles))
+
+        codes = np.searchsorted(edges, x, side="left")
+        n_event = np.bincount(codes[is_event], minlength=len(edges) + 1)
+        n_non_event = np.bincount(codes[~is_event], minlength=len(edges) + 1)
+
+        return self.fit_counts(edges, n_event, n_non_event)
+
+    def fit_counts(self, edges, n_event, n_non_event):
+        """
+        Monotonic merging on pre-aggregated counts.
+
+        Parameters
+        ----------
+        edges : array-like
+            Sorted pre-bin cut points (len = n_bins - 1), with the
+            BinApplier convention: bin i holds edges[i-1] < x <= edges[i].
+        n_event, n_non_event : array-like
+            Event / non-event counts per pre-bin (len = n_bins).
+        """
+        if self.direction not in ("ascending", "descending", "auto"):
+            raise ValueError("direction must be 'ascending', 'descending' or 'auto'")
+
+        edges = np.asarray(edges, dtype=float)
+        n_event = np.asarray(n_event, dtype=float)
+        n_non_event = np.asarray(n_non_event, dtype=float)
+
+        if len(n_event) != len(edges) + 1 or len(n_non_event) != len(edges) + 1:
+            raise ValueError("Counts must have exactly len(edges) + 1 entries")
+
+        directions = (
+            ["ascending", "descending"] if self.direction == "auto" else [self.direction]
+        )
+
+        best = None
+        for direction in directions:
+            blocks = self._merge(n_event, n_non_event, direction)
+            iv = self._iv(blocks[:, 1], blocks[:, 2]).sum()
+            if best is None or iv > best[1]:
+                best = (blocks, iv)
+
+        blocks, iv = best
+
+        # a block ends at pre-bin `end`; its upper cut point is edges[end]
+        self.bins_ = [float(edges[end]) for end in blocks[:-1, 0].astype(int)]
+        self.n_event_ = blocks[:, 1]
+        self.n_non_event_ = blocks[:, 2]
+        self.iv_ = float(iv)
+        return self
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _iv(self, n_event, n_non_event):
+        event_rate = n_event / max(n_event.sum(), self.epsilon)
+        non_event_rate = n_non_event / max(n_non_event.sum(), self.epsilon)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            woe = np.log(event_rate / non_event_rate)
+            return (event_rate - non_event_rate) * woe
+
+    def _merge(self, n_event, n_non_event, direction):
+        """
+        Returns an (n_blocks, 3) array of [last pre-bin index, n_event,
+        n_non_event] per final bin.
+        """
+        # empty pre-bins carry no information
+        keep = (n_event + n_non_event) > 0
+        blocks = np.column_stack([np.flatnonzero(keep), n_event[keep], n_non_event[keep]])
+
+        blocks = self._pool_adjacent_violators(blocks, direction)
+        blocks = self._merge_small_bins(blocks)
+        blocks = self._merge_low_iv_bins(blocks)
+        return blocks
+
+    @staticmethod
+    def _event_rate(blocks):
+        return blocks[:, 1] / (blocks[:, 1] + blocks[:, 2])
+
+    @staticmethod
+    def _merge_pair(blocks, i):
+        """Merges block i with block i + 1 (the later block keeps its end)."""
+        merged = blocks[i + 1].copy()
+        merged[1:] += blocks[i, 1:]
+        return np.vstack([blocks[:i], merged, blocks[i + 2:]])
+
+    def _pool_adjacent_violators(self, blocks, direction):
+        sign = 1.0 if direction == "ascending" else -1.0
+        pooled = []
+
+        for block in blocks:
+            pooled.append(block.copy())
+            # pool while the last two blocks are not strictly monotonic
+            while len(pooled) > 1:
+                prev, last = pooled[-2], pooled[-1]
+                prev_rate = prev[1] / (prev[1] + prev[2])
+                last_rate = last[1] / (last[1] + last[2])
+                if sign * (last_rate - prev_rate) > 0:
+                    break
+                last[1:] += prev[1:]
+                del pooled[-2]
+
+        return np.array(pooled)
+
+    def _merge_small_bins(self, blocks):
+        min_size = self.min_bin_size * blocks[:, 1:].sum()
+
+        while len(blocks) > 1:
+            sizes = blocks[:, 1] + blocks[:, 2]
+            i = int(np.argmin(sizes))
+            if sizes[i] >= min_size:
+                break
+
+            rates = self._event_rate(blocks)
+            if i == 0:
+                pair = 0
+            elif i == len(blocks) - 1:
+                pair = i - 1
+            else:
+                # neighbour with the closest event rate
+                closer_left = abs(rates[i] - rates[i - 1]) <= abs(rates[i] - rates[i + 1])
+                pair = i - 1 if closer_left else i
+            blocks = self._merge_pair(blocks, pair)
+
+        return blocks
+
+    def _merge_low_iv_bins(self, blocks):
+        while len(blocks) > 1:
+            iv = self._iv(blocks[:, 1], blocks[:, 2])
+
+            # IV lost by merging each adjacent pair (totals are unchanged)
+            merged = blocks[:-1, 1:] + blocks[1:, 1:]
+            total_event = max(blocks[:, 1].sum(), self.epsilon)
+            total_non_event = max(blocks[:, 2].sum(), self.epsilon)
+            event_rate = merged[:, 0] / total_event
+            non_event_rate = merged[:, 1] / total_non_event
+            with np.errstate(divide="ignore", invalid="ignore"):
+                merged_iv = (event_rate - non_event_rate) * np.log(event_rate / non_event_rate)
+                loss = iv[:-1] + iv[1:] - merged_iv
+
+            # infinite WOE makes the gain undefined: never merge on IV alone
+            loss = np.where(np.isfinite(loss), loss, np.inf)
+            pair = int(np.argmin(loss))
+            if loss[pair] >= self.min_iv:
+                break
+            blocks = self._merge_pair(blocks, pair)
+
+        return blocks
@@ -0,0 +1,94 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from model_track.utils import resolve_n_jobs
+
+
+# Per-process state of the fit_many workers (set by _init_worker).
+_WORKER = {}
+
+
+def _init_worker(features_path, target_path, binner):
+    _WORKER["features"] = np.load(features_path, mmap_mode="r")
+    _WORKER["target"] = None if target_path is None else np.load(target_path, mmap_mode="r")
+    _WORKER["binner"] = binner
+
+
+def _fit_column(index):
+    return _WORKER["binner"].fit_arrays(_WORKER["features"][index], _WORKER["target"])
+
+
+def fit_many(binner, df, features, target=None, n_jobs=1, temp_folder=None):
+    """
+    Fits the same binner configuration on many features.
+
+    The target is validated and encoded once. With n_jobs != 1 the
+    feature columns are written once to a memory-mapped array shared by
+    the worker processes, so the DataFrame is never pickled.
+
+    Parameters
+    ----------
+    binner : TreeBinner or QuantileBinner
+        Configured (unfitted) binner; it is left untouched.
+    df : pd.DataFrame
+        Source data.
+    features : list of str
+        Feature columns to bin.
+    target : str, optional
+        Target column (required by TreeBinner).
+    n_jobs : int, optional
+        Number of worker processes (1 = sequential, None or -1 = all cores).
+    temp_folder : str, optional
+        Folder for the memory-mapped arrays (default: system temp folder).
+
+    Returns
+    -------
+    Dict[str, List[float]]
+        Cut points per feature.
+    """
+    n_jobs = resolve_n_jobs(n_jobs)
+    features = list(features)
+
+    missing = [c for c in features + ([target] if target else []) if c not in df.columns]
+    if missing:
+        raise KeyError(f"Columns not found in DataFrame: {missing}")
+
+    y = None if target is None else df[target].to_numpy(dtype=float, na_value=np.nan)
+
+    if n_jobs == 1 or len(features) <= 1:
+        return {
+            feature: binner.fit_arrays(
+                df[feature].to_numpy(dtype=float, na_value=np.nan), y
+            )
+            for feature in features
+        }
+
+    with tempfile.TemporaryDirectory(dir=temp_folder) as folder:
+        features_path = os.path.join(folder, "features.npy")
+        shared = np.lib.format.open_memmap(
+            features_path, mode="w+", dtype=float, shape=(len(features), len(df))
+        )
+        for i, feature in enumerate(features):
+            shared[i] = df[feature].to_numpy(dtype=float, na_value=np.nan)
+        shared.flush()
+        del shared
+
+        target_path = None
+        if y is not None:
+            target_path = os.path.join(folder, "target.npy")
+            np.save(target_path, y)
+
+        n_workers = min(n_jobs, len(features))
+        chunksize = max(1, len(features) // (n_workers * 4))
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(features_path, target_path, binner),
+        ) as executor:
+            bins = list(executor.map(_fit_column, range(len(features)), chunksize=chunksize))
+
+    return dict(zip(features, bins))
@@ -1,5 +1,8 @@
 import numpy as np
 
+from .parallel import fit_many
+from .quantile_sketch import QuantileSketch
+
 
 class QuantileBinner:
     """
@@ -12,12 +15,21 @@ class QuantileBinner:
         Number of desired bins (e.g. 3 => tercis, 4 => quartis).
     min_unique: int
         Minimum required distinct values to compute bins.
+    sketch_k: int
+        Accuracy parameter of the quantile sketch used by partial_fit
+        (see QuantileSketch.normalized_rank_error).
+    random_state: int, optional
+        Seed of the quantile sketch used by partial_fit.
     """
 
-    def __init__(self, n_bins=3, min_unique=5):
+    def __init__(self, n_bins=3, min_unique=5, sketch_k=200, random_state=None):
         self.n_bins = n_bins
         self.min_unique = min_unique
+        self.sketch_k = sketch_k
+        self.random_state = random_state
         self.bins_ = []
+        self.sketch_ = None
+        self._distinct = np.empty(0)
 
     def _prepare_data(self, df, feature):
         """Extracts a clean numeric series."""
@@ -29,6 +41,27 @@ class QuantileBinner:
 
         return values
 
+    def _cut_points(self, n_distinct, quantile_fn):
+        """Internal quantile cut points, or [] when they cannot be computed."""
+        # Not enough unique values → no bins
+        if n_distinct < self.min_unique:
+            return []
+
+        # Compute quantile cut points
+        quantiles = np.linspace(0, 1, self.n_bins + 1)
+
+        # Only internal cut points (exclude 0 and 1)
+        cut_points = quantile_fn(quantiles)[1:-1]
+
+        # Remove duplicates (possible in discrete fields)
+        cut_points = sorted(set(cut_points))
+
+        # If too few distinct cut points → fallback sem bins
+        if len(cut_points) == 0:
+            return []
+
+        return [float(x) for x in cut_points]
+
     def fit(self, df, feature, target=None):
         """
         Creates bins based on quantiles.
@@ -36,25 +69,92 @@ class QuantileBinner:
         but it is ignored here.
         """
         values = self._prepare_data(df, feature)
+        self.bins_ = self._exact_bins(values)
+        return self
 
-        # Not enough unique values → no bins
-        if len(np.unique(values)) < self.min_unique:
-            self.bins_ = []
+    def fit_many(self, df, features, target=None, n_jobs=1):
+        """
+        Fits this configuration on many features at once.
+
+        With n_jobs != 1 the features are shared with worker processes
+        through a memory-mapped array.
+
+        Returns
+        -------
+        Dict[str, List[float]]
+            Cut points per feature.
+        """
+        return fit_many(self, df, features, target=None, n_jobs=n_jobs)
+
+    def fit_arrays(self, x, y=None):
+        """
+        Cut points of fit() computed on a float array (NaN = missing).
+
+        Does not change bins_: used by fit_many and IvScreener to bin
+        many columns with one configuration. y is ignored.
+
+        Returns
+        -------
+        List[float]
+            Cut points (empty if the values cannot be split).
+        """
+        return self._exact_bins(x[~np.isnan(x)])
+
+    def _exact_bins(self, values):
+        return self._cut_points(
+            len(np.unique(values)),
+            lambda q: np.quantile(values, q),
+        )
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+    def partial_fit(self, df, feature, target=None):
+        """
+        Updates the bins with a chunk of data.
+
+        Values are summarised in a mergeable quantile sketch, so the full
+        column never needs to be in memory. bins_ is refreshed after every
+        chunk and approximates the cut points of fit() on the concatenated
+        chunks within the sketch rank error.
+        """
+        values = self._prepare_data(df, feature)
+
+        if self.sketch_ is None:
+            self.sketch_ = QuantileSketch(k=self.sketch_k, random_state=self.random_state)
+
+        self.sketch_.update(values)
+        self._track_distinct(values)
+        self._refresh_streaming_bins()
+        return self
+
+    def merge(self, other):
+        """
+        Merges the streaming state of another QuantileBinner (e.g. fitted
+        with partial_fit on another worker) into this one.
+        """
+        if other.sketch_ is None:
             return self
 
-        # Compute quantile cut points
-        quantiles = np.linspace(0, 1, self.n_bins + 1)
+        if self.sketch_ is None:
+            self.sketch_ = QuantileSketch(k=self.sketch_k, random_state=self.random_state)
 
-        # Only internal cut points (exclude 0 and 1)
-        cut_points = np.quantile(values, quantiles)[1:-1]
+        self.sketch_.merge(other.sketch_)
+        self._track_distinct(other._distinct)
+        self._refresh_streaming_bins()
+        return self
 
-        # Remove duplicates (possible in discrete fields)
-        cut_points = sorted(set(cut_points))
+    def _track_distinct(self, values):
+        # only the first min_unique distinct values are needed to decide
+        # whether bins can be computed, so the state stays bounded
+        if len(self._distinct) >= self.min_unique:
+            return
+        distinct = np.union1d(self._distinct, values)
+        self._distinct = distinct[:self.min_unique]
 
-        # If too few distinct cut points → fallback sem bins
-        if len(cut_points) == 0:
+    def _refresh_streaming_bins(self):
+        if self.sketch_.n == 0:
             self.bins_ = []
-            return self
+            return
 
-        self.bins_ = [float(x) for x in cut_points]
-        return self
\ No newline at end of file
+        self.bins_ = self._cut_points(len(self._distinct), self.sketch_.quantiles)
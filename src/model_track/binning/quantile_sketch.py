@@ -0,0 +1,166 @@
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Mergeable streaming quantile sketch (KLL).
+
+    Values are kept in a hierarchy of compactors: an item stored at
+    level h stands for 2**h original values. When a level exceeds its
+    capacity it is sorted and every other item (random offset) is
+    promoted to the next level, so memory stays O(k) regardless of the
+    number of values seen.
+
+    Rank error
+    ----------
+    For a single quantile query, the normalized rank error is below
+    ``normalized_rank_error()`` (~1.33% for k=200) with 99% confidence,
+    i.e. the returned value has a true rank within q +/- error.
+    Sketches built on different chunks or processes can be merged with
+    ``merge`` and keep the same guarantee.
+
+    Parameters
+    ----------
+    k: int
+        Accuracy parameter (capacity of the top compactor).
+    random_state: int, optional
+        Seed for the compaction offsets.
+    """
+
+    _DECAY = 2.0 / 3.0
+    _MIN_CAPACITY = 8
+
+    def __init__(self, k=200, random_state=None):
+        if k < self._MIN_CAPACITY:
+            raise ValueError(f"k must be >= {self._MIN_CAPACITY}")
+
+        self.k = k
+        self.random_state = random_state
+        self.n = 0
+        self.min_ = np.nan
+        self.max_ = np.nan
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(random_state)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def update(self, values):
+        """Adds a batch of values (NaNs are ignored)."""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+
+        if len(values) == 0:
+            return self
+
+        self.n += len(values)
+        self.min_ = np.fmin(self.min_, values.min())
+        self.max_ = np.fmax(self.max_, values.max())
+
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Merges another sketch into this one (in place)."""
+        if not isinstance(other, QuantileSketch):
+            raise ValueError("other must be a QuantileSketch")
+
+        if other.n == 0:
+            return self
+
+        self.n += other.n
+        self.min_ = np.fmin(self.min_, other.min_)
+        self.max_ = np.fmax(self.max_, other.max_)
+
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+
+        for h, items in enumerate(other._levels):
+            self._levels[h] = np.concatenate([self._levels[h], items])
+
+        self._compress()
+        return self
+
+    def quantiles(self, q):
+        """Approximate quantiles for the probabilities in q."""
+        if self.n == 0:
+            raise ValueError("Cannot compute quantiles of an empty sketch")
+
+        q = np.asarray(q, dtype=float)
+        items, weights = self._weighted_items()
+
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cum_weights = np.cumsum(weights[order])
+
+        idx = np.searchsorted(cum_weights, q * self.n, side="left")
+        result = items[np.clip(idx, 0, len(items) - 1)]
+
+        # extremes are tracked exactly
+        result = np.where(q <= 0, self.min_, result)
+        result = np.where(q >= 1, self.max_, result)
+        return result
+
+    def normalized_rank_error(self):
+        """
+        Single-quantile rank error bound at 99% confidence
+        (empirical fit published with the Apache DataSketches KLL sketch).
+        """
+        return 2.296 / self.k ** 0.9723
+
+    def to_dict(self):
+        """Plain-python state, suitable for JSON or cross-process transfer."""
+        return {
+            "k": self.k,
+            "n": self.n,
+            "min": float(self.min_),
+            "max": float(self.max_),
+            "levels": [level.tolist() for level in self._levels],
+        }
+
+    @classmethod
+    def from_dict(cls, state, random_state=None):
+        sketch = cls(k=state["k"], random_state=random_state)
+        sketch.n = state["n"]
+        sketch.min_ = state["min"]
+        sketch.max_ = state["max"]
+        sketch._levels = [np.asarray(level, dtype=float) for level in state["levels"]]
+        return sketch
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _capacity(self, level, n_levels):
+        depth = n_levels - 1 - level
+        return max(self._MIN_CAPACITY, int(np.ceil(self.k * self._DECAY ** depth)))
+
+    def _compress(self):
+        while True:
+            n_levels = len(self._levels)
+            for h in range(n_levels):
+                if len(self._levels[h]) > self._capacity(h, n_levels):
+                    self._compact(h)
+                    break
+            else:
+                return
+
+    def _compact(self, level):
+        items = np.sort(self._levels[level])
+
+        # an odd item stays behind so the promoted half is unbiased
+        n_keep = len(items) % 2
+        offset = int(self._rng.integers(2))
+        promoted = items[n_keep + offset::2]
+
+        self._levels[level] = items[:n_keep]
+        if level + 1 == len(self._levels):
+            self._levels.append(np.empty(0))
+        self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+
+    def _weighted_items(self):
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(len(level), 2.0 ** h) for h, level in enumerate(self._levels)
+        ])
+        return items, weights
@@ -1,14 +1,153 @@
-from sklearn.tree import DecisionTreeClassifier
+import numpy as np
+import pandas as pd
+
+from .parallel import fit_many
+
+
+# Same tolerances used by sklearn's tree builder, so that the native
+# engine reproduces the reference thresholds.
+FEATURE_THRESHOLD = np.float32(1e-7)
+EPSILON = np.finfo("double").eps
+
+# Rows bucketed per step by the histogram engine (bounds temporaries).
+HIST_CHUNK_SIZE = 1 << 20
+
+
+def _impurity(counts, n, criterion):
+    """Node impurity for a sequence of per-class count arrays."""
+    if criterion == "gini":
+        sq_count = 0.0
+        for count_k in counts:
+            sq_count = sq_count + count_k * count_k
+        return 1.0 - sq_count / (n * n)
+
+    entropy = 0.0
+    for count_k in counts:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p_k = count_k / n
+            term = np.where(p_k > 0.0, p_k * (np.log(p_k) / np.log(2.0)), 0.0)
+        entropy = entropy - term
+    return entropy
+
+
+def _best_splits(counts, thresholds, valid, max_depth, min_samples_leaf, criterion):
+    """
+    Depth-first 1-D split search on aggregated class counts.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        (n_classes, n_groups) class counts of consecutive, sorted groups
+        of the feature (distinct values or histogram buckets).
+    thresholds : np.ndarray
+        (n_groups - 1,) cut point used when splitting between group i
+        and group i + 1.
+    valid : np.ndarray
+        (n_groups - 1,) boolean mask of the boundaries that may be split.
+
+    Returns
+    -------
+    list of float
+        Thresholds of every internal node.
+    """
+    n_classes, n_groups = counts.shape
+    cum = np.zeros((n_classes, n_groups + 1))
+    np.cumsum(counts, axis=1, out=cum[:, 1:])
+
+    # boundary b separates groups [.., b) from [b, ..); gathering the
+    # cumulative counts at the valid boundaries once lets every node work
+    # on contiguous slices
+    boundaries = np.flatnonzero(valid) + 1
+    cum_at_boundaries = cum[:, boundaries]
+
+    splits = []
+    stack = [(0, n_groups, 0)]
+
+    while stack:
+        lo, hi, depth = stack.pop()
+        node = cum[:, hi] - cum[:, lo]
+        n_node = node.sum()
+
+        if (
+            (max_depth is not None and depth >= max_depth)
+            or n_node < 2 * min_samples_leaf
+            or _impurity(node, n_node, criterion) <= EPSILON
+        ):
+            continue
+
+        first, last = np.searchsorted(boundaries, [lo + 1, hi])
+        if first == last:
+            continue
+
+        left = [cum_at_boundaries[k, first:last] - cum[k, lo] for k in range(n_classes)]
+        right = [node[k] - left[k] for k in range(n_classes)]
+        n_left = sum(left)
+        n_right = n_node - n_left
+
+        allowed = (n_left >= min_samples_leaf) & (n_right >= min_samples_leaf)
+        if not allowed.any():
+            continue
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            proxy = (
+                -n_right * _impurity(right, n_right, criterion)
+                - n_left * _impurity(left, n_left, criterion)
+            )
+        proxy = np.where(allowed, proxy, -np.inf)
+
+        # argmax keeps the first best boundary, as sklearn's strict ">" scan
+        best = int(boundaries[first + np.argmax(proxy)])
+        splits.append(float(thresholds[best - 1]))
+
+        stack.append((best, hi, depth + 1))
+        stack.append((lo, best, depth + 1))
+
+    return splits
 
 
 class TreeBinner:
     """
     Generates binning cut points using a shallow decision tree.
+
+    Parameters
+    ----------
+    max_depth: int
+        Maximum depth of the tree.
+    min_samples_leaf: int
+        Minimum number of samples required in each leaf.
+    criterion: str
+        Split quality measure: "gini" or "entropy".
+    engine: str
+        "exact" sorts the feature once and searches the optimal 1-D splits
+        on cumulative class counts (no sklearn required).
+        "hist" pre-buckets the feature into at most max_bins quantile
+        buckets and searches the splits on the bucket counts.
+        "sklearn" fits a sklearn DecisionTreeClassifier (reference mode).
+    max_bins: int
+        Maximum number of histogram buckets (engine="hist").
+    subsample: int
+        Number of rows sampled to compute the bucket edges (engine="hist").
+    random_state: int, optional
+        Seed used to draw the subsample (engine="hist").
     """
 
-    def __init__(self, max_depth=2, min_samples_leaf=50):
+    def __init__(
+        self,
+        max_depth=2,
+        min_samples_leaf=50,
+        criterion="gini",
+        engine="exact",
+        max_bins=255,
+        subsample=200_000,
+        random_state=None,
+    ):
         self.max_depth = max_depth
         self.min_samples_leaf = min_samples_leaf
+        self.criterion = criterion
+        self.engine = engine
+        self.max_bins = max_bins
+        self.subsample = subsample
+        self.random_state = random_state
         self.model_ = None
         self.bins_ = []
 
@@ -27,28 +166,69 @@ class TreeBinner:
         """
         Fit a shallow decision tree and extract valid splits.
         """
+        self._check_params()
         X, y, min_val, max_val = self._prepare_data(df, feature, target)
+        self.bins_ = self._find_bins(X, y, min_val, max_val)
+        return self
 
-        # Not enough data
-        if len(X) < max(self.min_samples_leaf * 2, 3):
-            self.bins_ = []
-            return self
+    def fit_many(self, df, features, target, n_jobs=1):
+        """
+        Fits this configuration on many features at once.
 
-        tree = DecisionTreeClassifier(
-            max_depth=self.max_depth,
-            min_samples_leaf=self.min_samples_leaf,
-        )
+        The target is encoded once and, with n_jobs != 1, the features are
+        shared with worker processes through a memory-mapped array.
 
-        tree.fit(X, y)
-        self.model_ = tree
+        Returns
+        -------
+        Dict[str, List[float]]
+            Cut points per feature.
+        """
+        self._check_params()
+        return fit_many(self, df, features, target=target, n_jobs=n_jobs)
 
-        thresholds = tree.tree_.threshold
-        thresholds = thresholds[thresholds != -2]  # remove leaf markers
+    def fit_arrays(self, x, y):
+        """
+        Cut points of fit() computed on float arrays (NaN = missing).
+
+        Does not change bins_: used by fit_many and IvScreener to bin
+        many columns with one configuration. Rows with a missing feature
+        or target are ignored; y holds 0 / 1 event flags.
+
+        Returns
+        -------
+        List[float]
+            Cut points (empty if no split is found).
+        """
+        observed = x[~np.isnan(x)]
+        if len(observed) == 0:
+            return []
+
+        valid = ~np.isnan(x) & ~np.isnan(y)
+        X = x[valid].reshape(-1, 1)
+        return self._find_bins(X, y[valid].astype(int), observed.min(), observed.max())
+
+    def _check_params(self):
+        if self.engine not in ("exact", "hist", "sklearn"):
+            raise ValueError("engine must be 'exact', 'hist' or 'sklearn'")
+
+        if self.criterion not in ("gini", "entropy"):
+            raise ValueError("criterion must be 'gini' or 'entropy'")
+
+    def _find_bins(self, X, y, min_val, max_val):
+        # Not enough data
+        if len(X) < max(self.min_samples_leaf * 2, 3):
+            return []
+
+        if self.engine == "sklearn":
+            thresholds = self._fit_sklearn(X, y)
+        elif self.engine == "hist":
+            thresholds = self._fit_hist(X[:, 0], y)
+        else:
+            thresholds = self._fit_exact(X[:, 0], y)
 
         # No splits found
         if len(thresholds) == 0:
-            self.bins_ = []
-            return self
+            return []
 
         # Keep only valid internal cut points
         valid_thresholds = [
@@ -58,8 +238,88 @@ class TreeBinner:
         ]
 
         # Sorted + unique
-        valid_thresholds = sorted(set(valid_thresholds))
+        return sorted(set(valid_thresholds))
+
+    # ------------------------------------------------------------------
+    # Engines
+    # ------------------------------------------------------------------
+    def _fit_sklearn(self, X, y):
+        from sklearn.tree import DecisionTreeClassifier
+
+        tree = DecisionTreeClassifier(
+            max_depth=self.max_depth,
+            min_samples_leaf=self.min_samples_leaf,
+            criterion=self.criterion,
+        )
+
+        tree.fit(X, y)
+        self.model_ = tree
+
+        thresholds = tree.tree_.threshold
+        return thresholds[thresholds != -2]  # remove leaf markers
+
+    def _fit_exact(self, x, y):
+        # sklearn trains on float32, so do we to reproduce its thresholds
+        values, inverse = np.unique(x.astype(np.float32), return_inverse=True)
+        classes = np.sort(pd.unique(y))
+        y_codes = np.searchsorted(classes, y)
+
+        # the single sort: per distinct value class counts
+        counts = np.vstack([
+            np.bincount(inverse[y_codes == k], minlength=len(values))
+            for k in range(len(classes))
+        ]).astype(float)
+
+        # values closer than FEATURE_THRESHOLD are not separable
+        valid = values[1:] > values[:-1] + FEATURE_THRESHOLD
+        thresholds = values[:-1].astype(float) / 2.0 + values[1:].astype(float) / 2.0
+
+        return _best_splits(
+            counts,
+            thresholds,
+            valid,
+            self.max_depth,
+            self.min_samples_leaf,
+            self.criterion,
+        )
+
+    def _fit_hist(self, x, y):
+        classes = np.sort(pd.unique(y))
+        edges = self._hist_edges(x)
+
+        # O(n) pass, chunked so temporaries do not grow with the row count
+        counts = np.zeros((len(classes), len(edges) + 1))
+        for start in range(0, len(x), HIST_CHUNK_SIZE):
+            y_chunk = y[start:start + HIST_CHUNK_SIZE]
+            buckets = np.searchsorted(edges, x[start:start + HIST_CHUNK_SIZE], side="left")
+            for k, label in enumerate(classes):
+                counts[k] += np.bincount(buckets[y_chunk == label], minlength=len(edges) + 1)
+
+        # bucket i holds edges[i-1] < x <= edges[i]: every edge is a candidate
+        return _best_splits(
+            counts,
+            edges,
+            np.ones(len(edges), dtype=bool),
+            self.max_depth,
+            self.min_samples_leaf,
+            self.criterion,
+        )
+
+    def _hist_edges(self, x):
+        """Bucket upper edges computed on a bounded random subsample."""
+        if len(x) > self.subsample:
+            rng = np.random.default_rng(self.random_state)
+            x = x[rng.choice(len(x), size=self.subsample, replace=False)]
+
+        x = x.astype(np.float32)
+        values = np.unique(x)
 
-        self.bins_ = valid_thresholds
+        # few distinct values: one bucket per value, same cuts as "exact"
+        if len(values) <= self.max_bins:
+            keep = values[1:] > values[:-1] + FEATURE_THRESHOLD
+            lower = values[:-1][keep].astype(float)
+            upper = values[1:][keep].astype(float)
+            return lower / 2.0 + upper / 2.0
 
-        return self
\ No newline at end of file
+        quantiles = np.linspace(0, 1, self.max_bins + 1)[1:-1]
+        return np.unique(np.quantile(x.astype(float), quantiles, method="lower"))
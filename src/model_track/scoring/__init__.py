@@ -0,0 +1,4 @@
+from .artifact import ScoringArtifact
+from .scorer import RecordScorer, benchmark_latency
+
+__all__ = ["ScoringArtifact", "RecordScorer", "benchmark_latency"]
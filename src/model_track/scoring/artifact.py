@@ -0,0 +1,241 @@
+import json
+import os
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from model_track.binning import BinApplier
+
+
+class ScoringArtifact:
+    """
+    Compiled scoring artifact: raw numeric features -> WOE values.
+
+    Fitted bins, category groupings (CategoryMapper) and WOE mappings
+    (WoeCalculator.compute_mapping) are compiled into flat arrays:
+
+    - edges:      cut points of every feature, concatenated
+    - code_group: bin code -> group index, per feature
+    - group_woe:  group index -> WOE, per feature
+
+    transform() only uses np.searchsorted and array indexing, so there
+    is no string handling at scoring time. Bin codes follow BinApplier:
+    code len(bins) + 1 is reserved for missing values ("N/A"). A feature
+    without cut points (a binner that found no split) is a single bin
+    (binning.SINGLE_BIN_LABEL, "(-inf, inf)") plus the missing code.
+
+    The artifact is saved as a folder of .npy files plus a small JSON
+    manifest and can be loaded memory-mapped.
+    """
+
+    _ARRAYS = (
+        "edges",
+        "edge_offsets",
+        "code_group",
+        "code_offsets",
+        "group_woe",
+        "group_offsets",
+    )
+
+    def __init__(
+        self,
+        features: List[str],
+        arrays: Dict[str, np.ndarray],
+        group_labels: Optional[Dict[str, List[str]]] = None,
+        default_woe: float = 0.0,
+    ):
+        missing = [name for name in self._ARRAYS if name not in arrays]
+        if missing:
+            raise ValueError(f"Missing artifact arrays: {missing}")
+
+        self.features = list(features)
+        self.arrays = arrays
+        self.group_labels = group_labels or {}
+        self.default_woe = default_woe
+
+        # per-feature views + composed code -> WOE lookup (tiny arrays)
+        self._edges = self._split("edges", "edge_offsets")
+        code_group = self._split("code_group", "code_offsets")
+        group_woe = self._split("group_woe", "group_offsets")
+        self._code_woe = [woe[groups] for woe, groups in zip(group_woe, code_group)]
+
+    @property
+    def edges(self) -> Tuple[np.ndarray, ...]:
+        """Cut points per feature, in ``self.features`` order (read-only views)."""
+        return tuple(self._read_only(edges) for edges in self._edges)
+
+    @property
+    def code_woe(self) -> Tuple[np.ndarray, ...]:
+        """Bin code -> WOE per feature, in ``self.features`` order (read-only views)."""
+        return tuple(self._read_only(code_woe) for code_woe in self._code_woe)
+
+    @staticmethod
+    def _read_only(array: np.ndarray) -> np.ndarray:
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+    @classmethod
+    def compile(
+        cls,
+        bins: Mapping[str, Union[List[float], object]],
+        woe: Mapping[str, Dict],
+        category_maps: Optional[Mapping[str, Dict[str, str]]] = None,
+        default_woe: float = 0.0,
+    ) -> "ScoringArtifact":
+        """
+        Parameters
+        ----------
+        bins : Mapping[str, List[float] or binner]
+            Cut points per feature, or fitted binners exposing ``bins_``.
+        woe : Mapping[str, Dict]
+            WOE mapping per feature (WoeCalculator.compute_mapping), keyed
+            by bin label or, if a category map is given, by group label.
+        category_maps : Mapping[str, Dict[str, str]], optional
+            Bin label -> group label per feature (CategoryMapper.get).
+        default_woe : float
+            WOE for labels absent from the WOE mapping.
+        """
+        category_maps = category_maps or {}
+        features = list(bins)
+
+        missing = [f for f in features if f not in woe]
+        if missing:
+            raise KeyError(f"WOE mapping not found for features: {missing}")
+
+        edges, code_group, group_woe, group_labels = [], [], [], {}
+
+        for feature in features:
+            feature_bins = list(getattr(bins[feature], "bins_", bins[feature]))
+            labels = BinApplier.labels(feature_bins)
+            category_map = category_maps.get(feature, {})
+            woe_map = woe[feature]
+
+            groups: List[str] = []
+            codes_to_group = []
+            for label in labels:
+                group = category_map.get(label, label)
+                if group not in groups:
+                    groups.append(group)
+                codes_to_group.append(groups.index(group))
+
+            edges.append(np.asarray(feature_bins, dtype=float))
+            code_group.append(np.asarray(codes_to_group, dtype=np.int32))
+            group_woe.append(
+                np.asarray([woe_map.get(g, default_woe) for g in groups], dtype=float)
+            )
+            group_labels[feature] = groups
+
+        arrays = {}
+        for name, offsets_name, parts in (
+            ("edges", "edge_offsets", edges),
+            ("code_group", "code_offsets", code_group),
+            ("group_woe", "group_offsets", group_woe),
+        ):
+            arrays[name] = np.concatenate(parts) if parts else np.empty(0)
+            arrays[offsets_name] = np.concatenate(
+                [[0], np.cumsum([len(p) for p in parts])]
+            ).astype(np.int64)
+
+        return cls(features, arrays, group_labels=group_labels, default_woe=default_woe)
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+    def transform(self, data, dtype=np.float64):
+        """
+        Turns raw numeric features into WOE values.
+
+        Parameters
+        ----------
+        data : pd.DataFrame, dict of arrays or 2-D np.ndarray
+            For arrays, columns must follow ``self.features``.
+
+        Returns
+        -------
+        pd.DataFrame if data is a DataFrame, otherwise a 2-D np.ndarray.
+        """
+        columns = self._columns(data)
+        n_rows = len(columns[0]) if columns else 0
+        out = np.empty((n_rows, len(self.features)), dtype=dtype)
+
+        for j, values in enumerate(columns):
+            out[:, j] = self._code_woe[j][self._codes(j, values)]
+
+        if isinstance(data, pd.DataFrame):
+            return pd.DataFrame(out, columns=self.features, index=data.index)
+        return out
+
+    def _codes(self, j, values):
+        values = np.asarray(values, dtype=float)
+        edges = self._edges[j]
+        codes = np.searchsorted(edges, values, side="left")
+        codes[np.isnan(values)] = len(edges) + 1
+        return codes
+
+    def _columns(self, data):
+        if isinstance(data, np.ndarray):
+            if data.ndim != 2 or data.shape[1] != len(self.features):
+                raise ValueError(
+                    f"Array input must have shape (n, {len(self.features)})"
+                )
+            return [data[:, j] for j in range(data.shape[1])]
+
+        missing = [f for f in self.features if f not in data]
+        if missing:
+            raise KeyError(f"Features not found in input: {missing}")
+
+        if isinstance(data, pd.DataFrame):
+            return [data[f].to_numpy(dtype=float, na_value=np.nan) for f in self.features]
+        return [data[f] for f in self.features]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: str):
+        """Writes the artifact to a folder (manifest.json + one .npy per array)."""
+        os.makedirs(path, exist_ok=True)
+
+        for name in self._ARRAYS:
+            np.save(os.path.join(path, f"{name}.npy"), np.asarray(self.arrays[name]))
+
+        manifest = {
+            "format": "model_track.scoring_artifact",
+            "version": 1,
+            "features": self.features,
+            "group_labels": self.group_labels,
+            "default_woe": self.default_woe,
+        }
+        with open(os.path.join(path, "manifest.json"), "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "ScoringArtifact":
+        """Loads an artifact saved with save(); arrays are memory-mapped by default."""
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as fh:
+            manifest = json.load(fh)
+
+        mmap_mode = "r" if mmap else None
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in cls._ARRAYS
+        }
+
+        return cls(
+            manifest["features"],
+            arrays,
+            group_labels=manifest["group_labels"],
+            default_woe=manifest["default_woe"],
+        )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _split(self, name, offsets_name):
+        values = self.arrays[name]
+        offsets = self.arrays[offsets_name]
+        return [values[offsets[i]:offsets[i + 1]] for i in range(len(self.features))]
@@ -0,0 +1,3 @@
+from .iv_screener import IvScreener
+
+__all__ = ["IvScreener"]
@@ -1,6 +1,10 @@
-from .woe import WoeStability
+from .woe import WoeStability, benchmark_view
 from .category_mapper import CategoryMapper
+from .cache import WoeCache
+from .metrics import StabilityMetrics
+from .report import StabilityReport
 
 __all__ = [
-    "WoeStability", "CategoryMapper"
+    "WoeStability", "CategoryMapper", "WoeCache", "StabilityMetrics",
+    "StabilityReport", "benchmark_view",
 ]
\ No newline at end of file
@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import pandas as pd
+
+
+class WoeCache:
+    """
+    LRU cache of WOE results shared by WoeStability objects.
+
+    Keys are tuples whose first item is the tuple of fingerprints of the
+    columns used (see WoeStability), followed by the call parameters, so
+    two stability objects built on the same data reuse each other's
+    tables. When the cache is full the least recently used entry is
+    dropped.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached results (default 128).
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, pd.DataFrame]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[pd.DataFrame]:
+        """Cached result (a copy) or None."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        # cópia: quem recebe pode alterar a tabela sem estragar o cache
+        return value.copy()
+
+    def put(self, key: Hashable, value: pd.DataFrame):
+        self._entries[key] = value.copy()
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, fingerprint: str) -> int:
+        """Drops the entries computed from a column fingerprint."""
+        stale = [key for key in self._entries if fingerprint in key[0]]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        """Drops every entry and resets the hit / miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
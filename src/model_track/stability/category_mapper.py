@@ -1,6 +1,15 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 import pandas as pd
 
+from model_track.binning import SINGLE_BIN_LABEL
+from model_track.utils import code_dtype, factorize
+
+
+# a busca monta uma matriz (m+1) x (m+1) de IV por grupo
+_MAX_DP_CATEGORIES = 2000
+
 
 class CategoryMapper:
     """
@@ -11,6 +20,8 @@ class CategoryMapper:
     - numeric ordered categories
     - interval-like categories
     - manual override via set()
+    - automatic IV-maximizing groups via auto_map()
+    - vectorized application to DataFrames via transform()
     """
 
     def __init__(self):
@@ -92,6 +103,185 @@ class CategoryMapper:
         self._mappings[feature_name] = mapping
         return mapping
 
+    def auto_map(
+        self,
+        df: pd.DataFrame,
+        feature_name: str,
+        category_col: str,
+        max_groups: int = 5,
+        min_exposure: float = 0.05,
+        ordered: bool = False,
+    ) -> Dict[str, str]:
+        """
+        Create a mapping automatically, choosing the groups that maximize
+        the IV (see optimal_groups), then labelling them as create_map.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Global WOE table (WoeCalculator.compute_table), with the
+            'n_event' and 'n_non_event' columns.
+        feature_name : str
+            Name of the feature being mapped.
+        category_col : str
+            Column containing category labels.
+        max_groups : int
+            Maximum number of groups.
+        min_exposure : float
+            Minimum share of rows per group.
+        ordered : bool
+            If True, only contiguous categories in their natural order
+            (numeric values or interval labels) are grouped; labels that
+            cannot be ordered (e.g. "N/A") stay alone. Otherwise
+            categories are sorted by event rate before grouping.
+        """
+        for column in (category_col, "n_event", "n_non_event"):
+            if column not in df.columns:
+                raise KeyError(f"Column '{column}' not found in WOE table")
+
+        labels = df[category_col].astype(object)
+        is_total = labels == "__TOTAL__"
+        n_event = df.loc[~is_total, "n_event"].to_numpy(dtype=np.int64)
+        n_non_event = df.loc[~is_total, "n_non_event"].to_numpy(dtype=np.int64)
+        labels = labels[~is_total]
+
+        # posições na lista de categorias do create_map (sem ausentes)
+        has_label = labels.notna().to_numpy()
+        categories = labels[has_label].astype(str).tolist()
+        candidates = np.flatnonzero(has_label)
+
+        if ordered:
+            candidates = candidates[self._natural_order(categories)]
+
+        groups, _ = self.optimal_groups(
+            n_event,
+            n_non_event,
+            max_groups=max_groups,
+            min_exposure=min_exposure,
+            order=candidates if ordered else None,
+            candidates=candidates,
+        )
+
+        # posição na tabela -> posição na lista de categorias
+        table_to_category = np.cumsum(has_label) - 1
+        groups = [
+            [int(table_to_category[i]) for i in group]
+            for group in groups
+            if len(group) > 1
+        ]
+        return self.create_map(df, feature_name, category_col, groups, ordered)
+
+    @staticmethod
+    def optimal_groups(
+        n_event,
+        n_non_event,
+        max_groups: int = 5,
+        min_exposure: float = 0.05,
+        order=None,
+        candidates=None,
+    ) -> Tuple[List[List[int]], float]:
+        """
+        Partition of categories into contiguous groups with maximum IV,
+        by dynamic programming on the count vectors only.
+
+        Parameters
+        ----------
+        n_event, n_non_event : array-like
+            Counts per category.
+        max_groups : int
+            Maximum number of groups.
+        min_exposure : float
+            Minimum share of all rows per group. Every group also needs
+            at least one event and one non-event (finite WOE).
+        order : array-like, optional
+            Positions to group, in the order in which groups must be
+            contiguous (ordered features). Default: the candidates
+            sorted by event rate (nominal features).
+        candidates : array-like, optional
+            Positions taking part in the search when order is None
+            (default: all). Other categories do not belong to any group
+            but still count in the totals (event / non-event rates and
+            min_exposure).
+
+        Returns
+        -------
+        Tuple[List[List[int]], float]
+            Groups (lists of positions, in sequence order) and the IV of
+            those groups, always finite. Categories outside the search
+            (e.g. the N/A bin, whose WOE may be infinite) are not part of
+            it; their contribution is in the WoeCalculator table.
+        """
+        n_event = np.asarray(n_event, dtype=np.float64)
+        n_non_event = np.asarray(n_non_event, dtype=np.float64)
+        if max_groups < 1:
+            raise ValueError("max_groups must be a positive integer")
+
+        total_events = n_event.sum()
+        total_non_events = n_non_event.sum()
+        total = total_events + total_non_events
+        if total_events == 0 or total_non_events == 0:
+            raise ValueError("Counts must contain events and non-events")
+
+        if order is None:
+            candidates = (
+                np.arange(len(n_event)) if candidates is None
+                else np.asarray(candidates, dtype=np.intp)
+            )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rate = n_event[candidates] / (n_event[candidates] + n_non_event[candidates])
+            order = candidates[np.argsort(rate, kind="stable")]
+        order = np.asarray(order, dtype=np.intp)
+
+        m = len(order)
+        if m > _MAX_DP_CATEGORIES:
+            raise ValueError(
+                f"{m} categories is too many for the search; "
+                "fold rare levels first (WoeCalculator.fold_levels)"
+            )
+
+        # IV de cada grupo contíguo (i, j] da sequência: matriz (m+1, m+1)
+        cum_event = np.concatenate([[0.0], np.cumsum(n_event[order])])
+        cum_non_event = np.concatenate([[0.0], np.cumsum(n_non_event[order])])
+        group_event = cum_event[None, :] - cum_event[:, None]
+        group_non_event = cum_non_event[None, :] - cum_non_event[:, None]
+
+        feasible = (
+            (group_event > 0)
+            & (group_non_event > 0)
+            & ((group_event + group_non_event) >= min_exposure * total)
+        )
+        event_rate = group_event / total_events
+        non_event_rate = group_non_event / total_non_events
+        with np.errstate(divide="ignore", invalid="ignore"):
+            iv = (event_rate - non_event_rate) * np.log(event_rate / non_event_rate)
+        iv = np.where(feasible, iv, -np.inf)
+
+        # best[j]: melhor IV cobrindo os j primeiros com k grupos
+        best = np.full(m + 1, -np.inf)
+        best[0] = 0.0
+        splits = []
+        best_iv, best_k = -np.inf, 0
+        for k in range(1, min(max_groups, m) + 1):
+            candidates_iv = best[:, None] + iv
+            split = np.argmax(candidates_iv, axis=0)
+            best = candidates_iv[split, np.arange(m + 1)]
+            splits.append(split)
+            # mais grupos só se o IV aumentar
+            if best[m] > best_iv + 1e-12:
+                best_iv, best_k = best[m], k
+
+        if not np.isfinite(best_iv):
+            raise ValueError(
+                "No grouping satisfies the constraints; lower min_exposure"
+            )
+
+        bounds = [m]
+        for k in range(best_k, 0, -1):
+            bounds.append(int(splits[k - 1][bounds[-1]]))
+        bounds = bounds[::-1]
+        groups = [order[a:b].tolist() for a, b in zip(bounds[:-1], bounds[1:])]
+        return groups, float(best_iv)
+
     def get(self, feature_name: Optional[str] = None):
         """
         Retrieve mappings.
@@ -109,6 +299,118 @@ class CategoryMapper:
         """
         self._mappings[feature_name] = mapping
 
+    # ------------------------------------------------------------------
+    # Transform
+    # ------------------------------------------------------------------
+    def transform(
+        self,
+        df: pd.DataFrame,
+        features: Optional[List[str]] = None,
+        unmapped: str = "nan",
+    ) -> pd.DataFrame:
+        """
+        Applies the stored mappings to the DataFrame columns.
+
+        Each column is encoded once into integer codes (categorical codes
+        are reused) and only its distinct values are converted to str and
+        looked up in the mapping; the rows are then recoded with a single
+        integer lookup array. For non-missing values this is the same as
+        ``df[col].astype(str).map(mapping)``, as categoricals. Missing
+        values (None / NaN / NaT) always stay missing: unlike the string
+        map, they are never looked up as the keys "None" or "nan", even
+        if the mapping has them.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Data with the feature columns.
+        features : List[str], optional
+            Features to transform (default: every stored mapping).
+        unmapped : str
+            Values absent from the mapping: "nan" (default, missing),
+            "keep" (own label), "error" (raise ValueError) or any other
+            string, used as the label. Missing values stay missing.
+
+        Returns
+        -------
+        pd.DataFrame
+            One categorical column per feature, same index as df.
+            Categories are the grouped labels in mapping order.
+        """
+        features = list(self._mappings) if features is None else list(features)
+
+        unknown = [f for f in features if f not in self._mappings]
+        if unknown:
+            raise KeyError(f"No mapping for features: {unknown}")
+
+        missing = [f for f in features if f not in df.columns]
+        if missing:
+            raise KeyError(f"Columns not found in DataFrame: {missing}")
+
+        return pd.DataFrame(
+            {f: self.transform_column(df[f], unmapped=unmapped) for f in features},
+            index=df.index,
+        )
+
+    def transform_column(
+        self,
+        series: pd.Series,
+        feature_name: Optional[str] = None,
+        unmapped: str = "nan",
+    ) -> pd.Categorical:
+        """Grouped labels of one column (feature_name defaults to series.name)."""
+        feature_name = series.name if feature_name is None else feature_name
+        if feature_name not in self._mappings:
+            raise KeyError(f"No mapping for feature '{feature_name}'")
+
+        mapping = self._mappings[feature_name]
+        codes, uniques = factorize(series)
+
+        # rótulos agrupados, na ordem do mapeamento
+        map_keys = pd.Index(list(mapping), dtype=object)
+        map_labels = np.asarray(list(mapping.values()), dtype=object)
+        labels = pd.Index(pd.unique(map_labels), dtype=object)
+        # posição -1 (chave não mapeada) cai no slot extra -1
+        label_of_key = np.append(labels.get_indexer(map_labels), -1)
+
+        # só os valores distintos viram str
+        keys = pd.Index(uniques).astype(str)
+        position = label_of_key[map_keys.get_indexer(keys)]
+
+        position, labels = self._resolve_unmapped(
+            feature_name, keys, position, labels, codes, unmapped
+        )
+
+        # slot extra: valores ausentes
+        lookup = np.append(position, -1).astype(code_dtype(len(labels)))
+        return pd.Categorical.from_codes(lookup[codes], categories=labels)
+
+    def _resolve_unmapped(self, feature_name, keys, position, labels, codes, unmapped):
+        """Applies the unmapped policy to the observed values without a label."""
+        is_unmapped = position < 0
+        if is_unmapped.any():
+            # só valores presentes nos dados
+            present = np.bincount(codes, minlength=len(keys) + 1)[:len(keys)] > 0
+            is_unmapped &= present
+
+        if not is_unmapped.any() or unmapped == "nan":
+            return position, labels
+
+        if unmapped == "error":
+            examples = list(keys[is_unmapped][:5])
+            raise ValueError(
+                f"Unmapped categories in feature '{feature_name}': {examples}"
+            )
+
+        extra = keys[is_unmapped] if unmapped == "keep" else pd.Index([unmapped])
+        labels = labels.append(extra.difference(labels, sort=False))
+        position = position.copy()
+        if unmapped == "keep":
+            position[is_unmapped] = labels.get_indexer(keys[is_unmapped])
+        else:
+            position[is_unmapped] = labels.get_loc(unmapped)
+        return position, labels
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -154,6 +456,8 @@ class CategoryMapper:
         uppers = []
         has_minus_inf = False
         has_plus_inf = False
+        # "> x" (rótulo do BinApplier): limite inferior aberto
+        open_lower = False
 
         for c in categories:
             c = c.strip()
@@ -166,6 +470,11 @@ class CategoryMapper:
                 has_plus_inf = True
                 lowers.append(float(c.replace(">=", "").strip()))
 
+            elif c.startswith(">"):
+                has_plus_inf = True
+                open_lower = True
+                lowers.append(float(c.replace(">", "").strip()))
+
             else:
                 # interval like (a,b]
                 left, right = c[1:-1].split(",")
@@ -181,7 +490,14 @@ class CategoryMapper:
 
         # [x, +inf)
         if has_plus_inf and not has_minus_inf:
+            if open_lower:
+                return f">{self._fmt(min_lower)}"
             return f">={self._fmt(min_lower)}"
+
+        # domínio inteiro: mesmo rótulo do BinApplier para bins=[]
+        if has_plus_inf and has_minus_inf:
+            return SINGLE_BIN_LABEL
+
         # fully bounded interval
         return f"({self._fmt(min_lower)},{self._fmt(max_upper)}]"
 
@@ -194,6 +510,9 @@ class CategoryMapper:
         if label.startswith(">="):
             return (float(label.replace(">=", "").strip()), float("inf"))
 
+        if label.startswith(">"):
+            return (float(label.replace(">", "").strip()), float("inf"))
+
         # (a,b]
         left, right = label[1:-1].split(",")
         return (float(left.strip()), float(right.strip()))
@@ -208,6 +527,25 @@ class CategoryMapper:
                 return False
         return True
 
+    def _natural_order(self, categories: List[str]) -> np.ndarray:
+        """
+        Positions of the orderable categories (numeric values or interval
+        labels) in their natural order; the others are left out.
+        """
+        keys = []
+        for i, c in enumerate(categories):
+            try:
+                key = (float(c), float(c))
+            except ValueError:
+                if not self._is_interval_like([c]):
+                    continue
+                try:
+                    key = self._parse_interval(c)
+                except ValueError:
+                    continue
+            keys.append((key, i))
+        return np.array([i for _, i in sorted(keys)], dtype=np.intp)
+
     def _fmt(self, x: float) -> str:
         if x.is_integer():
             return str(int(x))
@@ -0,0 +1,369 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from model_track.utils import factorize, take_categories
+from model_track.woe import WoeCalculator
+
+
+class StabilityMetrics:
+    """
+    PSI / CSI and per-bin drift for many features and periods at once.
+
+    fit() builds a single count cube period × (feature, bin): every
+    feature is encoded once (categorical codes or small integer ranges
+    are reused as is) and counted with one np.bincount, optionally split
+    by event / non-event. All metrics are array operations on that cube,
+    with per-feature sums done by np.add.reduceat over the bin axis.
+
+    Each period is compared with a reference distribution:
+
+    - "first":    the first period (default)
+    - "previous": the previous period (the first period gets NaN)
+    - any other value: that period
+
+    PSI of a feature is sum((a - e) * ln(a / e)) over its bins, with
+    shares a (period) and e (reference) floored at epsilon. The per-bin
+    terms are the CSI contributions reported by drift().
+
+    Parameters
+    ----------
+    epsilon : float
+        Floor of the bin shares in the PSI (default 1e-4).
+    max_bins : int
+        Maximum number of distinct values per feature. Continuous
+        features must be binned first (BinApplier).
+    """
+
+    def __init__(self, epsilon: float = 1e-4, max_bins: int = 1000):
+        if epsilon <= 0:
+            raise ValueError("epsilon must be positive")
+
+        self.epsilon = epsilon
+        self.max_bins = max_bins
+
+    # ------------------------------------------------------------------
+    # Cubo de contagens
+    # ------------------------------------------------------------------
+    def fit(
+        self,
+        df: pd.DataFrame,
+        date_col: str,
+        feature_cols: Optional[List[str]] = None,
+        target_col: Optional[str] = None,
+        event_value: int = 1,
+    ) -> "StabilityMetrics":
+        """
+        Counts rows (and events, if target_col is given) per
+        (period, feature, bin).
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Binned or categorical data.
+        date_col : str
+            Period column. Rows with null period are ignored.
+        feature_cols : List[str], optional
+            Features to track (default: every column except date_col
+            and target_col).
+        target_col : str, optional
+            Binary target; enables event-rate and WOE drift.
+        event_value : int, optional
+            Value of the event in the target column (default=1).
+
+        Raises
+        ------
+        KeyError
+            If a column is not found.
+        ValueError
+            If date_col has only null values, the target is not binary
+            or a feature has more than max_bins distinct values.
+        """
+        if date_col not in df.columns:
+            raise KeyError(f"Column '{date_col}' not found in DataFrame")
+
+        if df[date_col].isna().all():
+            raise ValueError(f"Column '{date_col}' contains only null values")
+
+        if feature_cols is None:
+            feature_cols = [c for c in df.columns if c not in (date_col, target_col)]
+        feature_cols = list(feature_cols)
+
+        missing = [c for c in feature_cols if c not in df.columns]
+        if missing:
+            raise KeyError(f"Columns not found in DataFrame: {missing}")
+
+        is_event = None
+        if target_col is not None:
+            WoeCalculator.validate_target(df, target_col, event_value)
+            is_event = WoeCalculator.event_mask(df[target_col], event_value)
+
+        period_codes, periods = pd.factorize(df[date_col], sort=True)
+        # período nulo -> slot extra, descartado depois
+        period_codes[period_codes < 0] = len(periods)
+        n_periods = len(periods) + 1
+
+        # parte do slot comum a todas as features: (período, evento)
+        n_cells = n_periods
+        base = period_codes.astype(np.intp)
+        if is_event is not None:
+            n_cells *= 2
+            base = base * 2 + is_event
+
+        bins, counts, events = [], [], []
+        for feature in feature_cols:
+            codes, uniques = factorize(df[feature])
+            n_codes = len(uniques) + 1
+            if n_codes > self.max_bins:
+                self._check_bins(feature, codes, n_codes)
+
+            # um bincount por feature: slot (código, período[, evento])
+            slots = codes.astype(np.intp, copy=False) * n_cells + base
+            cube = np.bincount(slots, minlength=n_codes * n_cells)
+            cube = cube.reshape(n_codes, n_periods, -1)[:, :-1]
+
+            observed = np.flatnonzero(cube.any(axis=(1, 2)))
+            bins.append(
+                take_categories(df[feature], uniques, observed)
+            )
+
+            cube = cube[observed].transpose(1, 0, 2)
+            if is_event is None:
+                counts.append(cube[..., 0])
+            else:
+                counts.append(cube.sum(axis=2))
+                events.append(cube[..., 1])
+
+        sizes = np.array([len(b) for b in bins], dtype=np.intp)
+
+        self.date_col = date_col
+        self.periods_ = pd.Index(periods, name=date_col)
+        self.features_ = feature_cols
+        self.bins_ = bins
+        self.offsets_ = np.concatenate([[0], np.cumsum(sizes)])
+        self.counts_ = np.concatenate(counts, axis=1)
+        self.events_ = np.concatenate(events, axis=1) if events else None
+        # feature de cada coluna do cubo
+        self._segment = np.repeat(np.arange(len(feature_cols)), sizes)
+        return self
+
+    # ------------------------------------------------------------------
+    # Métricas
+    # ------------------------------------------------------------------
+    def psi(self, reference="first") -> pd.DataFrame:
+        """
+        PSI (CSI, for a single characteristic) per period and feature.
+
+        Returns
+        -------
+        pd.DataFrame
+            Matrix period × feature.
+        """
+        contribution = self._bin_metrics(reference)["csi"]
+        return pd.DataFrame(
+            self._per_feature(contribution),
+            index=self.periods_,
+            columns=pd.Index(self.features_, name="feature"),
+        ).round(4)
+
+    def drift(self, reference="first") -> pd.DataFrame:
+        """
+        Per-bin comparison of every period with the reference.
+
+        Returns
+        -------
+        pd.DataFrame
+            Long format with columns [date_col, 'feature', 'bin', 'n',
+            'share', 'ref_share', 'csi'] and, when fitted with a target,
+            ['bin_event_rate', 'ref_bin_event_rate', 'event_rate_drift',
+            'woe', 'ref_woe', 'woe_drift']. bin_event_rate is the share
+            of events inside the bin; WOE follows WoeCalculator. Only bins
+            present in the period or in its reference get a row.
+        """
+        metrics = self._bin_metrics(reference)
+
+        present = (self.counts_ > 0) | (metrics["ref_n"] > 0)
+        period_idx, column_idx = np.nonzero(present)
+        labels = np.concatenate([b.astype(object).to_numpy() for b in self.bins_])
+
+        result = pd.DataFrame(
+            {
+                self.date_col: self.periods_.take(period_idx),
+                "feature": np.asarray(self.features_, dtype=object)[
+                    self._segment[column_idx]
+                ],
+                "bin": labels[column_idx],
+                "n": self.counts_[period_idx, column_idx],
+            }
+        )
+        columns = ["share", "ref_share", "csi"]
+        if self.events_ is not None:
+            columns += [
+                "bin_event_rate", "ref_bin_event_rate", "event_rate_drift",
+                "woe", "ref_woe", "woe_drift",
+            ]
+        for column in columns:
+            result[column] = metrics[column][period_idx, column_idx]
+
+        return result.round(4)
+
+    def summary(self, reference="first") -> pd.DataFrame:
+        """
+        One row per (period, feature): 'psi' and, with a target, the
+        largest absolute per-bin 'max_event_rate_drift' and
+        'max_woe_drift' (infinite WOE values are ignored).
+        """
+        metrics = self._bin_metrics(reference)
+        data = {"psi": self._per_feature(metrics["csi"])}
+
+        if self.events_ is not None:
+            for name, column in (
+                ("max_event_rate_drift", "event_rate_drift"),
+                ("max_woe_drift", "woe_drift"),
+            ):
+                values = np.abs(metrics[column])
+                values = np.where(np.isfinite(values), values, -np.inf)
+                largest = np.maximum.reduceat(values, self.offsets_[:-1], axis=1)
+                data[name] = np.where(np.isinf(largest), np.nan, largest)
+
+        n_features = len(self.features_)
+        result = pd.DataFrame(
+            {
+                self.date_col: np.repeat(self.periods_.to_numpy(), n_features),
+                "feature": np.tile(np.asarray(self.features_, dtype=object), len(self.periods_)),
+            }
+        )
+        for name, values in data.items():
+            result[name] = values.ravel()
+        return result.round(4)
+
+    def woe_matrices(self, features: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+        """
+        WOE matrix period × bin per feature (as
+        WoeByPeriod.compute_matrix; bins absent in a period are NaN),
+        from the fitted cube. Requires fit() with a target.
+
+        Parameters
+        ----------
+        features : List[str], optional
+            Features to return (default: every fitted feature).
+        """
+        self._check_fitted()
+        if self.events_ is None:
+            raise ValueError("StabilityMetrics was fitted without target_col")
+
+        features = list(self.features_) if features is None else list(features)
+        unknown = [f for f in features if f not in self.features_]
+        if unknown:
+            raise KeyError(f"Features not fitted: {unknown}")
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            woe = self._woe(self.events_, self.counts_ - self.events_)
+
+        matrices = {}
+        for feature in features:
+            j = self.features_.index(feature)
+            start, stop = self.offsets_[j], self.offsets_[j + 1]
+            matrices[feature] = pd.DataFrame(
+                woe[:, start:stop],
+                index=self.periods_,
+                columns=pd.Index(self.bins_[j], name=feature),
+            ).round(4)
+        return matrices
+
+    def woe_matrix(self, feature: str) -> pd.DataFrame:
+        """WOE matrix period × bin of one feature (see woe_matrices)."""
+        return self.woe_matrices([feature])[feature]
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _check_bins(self, feature, codes, n_codes):
+        """Raises before building a cube for a feature with too many values."""
+        n_observed = np.count_nonzero(np.bincount(codes, minlength=n_codes))
+        if n_observed > self.max_bins:
+            raise ValueError(
+                f"Feature '{feature}' has {n_observed} distinct values "
+                f"(max_bins={self.max_bins}); bin it first"
+            )
+
+    def _check_fitted(self):
+        if not hasattr(self, "counts_"):
+            raise ValueError("StabilityMetrics is not fitted; call fit() first")
+
+    def _reference(self, values: np.ndarray, reference) -> np.ndarray:
+        """Reference row of every period (float; NaN where undefined)."""
+        values = values.astype(float)
+        if reference == "first":
+            return np.broadcast_to(values[:1], values.shape)
+        if reference == "previous":
+            shifted = np.full_like(values, np.nan)
+            shifted[1:] = values[:-1]
+            return shifted
+
+        position = self.periods_.get_indexer([reference])[0]
+        if position < 0:
+            raise KeyError(f"Reference period {reference!r} not found")
+        return np.broadcast_to(values[position:position + 1], values.shape)
+
+    def _per_feature(self, values: np.ndarray) -> np.ndarray:
+        """Sum over the bins of each feature (periods without reference stay NaN)."""
+        totals = np.add.reduceat(np.nan_to_num(values), self.offsets_[:-1], axis=1)
+        undefined = np.isnan(values).all(axis=1, keepdims=True)
+        return np.where(undefined, np.nan, totals)
+
+    def _bin_metrics(self, reference):
+        self._check_fitted()
+        offsets = self.offsets_[:-1]
+
+        counts = self.counts_
+        ref_n = self._reference(counts, reference)
+
+        total = np.add.reduceat(counts, offsets, axis=1)[:, self._segment]
+        ref_total = np.add.reduceat(ref_n, offsets, axis=1)[:, self._segment]
+
+        share = counts / total
+        ref_share = ref_n / ref_total
+
+        actual = np.maximum(share, self.epsilon)
+        expected = np.maximum(ref_share, self.epsilon)
+        metrics = {
+            "ref_n": ref_n,
+            "share": share,
+            "ref_share": ref_share,
+            "csi": (actual - expected) * np.log(actual / expected),
+        }
+
+        if self.events_ is not None:
+            events = self.events_
+            non_events = counts - events
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rate = events / counts
+                woe = self._woe(events, non_events)
+
+            ref_rate = self._reference(rate, reference)
+            ref_woe = self._reference(woe, reference)
+            with np.errstate(invalid="ignore"):
+                metrics.update(
+                    {
+                        "bin_event_rate": rate,
+                        "ref_bin_event_rate": ref_rate,
+                        "event_rate_drift": rate - ref_rate,
+                        "woe": woe,
+                        "ref_woe": ref_woe,
+                        "woe_drift": woe - ref_woe,
+                    }
+                )
+        return metrics
+
+    def _woe(self, events, non_events, epsilon: float = 1e-8) -> np.ndarray:
+        """WOE per bin, same formula as WoeCalculator (NaN for empty bins)."""
+        offsets = self.offsets_[:-1]
+        total_events = np.add.reduceat(events, offsets, axis=1)[:, self._segment]
+        total_non_events = np.add.reduceat(non_events, offsets, axis=1)[:, self._segment]
+
+        event_rate = events / np.maximum(total_events, epsilon)
+        non_event_rate = non_events / np.maximum(total_non_events, epsilon)
+        woe = np.log(event_rate / non_event_rate)
+        return np.where(events + non_events > 0, woe, np.nan)
@@ -0,0 +1,237 @@
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from model_track.utils import resolve_n_jobs
+
+from .metrics import StabilityMetrics
+
+
+FORMATS = ("png", "pdf", "html")
+
+
+class StabilityReport:
+    """
+    WOE stability pages for many features (small multiples).
+
+    The period WOE of every feature comes from one shared StabilityMetrics
+    count cube (the period column and the target are encoded once), not
+    from a WoeByPeriod call per feature. Pages are drawn on Agg figures
+    created without pyplot, so nothing is kept in a global figure
+    registry: each page figure is saved and released before the next.
+    With n_jobs > 1 the pages are rendered in a process pool; workers
+    receive only the small period × bin WOE matrices.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Binned or categorical data.
+    date_col : str
+        Period column.
+    target_col : str
+        Binary target column.
+    feature_cols : List[str], optional
+        Features of the report (default: every other column).
+    event_value : int, optional
+        Value of the event in the target column (default=1).
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        date_col: str,
+        target_col: str,
+        feature_cols: Optional[List[str]] = None,
+        event_value: int = 1,
+    ):
+        self.df = df
+        self.date_col = date_col
+        self.target_col = target_col
+        self.feature_cols = feature_cols
+        self.event_value = event_value
+        self._tables: Optional[Dict[str, pd.DataFrame]] = None
+
+    # ------------------------------------------------------------------
+    # WOE por período (passada única)
+    # ------------------------------------------------------------------
+    def tables(self) -> Dict[str, pd.DataFrame]:
+        """
+        WOE matrix period × bin of every feature (as
+        WoeByPeriod.compute_matrix; bins absent in a period are NaN).
+        Computed once and reused by build().
+        """
+        if self._tables is None:
+            metrics = StabilityMetrics().fit(
+                self.df,
+                self.date_col,
+                self.feature_cols,
+                target_col=self.target_col,
+                event_value=self.event_value,
+            )
+            self._tables = metrics.woe_matrices()
+        return self._tables
+
+    # ------------------------------------------------------------------
+    # Renderização
+    # ------------------------------------------------------------------
+    def build(
+        self,
+        output_dir: str,
+        formats: Sequence[str] = ("png",),
+        per_page: int = 6,
+        ncols: int = 3,
+        n_jobs: Optional[int] = 1,
+        dpi: int = 100,
+    ) -> List[str]:
+        """
+        Renders the report into output_dir.
+
+        Parameters
+        ----------
+        output_dir : str
+            Destination directory (created if needed).
+        formats : Sequence[str]
+            Any of 'png', 'pdf' (one file per page) and 'html' (an
+            index.html showing the PNG pages; implies 'png').
+        per_page : int
+            Features per page.
+        ncols : int
+            Columns of the page grid.
+        n_jobs : int, optional
+            Worker processes for the rendering (1 = in process,
+            -1 or None = os.cpu_count()).
+        dpi : int
+            Resolution of the PNG pages.
+
+        Returns
+        -------
+        List[str]
+            Paths of the written files.
+        """
+        formats = list(formats)
+        unknown = [f for f in formats if f not in FORMATS]
+        if unknown:
+            raise ValueError(f"formats must be among {FORMATS}; got {unknown}")
+        if per_page < 1 or ncols < 1:
+            raise ValueError("per_page and ncols must be positive integers")
+        n_jobs = resolve_n_jobs(n_jobs)
+
+        # o html mostra as páginas em png
+        image_formats = [f for f in ("png", "pdf") if f in formats]
+        if "html" in formats and "png" not in image_formats:
+            image_formats.insert(0, "png")
+
+        os.makedirs(output_dir, exist_ok=True)
+
+        tables = self.tables()
+        features = list(tables)
+        pages = [features[i:i + per_page] for i in range(0, len(features), per_page)]
+        jobs = [
+            (
+                number + 1,
+                {feature: tables[feature] for feature in page},
+                output_dir,
+                image_formats,
+                ncols,
+                dpi,
+            )
+            for number, page in enumerate(pages)
+        ]
+
+        if n_jobs == 1 or len(jobs) <= 1:
+            written = [_render_page(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                written = list(pool.map(_render_page, jobs))
+
+        paths = [path for page_paths in written for path in page_paths]
+        if "html" in formats:
+            paths.append(_write_index(output_dir, pages))
+        return paths
+
+
+# ----------------------------------------------------------------------
+# Workers (nível de módulo para serem picklable)
+# ----------------------------------------------------------------------
+def _render_page(job) -> List[str]:
+    number, tables, output_dir, formats, ncols, dpi = job
+
+    nrows = -(-len(tables) // ncols)
+    height = 3.5 * nrows
+    fig = Figure(figsize=(5 * ncols, height))
+    FigureCanvasAgg(fig)
+    # margens fixas (em polegadas): tight_layout exigiria um draw extra
+    fig.subplots_adjust(
+        left=0.06, right=0.98, bottom=0.8 / height, top=1 - 0.4 / height,
+        wspace=0.25, hspace=0.6,
+    )
+    axes = fig.subplots(nrows, ncols, squeeze=False).ravel()
+
+    for ax, (feature, matrix) in zip(axes, tables.items()):
+        _draw_feature(ax, feature, matrix)
+    for ax in axes[len(tables):]:
+        ax.set_axis_off()
+
+    paths = []
+    for fmt in formats:
+        path = os.path.join(output_dir, f"page_{number:03d}.{fmt}")
+        fig.savefig(path, dpi=dpi)
+        paths.append(path)
+
+    # libera a figura antes da próxima página
+    fig.clear()
+    del fig
+    return paths
+
+
+def _draw_feature(ax, feature, matrix: pd.DataFrame, max_ticks: int = 8):
+    """One axis: one line per bin, drawn with a single plot call."""
+    # eixo x por posição com rótulos fixos (evita o AutoDateLocator)
+    x = np.arange(len(matrix))
+    ax.plot(x, matrix.to_numpy(), marker="o", markersize=3)
+    ax.axhline(0, color="black", linestyle="--", linewidth=1)
+    ax.set_title(str(feature))
+    ax.set_ylabel("WOE")
+    ax.legend(
+        [str(c) for c in matrix.columns], fontsize="x-small", loc="upper left"
+    )
+
+    ax.spines["right"].set_visible(False)
+    ax.spines["top"].set_visible(False)
+    ax.yaxis.grid(True, linestyle="-", linewidth=0.2)
+    ax.xaxis.grid(True, linestyle="-", linewidth=0.2)
+
+    if pd.api.types.is_datetime64_any_dtype(matrix.index):
+        labels = matrix.index.strftime("%Y-%m")
+    else:
+        labels = matrix.index.astype(str)
+    step = max(1, -(-len(x) // max_ticks))
+    ax.set_xticks(x[::step])
+    ax.set_xticklabels(labels[::step], rotation=45, ha="right", fontsize="small")
+
+
+def _write_index(output_dir, pages) -> str:
+    sections = []
+    for number, page in enumerate(pages, start=1):
+        names = ", ".join(html.escape(str(feature)) for feature in page)
+        sections.append(
+            f"<h2>Page {number}</h2>\n<p>{names}</p>\n"
+            f'<img src="page_{number:03d}.png" alt="page {number}">'
+        )
+
+    path = os.path.join(output_dir, "index.html")
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(
+            "<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\">"
+            "<title>WOE stability report</title></head>\n<body>\n"
+            "<h1>WOE stability report</h1>\n"
+            + "\n".join(sections)
+            + "\n</body>\n</html>\n"
+        )
+    return path
@@ -1,9 +1,19 @@
+import hashlib
+import time
+from typing import Dict, Optional, Union
+
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 
 from model_track.woe import WoeCalculator
 from model_track.woe import WoeByPeriod
+from model_track.woe import WoeBootstrap
+
+from .cache import WoeCache
 
 
 class WoeStability:
@@ -14,7 +24,28 @@ class WoeStability:
     - Compute global WOE table
     - Plot WOE evolution by period
 
-    This class does NOT evaluate stability.
+    This class does NOT evaluate stability (see StabilityMetrics).
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data with the period, feature and target columns.
+    date_col : str
+        Period column.
+    event_value : int, optional
+        Value of the event in the target column (default=1).
+    copy : bool, optional
+        If True, keeps a private copy of df; if False, a reference (the
+        class never writes to the frame). Default: copy only when a
+        cache is given, so cached results cannot go stale when the
+        caller edits its frame.
+    cache : WoeCache, optional
+        If given, global tables, period tables and seeded bootstrap
+        bands are memoized there, keyed on a fingerprint of the columns
+        used plus the call parameters. The same WoeCache can be shared
+        by several stability objects. Fingerprints are memoized only on
+        a private copy; with copy=False the columns are hashed again on
+        every cached call.
     """
 
     def __init__(
@@ -22,16 +53,24 @@ class WoeStability:
         df: pd.DataFrame,
         date_col: str,
         event_value: int = 1,
+        copy: Optional[bool] = None,
+        cache: Optional[WoeCache] = None,
     ):
-        self.df = df.copy()
-        self.date_col = date_col
-        self.event_value = event_value
-
         if date_col not in df.columns:
             raise KeyError(
                 f"Period column '{date_col}' not found in DataFrame."
             )
 
+        if copy is None:
+            copy = cache is not None
+
+        self.df = df.copy() if copy else df
+        self._owns_df = copy
+        self.date_col = date_col
+        self.event_value = event_value
+        self.cache = cache
+        self._fingerprints: Dict[str, str] = {}
+
     # ------------------------------------------------------------------
     # Global WOE
     # ------------------------------------------------------------------
@@ -44,12 +83,77 @@ class WoeStability:
         Computes and returns the global WOE table
         (no temporal split).
         """
-        return WoeCalculator.compute_table(
-            df=self.df,
-            feature_col=feature_col,
-            target_col=target_col,
-            event_value=self.event_value,
+        return self._cached(
+            ("global_table", feature_col, target_col, self.event_value),
+            [feature_col, target_col],
+            lambda: WoeCalculator.compute_table(
+                df=self.df,
+                feature_col=feature_col,
+                target_col=target_col,
+                event_value=self.event_value,
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # WOE by period (matrix)
+    # ------------------------------------------------------------------
+    def woe_matrix(
+        self,
+        feature_col: str,
+        target_col: str,
+        rollup: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        WOE matrix period × category (as WoeByPeriod.compute_matrix).
+
+        Parameters
+        ----------
+        rollup : str, optional
+            Pandas period alias ('W', 'M', ...) used to roll a daily
+            period column up before computing the WOE. Counts are summed
+            per rolled period, so the WOE is exact, not an average.
+        """
+        return self._cached_matrix(
+            feature_col, target_col, rollup,
+            lambda: self._count_cube(feature_col, target_col, rollup),
+        )
+
+    def _cached_matrix(self, feature_col, target_col, rollup, get_cube):
+        return self._cached(
+            ("woe_matrix", feature_col, target_col, self.event_value, self.date_col, rollup),
+            [feature_col, target_col, self.date_col],
+            lambda: self._matrix_from_cube(feature_col, get_cube()),
+        )
+
+    def _count_cube(self, feature_col, target_col, rollup=None):
+        """WoeByPeriod.count_cube, optionally summed into coarser periods."""
+        periods, categories, n_event, n_non_event = WoeByPeriod.count_cube(
+            self.df, target_col, feature_col, self.date_col, self.event_value
         )
+        if rollup is None:
+            return periods, categories, n_event, n_non_event
+
+        if not pd.api.types.is_datetime64_any_dtype(periods):
+            raise ValueError("rollup requires a datetime period column")
+
+        # períodos já estão ordenados: cada período agregado é um bloco contíguo
+        groups, rolled = pd.factorize(periods.to_period(rollup).start_time, sort=True)
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        return (
+            pd.Index(rolled),
+            categories,
+            np.add.reduceat(n_event, starts, axis=0),
+            np.add.reduceat(n_non_event, starts, axis=0),
+        )
+
+    def _matrix_from_cube(self, feature_col, cube):
+        periods, categories, n_event, n_non_event = cube
+        woe = WoeByPeriod.metrics_from_counts(n_event, n_non_event)["woe"]
+        return pd.DataFrame(
+            np.where(n_event + n_non_event > 0, woe, np.nan),
+            index=pd.Index(periods, name=self.date_col),
+            columns=pd.Index(categories, name=feature_col),
+        ).round(4)
 
     # ------------------------------------------------------------------
     # WOE stability view
@@ -59,10 +163,20 @@ class WoeStability:
         feature_col: str,
         target_col: str,
         ax: plt.Axes=None,
+        ci: float = None,
+        n_boot: int = 1000,
+        random_state: int = None,
+        rollup: Optional[str] = None,
+        method: str = "lines",
+        legend: bool = True,
     ):
         """
         Plots WOE evolution over time for a feature.
 
+        The WOE is computed once as a period × category matrix
+        (woe_matrix) and all lines are drawn in a single call. A category
+        absent from a period leaves a gap in its line.
+
         Parameters
         ----------
         feature_col : str
@@ -72,52 +186,294 @@ class WoeStability:
         ax : matplotlib axis, optional
             If provided, plot is drawn on this axis.
             If None, a new figure is created and returned.
+        ci : float, optional
+            If given (e.g. 0.95), draws bootstrap confidence bands around
+            each line (WoeBootstrap on the per-period counts).
+        n_boot : int, optional
+            Number of bootstrap replicates used for the bands.
+        random_state : int, optional
+            Seed of the bootstrap.
+        rollup : str, optional
+            Rolls long daily series up to weekly ('W') or monthly ('M')
+            periods before plotting (see woe_matrix).
+        method : str, optional
+            "lines" (default): one ax.plot call with markers (Line2D per
+            category). "collection": a single LineCollection without
+            markers, faster for many categories × periods.
+        legend : bool, optional
+            Draws the category legend (default). With dozens of
+            categories the legend is a large share of the render time.
 
         Returns
         -------
         matplotlib.figure.Figure or None
         """
+        if method not in ("lines", "collection"):
+            raise ValueError("method must be 'lines' or 'collection'")
 
-        woe_period = WoeByPeriod.compute(
-            df=self.df,
-            feature_col=feature_col,
-            target_col=target_col,
-            date_col=self.date_col,
-            event_value=self.event_value,
-        )
+        # cubo calculado no máximo uma vez para a matriz e as bandas
+        cube = []
+
+        def get_cube():
+            if not cube:
+                cube.append(self._count_cube(feature_col, target_col, rollup))
+            return cube[0]
+
+        matrix = self._cached_matrix(feature_col, target_col, rollup, get_cube)
 
         created_fig = False
         if ax is None:
             fig, ax = plt.subplots(figsize=(10, 5))
             created_fig = True
 
-        for category, df_cat in woe_period.groupby(feature_col):
-            df_cat = df_cat.sort_values(self.date_col)
+        labels = [str(category) for category in matrix.columns]
+        is_date = pd.api.types.is_datetime64_any_dtype(matrix.index)
+        values = matrix.to_numpy()
 
-            ax.plot(
-                df_cat[self.date_col],
-                df_cat["woe"],
-                marker="o",
-                label=str(category),
-            )
+        if method == "lines":
+            x = matrix.index
+            lines = ax.plot(x, values, marker="o")
+            colors = [line.get_color() for line in lines]
+            handles = lines
+        else:
+            x = mdates.date2num(matrix.index) if is_date else self._numeric_x(ax, matrix.index)
+            cycle = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+            colors = [cycle[i % len(cycle)] for i in range(len(labels))]
+            segments = np.stack([np.broadcast_to(x, values.T.shape), values.T], axis=-1)
+            ax.add_collection(LineCollection(segments, colors=colors))
+            if is_date:
+                ax.xaxis_date()
+            ax.autoscale_view()
+            handles = [Line2D([], [], color=color) for color in colors]
+
+        if ci is not None:
+            bootstrap = WoeBootstrap(n_boot=n_boot, ci=ci, random_state=random_state)
+
+            def compute_bands():
+                return bootstrap.from_cube(feature_col, self.date_col, *get_cube())
+
+            if random_state is None:
+                # sem semente o resultado muda a cada chamada: não entra no cache
+                bands = compute_bands()
+            else:
+                bands = self._cached(
+                    (
+                        "bootstrap", feature_col, target_col, self.event_value,
+                        self.date_col, n_boot, ci, random_state, rollup,
+                    ),
+                    [feature_col, target_col, self.date_col],
+                    compute_bands,
+                )
+            # limites infinitos (categoria sem eventos no replicate) viram lacunas
+            bands[["woe_lower", "woe_upper"]] = bands[
+                ["woe_lower", "woe_upper"]
+            ].replace([np.inf, -np.inf], np.nan)
+
+            lower, upper, present = self._band_matrices(bands, matrix, feature_col)
+            for j in present:
+                ax.fill_between(
+                    x, lower[:, j], upper[:, j],
+                    color=colors[j], alpha=0.15, linewidth=0,
+                )
 
         ax.axhline(0, color="black", linestyle="--", linewidth=1)
         ax.set_title(f"WOE Stability Over Time — {feature_col}")
         ax.set_xlabel("Period")
         ax.set_ylabel("WOE")
-        ax.legend(title=feature_col)
             # Ajustando a estética
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
         ax.yaxis.grid(True, linestyle='-', linewidth=0.2)
         ax.xaxis.grid(True, linestyle='-', linewidth=0.2)
-        
-        ax.legend(title=feature_col, bbox_to_anchor=(1.05, 1), loc='upper left')
+
+        if legend:
+            ax.legend(handles, labels, title=feature_col, bbox_to_anchor=(1.05, 1), loc='upper left')
         plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
-        # se em x for datetime exibir apenas yyyy-mm
-        if pd.api.types.is_datetime64_any_dtype(woe_period[self.date_col]):
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        
+        # se em x for datetime exibir apenas yyyy-mm (yyyy-mm-dd se houver
+        # mais de um período no mesmo mês)
+        if is_date:
+            monthly = matrix.index.to_period("M").is_unique
+            ax.xaxis.set_major_formatter(
+                mdates.DateFormatter('%Y-%m' if monthly else '%Y-%m-%d')
+            )
+
         if created_fig:
             return fig
         return None
+
+    @staticmethod
+    def _numeric_x(ax, index):
+        """x positions for LineCollection when periods are not dates."""
+        if pd.api.types.is_numeric_dtype(index):
+            return index.to_numpy(dtype=float)
+        x = np.arange(len(index), dtype=float)
+        ax.set_xticks(x)
+        ax.set_xticklabels([str(p) for p in index])
+        return x
+
+    @staticmethod
+    def _band_matrices(bands, matrix, feature_col):
+        """
+        Long bootstrap output -> lower / upper matrices aligned with
+        matrix, plus the positions of the categories with bands.
+        """
+        rows = matrix.index.get_indexer(bands[matrix.index.name])
+        cols = matrix.columns.get_indexer(bands[feature_col])
+        lower = np.full(matrix.shape, np.nan)
+        upper = np.full(matrix.shape, np.nan)
+        lower[rows, cols] = bands["woe_lower"].to_numpy()
+        upper[rows, cols] = bands["woe_upper"].to_numpy()
+        return lower, upper, np.unique(cols[cols >= 0])
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+    def fingerprint(self, column: str) -> str:
+        """
+        Content hash of a column (pd.util.hash_pandas_object, index
+        ignored). Memoized when the object holds a private copy of the
+        data; otherwise recomputed on every call, since the caller may
+        edit the frame in place.
+        """
+        if self._owns_df and column in self._fingerprints:
+            return self._fingerprints[column]
+
+        series = self.df[column]
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{column}|{series.dtype}|{len(series)}".encode())
+        digest.update(
+            pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes()
+        )
+        self._fingerprints[column] = digest.hexdigest()
+        return self._fingerprints[column]
+
+    def clear_cache(self):
+        """
+        Forgets the column fingerprints and drops the cache entries
+        computed from them (needed after changing self.df in place).
+        """
+        if self.cache is not None:
+            for fingerprint in self._fingerprints.values():
+                self.cache.invalidate(fingerprint)
+        self._fingerprints.clear()
+
+    def _cached(self, params, columns, compute):
+        if self.cache is None:
+            return compute()
+
+        key = (tuple(self.fingerprint(c) for c in columns),) + params
+        result = self.cache.get(key)
+        if result is None:
+            result = compute()
+            self.cache.put(key, result)
+        return result
+
+
+def benchmark_view(
+    stability: WoeStability,
+    feature_col: str,
+    target_col: str,
+    n_repeat: int = 3,
+    **view_kwargs,
+) -> Dict[str, Union[int, float]]:
+    """
+    Measures WoeStability.generate_view (best of n_repeat, in seconds)
+    against the previous per-category rendering.
+
+    Returns
+    -------
+    Dict[str, Union[int, float]]
+        n_periods, n_categories (int); compute_s (WOE matrix, uncached);
+        baseline_s, the previous view (WoeByPeriod.compute in long format,
+        then one groupby group and one ax.plot per category, no bands);
+        per method, the full view time ('lines_s', 'collection_s'); and
+        speedup = baseline_s / fastest method. Every view time includes
+        the canvas draw. The cache of the stability object is bypassed
+        while measuring, so every run recomputes the WOE.
+
+    Raises
+    ------
+    ValueError
+        If n_repeat < 1 or view_kwargs contains 'method' or 'ax' (the
+        benchmark sets the method and owns the figure).
+    """
+    if n_repeat < 1:
+        raise ValueError("n_repeat must be a positive integer")
+
+    reserved = sorted({"method", "ax"} & set(view_kwargs))
+    if reserved:
+        raise ValueError(f"benchmark_view sets {reserved} itself; do not pass them")
+
+    rollup = view_kwargs.get("rollup")
+    legend = view_kwargs.get("legend", True)
+    timings = {
+        "compute_s": np.inf,
+        "baseline_s": np.inf,
+        "lines_s": np.inf,
+        "collection_s": np.inf,
+    }
+
+    # sem cache: cada repetição mede o cálculo, não um acerto do cache
+    cache, stability.cache = stability.cache, None
+    try:
+        for _ in range(n_repeat):
+            start = time.perf_counter()
+            cube = stability._count_cube(feature_col, target_col, rollup)
+            matrix = stability._matrix_from_cube(feature_col, cube)
+            timings["compute_s"] = min(timings["compute_s"], time.perf_counter() - start)
+
+            start = time.perf_counter()
+            fig = _baseline_view(stability, feature_col, target_col, rollup, legend)
+            fig.canvas.draw()
+            elapsed = time.perf_counter() - start
+            plt.close(fig)
+            timings["baseline_s"] = min(timings["baseline_s"], elapsed)
+
+            for method in ("lines", "collection"):
+                start = time.perf_counter()
+                fig = stability.generate_view(
+                    feature_col, target_col, method=method, **view_kwargs
+                )
+                fig.canvas.draw()
+                elapsed = time.perf_counter() - start
+                plt.close(fig)
+                timings[f"{method}_s"] = min(timings[f"{method}_s"], elapsed)
+    finally:
+        stability.cache = cache
+
+    fastest = min(timings["lines_s"], timings["collection_s"])
+    return {
+        "n_periods": int(matrix.shape[0]),
+        "n_categories": int(matrix.shape[1]),
+        **timings,
+        "speedup": timings["baseline_s"] / fastest,
+    }
+
+
+def _baseline_view(stability, feature_col, target_col, rollup=None, legend=True):
+    """Previous generate_view: long WOE table + one ax.plot per category."""
+    df, date_col = stability.df, stability.date_col
+    if rollup is not None:
+        df = df.assign(**{date_col: df[date_col].dt.to_period(rollup).dt.start_time})
+
+    woe_period = WoeByPeriod.compute(
+        df=df,
+        feature_col=feature_col,
+        target_col=target_col,
+        date_col=date_col,
+        event_value=stability.event_value,
+    )
+
+    fig, ax = plt.subplots(figsize=(10, 5))
+    for category, df_cat in woe_period.groupby(feature_col):
+        df_cat = df_cat.sort_values(date_col)
+        ax.plot(df_cat[date_col], df_cat["woe"], marker="o", label=str(category))
+
+    ax.axhline(0, color="black", linestyle="--", linewidth=1)
+    ax.set_title(f"WOE Stability Over Time — {feature_col}")
+    if legend:
+        ax.legend(title=feature_col, bbox_to_anchor=(1.05, 1), loc="upper left")
+    plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+    if pd.api.types.is_datetime64_any_dtype(woe_period[date_col]):
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m"))
+    return fig
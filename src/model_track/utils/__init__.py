@@ -0,0 +1,10 @@
+from .encoding import DENSE_RANGE, code_dtype, factorize, take_categories
+from .parallel import resolve_n_jobs
+
+__all__ = [
+    "DENSE_RANGE",
+    "code_dtype",
+    "factorize",
+    "take_categories",
+    "resolve_n_jobs",
+]
@@ -0,0 +1,80 @@
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# maior intervalo de valores inteiros codificado sem tabela hash
+DENSE_RANGE = 1 << 16
+
+
+def factorize(feature: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Integer codes of a feature, ordered as groupby(sort=True, dropna=False).
+
+    Shared encoder of the WOE, stability and category mapping code, so
+    every module groups values the same way.
+
+    - categorical features reuse their own codes; uniques are the
+      categories (category order, including unobserved ones);
+    - integer features whose value range is below DENSE_RANGE (e.g. bin
+      codes) skip the hash table: codes are value - min and uniques the
+      whole range min..max, including values absent from the data;
+    - other dtypes are factorized once with sorted uniques.
+
+    Missing values always get code len(uniques), so the missing group
+    comes last.
+
+    Returns
+    -------
+    Tuple[np.ndarray, pd.Index]
+        (codes, uniques). uniques may contain values that never occur:
+        callers that need only observed values must filter by the codes
+        (e.g. np.bincount(codes) > 0) and use take_categories.
+    """
+    if isinstance(feature.dtype, pd.CategoricalDtype):
+        uniques = feature.cat.categories
+        # cat.codes may share memory with the column: do not write in place
+        codes = feature.cat.codes.to_numpy()
+        codes = np.where(codes < 0, len(uniques), codes)
+        return codes, uniques
+
+    values = feature.to_numpy()
+    if values.dtype.kind in "iu" and len(values):
+        low, high = int(values.min()), int(values.max())
+        if high - low < DENSE_RANGE:
+            # alarga antes de subtrair: int8 / int16 estouram no próprio dtype
+            codes = values.astype(np.intp) - low
+            return codes, pd.Index(np.arange(low, high + 1, dtype=values.dtype))
+
+    codes, uniques = pd.factorize(feature, sort=True)
+    codes[codes < 0] = len(uniques)
+    return codes, uniques
+
+
+def take_categories(feature: pd.Series, uniques, positions) -> pd.Index:
+    """
+    Labels of factorize codes: uniques[positions], with position
+    len(uniques) meaning missing (NaN). Categorical features keep their
+    dtype (CategoricalIndex).
+    """
+    if isinstance(feature.dtype, pd.CategoricalDtype):
+        codes = np.where(positions == len(uniques), -1, positions)
+        return pd.CategoricalIndex(
+            pd.Categorical.from_codes(codes, dtype=feature.dtype)
+        )
+    index = pd.Index(uniques)
+    if len(positions) and positions[-1] == len(uniques):
+        index = index.insert(len(index), np.nan)
+    return index.take(positions)
+
+
+def code_dtype(n_codes: int) -> np.dtype:
+    """
+    Smallest signed integer dtype able to hold the codes 0..n_codes
+    (and -1, used for missing by pd.Categorical).
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_codes <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
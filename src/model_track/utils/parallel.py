@@ -0,0 +1,21 @@
+import os
+from typing import Optional
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    Number of workers for an n_jobs argument.
+
+    1 = sequential, -1 or None = os.cpu_count(), any other positive
+    integer is used as is.
+
+    Raises
+    ------
+    ValueError
+        If n_jobs is zero or a negative value other than -1.
+    """
+    if n_jobs is None or n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("n_jobs must be a positive integer, -1 or None")
+    return n_jobs
@@ -1,4 +1,15 @@
 from .woe_calculator import WoeCalculator
 from .woe_by_period import WoeByPeriod
+from .woe_accumulator import WoeAccumulator
+from .woe_transformer import WoeTransformer
+from .rolling_woe import RollingWoe
+from .woe_bootstrap import WoeBootstrap
 
-__all__ = ["WoeCalculator", "WoeByPeriod"]
+__all__ = [
+    "WoeCalculator",
+    "WoeByPeriod",
+    "WoeAccumulator",
+    "WoeTransformer",
+    "RollingWoe",
+    "WoeBootstrap",
+]
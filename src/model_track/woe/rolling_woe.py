@@ -0,0 +1,210 @@
+import pickle
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .woe_accumulator import WoeAccumulator
+from .woe_by_period import WoeByPeriod
+
+
+class RollingWoe:
+    """
+    WOE / IV em janela móvel de períodos, incremental.
+
+    Guarda um WoeAccumulator (contagens por categoria) por período. A cada
+    novo período as contagens são somadas ao estado e, com janela fixa,
+    os períodos mais antigos são descartados; a tabela da janela é obtida
+    somando as contagens dos períodos, sem reler as linhas brutas.
+
+    Parameters
+    ----------
+    feature_col : str
+        Nome da coluna categórica.
+    target_col : str
+        Nome da coluna alvo binária.
+    window : int, optional
+        Número de períodos da janela. None = janela expansiva (acumula
+        todos os períodos).
+    event_value : int, optional
+        Valor que representa o evento na coluna alvo (default=1).
+    epsilon : float, optional
+        Proteção contra divisão por zero (default=1e-8).
+    """
+
+    def __init__(
+        self,
+        feature_col: str,
+        target_col: str,
+        window: Optional[int] = 12,
+        event_value: int = 1,
+        epsilon: float = 1e-8,
+    ):
+        if window is not None and window < 1:
+            raise ValueError("window must be a positive integer or None")
+
+        self.feature_col = feature_col
+        self.target_col = target_col
+        self.window = window
+        self.event_value = event_value
+        self.epsilon = epsilon
+
+        self.history_: List[Dict] = []
+        self._periods: Dict[object, WoeAccumulator] = {}
+
+    @property
+    def periods(self) -> List:
+        """Períodos na janela atual, em ordem crescente."""
+        return sorted(self._periods)
+
+    @property
+    def target_values(self) -> List:
+        """Valores distintos do target nos períodos da janela."""
+        values: List = []
+        for period in self.periods:
+            values = WoeAccumulator.union_target_values(
+                self.target_col, values, self._periods[period].target_values_
+            )
+        return values
+
+    def check_target(self, values) -> List:
+        """
+        Valida valores de target novos contra a janela, sem alterar o estado.
+
+        Returns
+        -------
+        List
+            Valores distintos do target da janela somados aos novos.
+
+        Raises
+        ------
+        ValueError
+            Se a união tiver mais de dois valores, ou dois valores sem
+            event_value.
+        """
+        target_values = WoeAccumulator.union_target_values(
+            self.target_col, self.target_values, values
+        )
+        if len(target_values) == 2 and self.event_value not in target_values:
+            raise ValueError(
+                f"event_value '{self.event_value}' not found in target column "
+                f"'{self.target_col}'."
+            )
+        return target_values
+
+    # ------------------------------------------------------------------
+    # Atualização
+    # ------------------------------------------------------------------
+    def update(self, df: pd.DataFrame, date_col: str) -> pd.DataFrame:
+        """
+        Incorpora os dados novos (um ou mais períodos) e retorna a tabela
+        WOE da janela.
+
+        As contagens por período saem de um único cubo de contagens
+        (WoeByPeriod.count_cube). Dados de um período já presente são
+        somados a ele; períodos mais antigos que a janela são descartados.
+        O target binário é validado na janela, não no lote: um período
+        sem eventos é normal em monitoramento diário. Valores de target
+        incompatíveis com a janela (check_target) levantam ValueError
+        antes de qualquer alteração do estado. Se a janela resultante
+        ainda tiver uma única classe, os dados são guardados e to_table
+        levanta ValueError.
+        """
+        periods, categories, n_event, n_non_event = WoeByPeriod.count_cube(
+            df, self.target_col, self.feature_col, date_col, self.event_value,
+            check_target=False,
+        )
+        target_values = df[self.target_col].dropna().unique()
+        self.check_target(target_values)
+
+        for i, period in enumerate(periods):
+            accumulator = self._periods.get(period)
+            if accumulator is None:
+                accumulator = WoeAccumulator(
+                    self.feature_col, self.target_col, self.event_value, self.epsilon
+                )
+                self._periods[period] = accumulator
+            accumulator.add_counts(categories, n_event[i], n_non_event[i], target_values)
+
+        self._evict()
+
+        window = self.window_accumulator()
+        table = window.to_table()
+        self.history_.append(
+            {
+                "period": self.periods[-1],
+                "n_periods": len(self._periods),
+                "n_rows": window.n_rows_,
+                "iv": table["iv_total"].iloc[0],
+            }
+        )
+        return table
+
+    def _evict(self):
+        if self.window is None:
+            return
+        for period in self.periods[:-self.window]:
+            del self._periods[period]
+
+    # ------------------------------------------------------------------
+    # Resultado
+    # ------------------------------------------------------------------
+    def window_accumulator(self) -> WoeAccumulator:
+        """Contagens somadas dos períodos da janela."""
+        merged = WoeAccumulator(
+            self.feature_col, self.target_col, self.event_value, self.epsilon
+        )
+        for period in self.periods:
+            merged.merge(self._periods[period])
+        return merged
+
+    def table(self, add_totals: bool = True, round: int = 4) -> pd.DataFrame:
+        """Tabela WOE da janela (mesmas colunas de WoeCalculator.compute_table)."""
+        return self.window_accumulator().to_table(add_totals=add_totals, round=round)
+
+    def iv_history(self) -> pd.DataFrame:
+        """IV da janela após cada update: ['period', 'n_periods', 'n_rows', 'iv']."""
+        return pd.DataFrame(self.history_, columns=["period", "n_periods", "n_rows", "iv"])
+
+    # ------------------------------------------------------------------
+    # Persistência
+    # ------------------------------------------------------------------
+    def save(self, path: str):
+        """
+        Grava o estado (contagens por período + histórico) em disco.
+        Usa pickle: carregue apenas arquivos de origem confiável.
+        """
+        state = {
+            "format": "model_track.rolling_woe",
+            "version": 1,
+            "feature_col": self.feature_col,
+            "target_col": self.target_col,
+            "window": self.window,
+            "event_value": self.event_value,
+            "epsilon": self.epsilon,
+            "history": self.history_,
+            "periods": {p: acc.to_dict() for p, acc in self._periods.items()},
+        }
+        with open(path, "wb") as fh:
+            pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "RollingWoe":
+        with open(path, "rb") as fh:
+            state = pickle.load(fh)
+
+        if state.get("format") != "model_track.rolling_woe":
+            raise ValueError(f"'{path}' is not a RollingWoe state file")
+
+        rolling = cls(
+            feature_col=state["feature_col"],
+            target_col=state["target_col"],
+            window=state["window"],
+            event_value=state["event_value"],
+            epsilon=state["epsilon"],
+        )
+        rolling.history_ = list(state["history"])
+        rolling._periods = {
+            period: WoeAccumulator.from_dict(acc)
+            for period, acc in state["periods"].items()
+        }
+        return rolling
@@ -0,0 +1,265 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .woe_calculator import WoeCalculator
+
+
+class WoeAccumulator:
+    """
+    Estado de contagens mergeável para WOE fora da memória.
+
+    Guarda apenas eventos / não-eventos por categoria, então o WOE pode
+    ser calculado chunk a chunk (update), em partições processadas por
+    workers diferentes (merge) e serializado entre processos
+    (to_dict / from_dict). to_table gera a mesma tabela que
+    WoeCalculator.compute_table sobre os dados concatenados.
+
+    Parameters
+    ----------
+    feature_col : str
+        Nome da coluna categórica.
+    target_col : str
+        Nome da coluna alvo binária.
+    event_value : int, optional
+        Valor que representa o evento na coluna alvo (default=1).
+    epsilon : float, optional
+        Proteção contra divisão por zero (default=1e-8).
+    """
+
+    def __init__(
+        self,
+        feature_col: str,
+        target_col: str,
+        event_value: int = 1,
+        epsilon: float = 1e-8,
+    ):
+        self.feature_col = feature_col
+        self.target_col = target_col
+        self.event_value = event_value
+        self.epsilon = epsilon
+
+        self.n_rows_ = 0
+        self.target_values_: List = []
+        self._counts: Dict[object, np.ndarray] = {}
+        self._missing = np.zeros(2, dtype=np.int64)
+        self._dtype: Optional[pd.CategoricalDtype] = None
+
+    # ------------------------------------------------------------------
+    # Acumulação
+    # ------------------------------------------------------------------
+    def update(self, chunk: pd.DataFrame) -> "WoeAccumulator":
+        """Soma as contagens de um chunk ao estado."""
+        for column in (self.target_col, self.feature_col):
+            if column not in chunk.columns:
+                raise KeyError(f"Column '{column}' not found in DataFrame.")
+
+        self._track_target(chunk[self.target_col].dropna().unique())
+
+        feature = chunk[self.feature_col]
+        if isinstance(feature.dtype, pd.CategoricalDtype):
+            self._check_dtype(feature.dtype)
+
+        categories, n_event, n_non_event = WoeCalculator.count_events(
+            feature, chunk[self.target_col], self.event_value
+        )
+        self._add(categories, n_event, n_non_event)
+        self.n_rows_ += len(chunk)
+        return self
+
+    def merge(self, other: "WoeAccumulator") -> "WoeAccumulator":
+        """Incorpora o estado de outro acumulador (ex.: outra partição)."""
+        if (other.feature_col, other.target_col, other.event_value) != (
+            self.feature_col, self.target_col, self.event_value
+        ):
+            raise ValueError(
+                "Cannot merge accumulators with different feature, target or event_value"
+            )
+
+        self._track_target(other.target_values_)
+        if other._dtype is not None:
+            self._check_dtype(other._dtype)
+
+        categories = list(other._counts)
+        counts = np.array([other._counts[c] for c in categories], dtype=np.int64).reshape(-1, 2)
+        self._add(categories, counts[:, 0], counts[:, 1])
+        self._missing += other._missing
+        self.n_rows_ += other.n_rows_
+        return self
+
+    def add_counts(
+        self,
+        categories,
+        n_event,
+        n_non_event,
+        target_values=None,
+    ) -> "WoeAccumulator":
+        """
+        Soma contagens já agregadas (ex.: uma fatia de WoeByPeriod.count_cube).
+
+        target_values são os valores distintos do target que geraram as
+        contagens (validação de target binário em to_table).
+        """
+        if target_values is not None:
+            self._track_target(target_values)
+
+        if isinstance(categories, pd.CategoricalIndex):
+            self._check_dtype(categories.dtype)
+
+        n_event = np.asarray(n_event, dtype=np.int64)
+        n_non_event = np.asarray(n_non_event, dtype=np.int64)
+
+        # categorias sem observações não viram linhas da tabela
+        observed = np.flatnonzero(n_event + n_non_event)
+        self._add(
+            [categories[i] for i in observed], n_event[observed], n_non_event[observed]
+        )
+        self.n_rows_ += int(n_event.sum() + n_non_event.sum())
+        return self
+
+    # ------------------------------------------------------------------
+    # Resultado
+    # ------------------------------------------------------------------
+    def to_table(self, add_totals: bool = True, round: int = 4) -> pd.DataFrame:
+        """Mesma saída de WoeCalculator.compute_table sobre todos os chunks."""
+        if len(self.target_values_) != 2:
+            raise ValueError(
+                f"Target column '{self.target_col}' must be binary. "
+                f"Found values: {np.asarray(self.target_values_)}"
+            )
+
+        if self.event_value not in self.target_values_:
+            raise ValueError(
+                f"event_value '{self.event_value}' not found in target column "
+                f"'{self.target_col}'."
+            )
+
+        categories = self._sorted_categories()
+        counts = np.array([self._counts[c] for c in categories], dtype=np.int64).reshape(-1, 2)
+
+        if self._dtype is not None:
+            index = pd.CategoricalIndex(pd.Categorical(categories, dtype=self._dtype))
+        else:
+            index = pd.Index(categories)
+
+        # grupo de ausentes por último, como no groupby(dropna=False)
+        if self._missing.sum() > 0:
+            index = index.insert(len(index), np.nan)
+            counts = np.vstack([counts, self._missing])
+
+        return WoeCalculator.table_from_counts(
+            feature_col=self.feature_col,
+            categories=index,
+            n_event=counts[:, 0],
+            n_non_event=counts[:, 1],
+            epsilon=self.epsilon,
+            add_totals=add_totals,
+            round=round,
+        )
+
+    def to_mapping(self) -> Dict:
+        """Mesma saída de WoeCalculator.compute_mapping."""
+        table = self.to_table(add_totals=False)
+        return dict(zip(table[self.feature_col], table["woe"]))
+
+    # ------------------------------------------------------------------
+    # Serialização
+    # ------------------------------------------------------------------
+    def to_dict(self) -> Dict:
+        """Estado em Python puro, adequado para JSON ou troca entre processos."""
+        categories = list(self._counts)
+        return {
+            "feature_col": self.feature_col,
+            "target_col": self.target_col,
+            "event_value": _to_python(self.event_value),
+            "epsilon": self.epsilon,
+            "n_rows": self.n_rows_,
+            "target_values": [_to_python(v) for v in self.target_values_],
+            "categories": [_to_python(c) for c in categories],
+            "counts": [self._counts[c].tolist() for c in categories],
+            "missing": self._missing.tolist(),
+            "dtype": None if self._dtype is None else {
+                "categories": self._dtype.categories.tolist(),
+                "ordered": bool(self._dtype.ordered),
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> "WoeAccumulator":
+        accumulator = cls(
+            feature_col=state["feature_col"],
+            target_col=state["target_col"],
+            event_value=state["event_value"],
+            epsilon=state["epsilon"],
+        )
+        accumulator.n_rows_ = state["n_rows"]
+        accumulator.target_values_ = list(state["target_values"])
+        accumulator._counts = {
+            category: np.asarray(counts, dtype=np.int64)
+            for category, counts in zip(state["categories"], state["counts"])
+        }
+        accumulator._missing = np.asarray(state["missing"], dtype=np.int64)
+        if state["dtype"] is not None:
+            accumulator._dtype = pd.CategoricalDtype(**state["dtype"])
+        return accumulator
+
+    @staticmethod
+    def union_target_values(target_col: str, current, values) -> List:
+        """
+        Valores distintos do target: os de current seguidos dos novos de
+        values. Não altera nenhum estado.
+
+        Raises
+        ------
+        ValueError
+            Se a união tiver mais de dois valores (target não binário).
+        """
+        target_values = list(current)
+        for value in values:
+            if value not in target_values:
+                target_values.append(value)
+
+        if len(target_values) > 2:
+            raise ValueError(
+                f"Target column '{target_col}' must be binary. "
+                f"Found values: {np.asarray(target_values)}"
+            )
+        return target_values
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _track_target(self, values):
+        # valida antes de alterar o estado
+        self.target_values_ = self.union_target_values(
+            self.target_col, self.target_values_, values
+        )
+
+    def _check_dtype(self, dtype: pd.CategoricalDtype):
+        if self._dtype is None:
+            self._dtype = dtype
+        elif self._dtype != dtype:
+            raise ValueError("Categorical chunks must share the same categories")
+
+    def _add(self, categories, n_event, n_non_event):
+        for category, event, non_event in zip(categories, n_event, n_non_event):
+            if pd.isna(category):
+                self._missing += (event, non_event)
+            elif category in self._counts:
+                self._counts[category] += (event, non_event)
+            else:
+                self._counts[category] = np.array([event, non_event], dtype=np.int64)
+
+    def _sorted_categories(self) -> List:
+        categories = list(self._counts)
+        if self._dtype is not None:
+            # ordem das categorias do dtype (mesma do groupby categórico)
+            position = {c: i for i, c in enumerate(self._dtype.categories)}
+            return sorted(categories, key=position.__getitem__)
+        return sorted(categories)
+
+
+def _to_python(value):
+    """numpy scalar -> Python scalar (JSON)."""
+    return value.item() if isinstance(value, np.generic) else value
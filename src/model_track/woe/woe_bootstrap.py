@@ -0,0 +1,222 @@
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .woe_by_period import WoeByPeriod
+from .woe_calculator import WoeCalculator
+
+
+class WoeBootstrap:
+    """
+    Bootstrap confidence intervals for WOE and IV, computed on counts.
+
+    Resampling the rows of a dataset is equivalent to resampling its
+    per-category event / non-event counts, so every bootstrap replicate
+    is drawn directly from the 2k count cells of WoeCalculator:
+
+    - "multinomial": N draws over the 2k cells (exact row bootstrap)
+    - "poisson":     independent Poisson(count) per cell
+
+    All replicates are computed at once as B x k matrices; the cost
+    depends on the number of categories, not on the number of rows.
+
+    Parameters
+    ----------
+    n_boot : int
+        Number of bootstrap replicates (B).
+    method : str
+        "multinomial" (default) or "poisson".
+    ci : float
+        Confidence level of the percentile intervals (default 0.95).
+    epsilon : float
+        Protection against division by zero (same role as in WoeCalculator).
+    random_state : int, optional
+        Seed of the resampling.
+    """
+
+    def __init__(
+        self,
+        n_boot: int = 1000,
+        method: str = "multinomial",
+        ci: float = 0.95,
+        epsilon: float = 1e-8,
+        random_state: Optional[int] = None,
+    ):
+        if n_boot < 1:
+            raise ValueError("n_boot must be a positive integer")
+
+        if method not in ("multinomial", "poisson"):
+            raise ValueError("method must be 'multinomial' or 'poisson'")
+
+        if not 0 < ci < 1:
+            raise ValueError("ci must be between 0 and 1")
+
+        self.n_boot = n_boot
+        self.method = method
+        self.ci = ci
+        self.epsilon = epsilon
+        self.random_state = random_state
+        self._rng = np.random.default_rng(random_state)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def compute(
+        self,
+        df: pd.DataFrame,
+        target_col: str,
+        feature_col: str,
+        event_value: int = 1,
+    ) -> pd.DataFrame:
+        """
+        WOE / IV intervals of a feature over the whole DataFrame.
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns: feature_col, 'woe', 'woe_lower', 'woe_upper',
+            'iv_total', 'iv_lower', 'iv_upper' (IV columns are repeated
+            on every row, like iv_total in compute_table).
+        """
+        WoeCalculator._validate(df, target_col, feature_col, event_value)
+        categories, n_event, n_non_event = WoeCalculator.count_events(
+            df[feature_col], df[target_col], event_value
+        )
+        return self.from_counts(feature_col, categories, n_event, n_non_event)
+
+    def compute_by_period(
+        self,
+        df: pd.DataFrame,
+        target_col: str,
+        feature_col: str,
+        date_col: str,
+        event_value: int = 1,
+    ) -> pd.DataFrame:
+        """
+        Same as compute for every period, from a single count cube
+        (WoeByPeriod.count_cube). Only categories observed in a period
+        get a row.
+
+        Returns
+        -------
+        pd.DataFrame
+            Long format: date_col followed by the compute columns.
+        """
+        periods, categories, n_event, n_non_event = WoeByPeriod.count_cube(
+            df, target_col, feature_col, date_col, event_value
+        )
+        return self.from_cube(
+            feature_col, date_col, periods, categories, n_event, n_non_event
+        )
+
+    def from_cube(
+        self,
+        feature_col: str,
+        date_col: str,
+        periods,
+        categories,
+        n_event: np.ndarray,
+        n_non_event: np.ndarray,
+    ) -> pd.DataFrame:
+        """compute_by_period on a WoeByPeriod.count_cube output."""
+        results = []
+        for i, period in enumerate(periods):
+            observed = np.flatnonzero(n_event[i] + n_non_event[i])
+            table = self.from_counts(
+                feature_col,
+                categories.take(observed),
+                n_event[i, observed],
+                n_non_event[i, observed],
+            )
+            table.insert(0, date_col, period)
+            results.append(table)
+
+        return pd.concat(results, ignore_index=True)
+
+    def from_counts(
+        self,
+        feature_col: str,
+        categories,
+        n_event,
+        n_non_event,
+    ) -> pd.DataFrame:
+        """Intervals from per-category counts (see compute)."""
+        n_event = np.asarray(n_event, dtype=np.int64)
+        n_non_event = np.asarray(n_non_event, dtype=np.int64)
+
+        woe, iv_total = self._woe_iv(n_event[None, :], n_non_event[None, :])
+        boot_event, boot_non_event = self.resample(n_event, n_non_event)
+        boot_woe, boot_iv = self._woe_iv(boot_event, boot_non_event)
+
+        woe_lower, woe_upper = self._interval(boot_woe)
+        iv_lower, iv_upper = self._interval(boot_iv[:, None])
+
+        return pd.DataFrame(
+            {
+                feature_col: categories,
+                "woe": woe[0],
+                "woe_lower": woe_lower,
+                "woe_upper": woe_upper,
+                "iv_total": iv_total[0],
+                "iv_lower": iv_lower[0],
+                "iv_upper": iv_upper[0],
+            }
+        ).round(4)
+
+    def resample(
+        self,
+        n_event: np.ndarray,
+        n_non_event: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bootstrap replicates of the count vectors.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            (n_event, n_non_event) replicates, each of shape (n_boot, k).
+        """
+        cells = np.concatenate([n_event, n_non_event]).astype(np.int64)
+        k = len(n_event)
+
+        if self.method == "poisson":
+            boot = self._rng.poisson(cells, size=(self.n_boot, 2 * k))
+        else:
+            total = int(cells.sum())
+            pvals = cells / total if total else np.full(2 * k, 1.0 / max(2 * k, 1))
+            boot = self._rng.multinomial(total, pvals, size=self.n_boot)
+
+        return boot[:, :k], boot[:, k:]
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _woe_iv(self, n_event, n_non_event):
+        """WOE (B, k) and iv_total (B,), same formulas as WoeCalculator."""
+        total_events = n_event.sum(axis=1, keepdims=True)
+        total_non_events = n_non_event.sum(axis=1, keepdims=True)
+
+        event_rate = n_event / np.maximum(total_events, self.epsilon)
+        non_event_rate = n_non_event / np.maximum(total_non_events, self.epsilon)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            woe = np.log(event_rate / non_event_rate)
+            iv = (event_rate - non_event_rate) * woe
+
+        # categoria ausente no replicate (0 / 0) não entra no IV
+        iv = np.where(np.isnan(iv), 0.0, iv)
+        iv_total = np.where(np.isinf(woe).any(axis=1), np.inf, iv.sum(axis=1))
+        return woe, iv_total
+
+    def _interval(self, values):
+        """
+        Percentile interval per column. Uses the nearest order statistics
+        outward ('lower' / 'higher'), so infinite replicates never turn
+        into NaN through interpolation.
+        """
+        alpha = (1 - self.ci) / 2
+        with np.errstate(invalid="ignore"):
+            lower = np.nanquantile(values, alpha, axis=0, method="lower")
+            upper = np.nanquantile(values, 1 - alpha, axis=0, method="higher")
+        return lower, upper
@@ -1,6 +1,23 @@
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 import pandas as pd
 
-from .woe_calculator import WoeCalculator
+from model_track.utils import factorize, take_categories
+
+from .woe_calculator import OTHER_LABEL, WoeCalculator
+
+
+TABLE_COLUMNS = [
+    "n_event",
+    "n_non_event",
+    "event_rate",
+    "non_event_rate",
+    "exposure",
+    "woe",
+    "iv",
+    "iv_total",
+]
 
 
 class WoeByPeriod:
@@ -8,11 +25,11 @@ class WoeByPeriod:
     Calcula o Weight of Evidence (WOE) por período temporal.
 
     Esta classe é responsável apenas por:
-    - segmentar o DataFrame por período
-    - delegar o cálculo de WOE para o WoeCalculator
-    - organizar a saída em formato long para análise temporal
-
-    Não reimplementa lógica de WOE.
+    - contar eventos / não-eventos por (período, categoria) em uma única
+      passada vetorizada (cubo de contagens)
+    - derivar o WOE de cada período a partir do cubo, com as mesmas
+      fórmulas do WoeCalculator
+    - organizar a saída em formato long (compute) ou wide (compute_matrix)
     """
 
     @staticmethod
@@ -22,6 +39,9 @@ class WoeByPeriod:
         feature_col: str,
         date_col: str,
         event_value: int = 1,
+        top_k: Optional[int] = None,
+        min_exposure: Optional[float] = None,
+        other_label: str = OTHER_LABEL,
     ) -> pd.DataFrame:
         """
         Parameters
@@ -36,13 +56,20 @@ class WoeByPeriod:
             Nome da coluna que representa o período.
         event_value : int, optional
             Valor que representa o evento na coluna alvo (default=1).
+        top_k, min_exposure, other_label : optional
+            Agrupamento de níveis raros de features de alta cardinalidade
+            (ver WoeCalculator.fold_levels). A exposição é calculada na base
+            inteira, então todos os períodos usam os mesmos níveis; o
+            relatório fica em ``result.attrs["fold_report"]``.
 
         Returns
         -------
         pd.DataFrame
             DataFrame em formato long com colunas:
             ['period', feature_col, 'n_event', 'n_non_event',
-            'event_rate', 'non_event_rate', 'exposure', 'woe']
+            'event_rate', 'non_event_rate', 'exposure', 'woe',
+            'iv', 'iv_total'], ordenado por período e WOE decrescente.
+            Só aparecem as categorias observadas em cada período.
 
         Raises
         ------
@@ -51,27 +78,236 @@ class WoeByPeriod:
         ValueError
             Se date_col contiver apenas valores nulos.
         """
+        periods, categories, n_event, n_non_event, report = WoeByPeriod._counts(
+            df, target_col, feature_col, date_col, event_value,
+            top_k, min_exposure, other_label,
+        )
+        metrics = WoeByPeriod.metrics_from_counts(n_event, n_non_event)
+
+        # uma linha por célula (período, categoria) observada
+        period_idx, category_idx = np.nonzero(n_event + n_non_event)
+
+        # período crescente e, dentro do período, WOE decrescente
+        woe = metrics["woe"][period_idx, category_idx]
+        order = np.lexsort((-woe, period_idx))
+        period_idx, category_idx = period_idx[order], category_idx[order]
+
+        result = pd.DataFrame(
+            {
+                date_col: periods.take(period_idx),
+                feature_col: categories.take(category_idx),
+            }
+        )
+        for column in TABLE_COLUMNS:
+            values = metrics[column]
+            if values.ndim == 1:
+                result[column] = values[period_idx]
+            else:
+                result[column] = values[period_idx, category_idx]
 
+        result = result.round(4)
+        if report is not None:
+            result.attrs["fold_report"] = report
+        return result
+
+    @staticmethod
+    def compute_matrix(
+        df: pd.DataFrame,
+        target_col: str,
+        feature_col: str,
+        date_col: str,
+        event_value: int = 1,
+        value: str = "woe",
+        top_k: Optional[int] = None,
+        min_exposure: Optional[float] = None,
+        other_label: str = OTHER_LABEL,
+    ) -> pd.DataFrame:
+        """
+        Saída wide: uma linha por período e uma coluna por categoria.
+
+        Parameters
+        ----------
+        value : str
+            Métrica da matriz: 'woe' (padrão), 'iv', 'event_rate',
+            'non_event_rate', 'exposure', 'n_event' ou 'n_non_event'.
+        top_k, min_exposure, other_label : optional
+            Agrupamento de níveis raros, como em compute.
+
+        Returns
+        -------
+        pd.DataFrame
+            Matriz período × categoria. Categorias não observadas em um
+            período ficam como NaN (0 para as contagens).
+        """
+        if value not in TABLE_COLUMNS or value == "iv_total":
+            raise ValueError(
+                f"value must be one of {[c for c in TABLE_COLUMNS if c != 'iv_total']}"
+            )
+
+        periods, categories, n_event, n_non_event, report = WoeByPeriod._counts(
+            df, target_col, feature_col, date_col, event_value,
+            top_k, min_exposure, other_label,
+        )
+        matrix = WoeByPeriod.metrics_from_counts(n_event, n_non_event)[value]
+
+        if value not in ("n_event", "n_non_event"):
+            matrix = np.where(n_event + n_non_event > 0, matrix, np.nan)
+
+        result = pd.DataFrame(
+            matrix,
+            index=pd.Index(periods, name=date_col),
+            columns=pd.Index(categories, name=feature_col),
+        ).round(4)
+        if report is not None:
+            result.attrs["fold_report"] = report
+        return result
+
+    # ------------------------------------------------------------------
+    # Cubo de contagens
+    # ------------------------------------------------------------------
+    @staticmethod
+    def count_cube(
+        df: pd.DataFrame,
+        target_col: str,
+        feature_col: str,
+        date_col: str,
+        event_value: int = 1,
+        check_target: bool = True,
+    ) -> Tuple[pd.Index, pd.Index, np.ndarray, np.ndarray]:
+        """
+        Contagens de eventos / não-eventos por (período, categoria) em uma
+        única passada de np.bincount.
+
+        Linhas com período nulo são ignoradas (como no groupby). Targets
+        ausentes contam como não-evento. check_target=False pula a
+        validação de target binário do lote (ex.: um período sem eventos);
+        quem acumula lotes, como o RollingWoe, valida o estado somado.
+
+        Returns
+        -------
+        Tuple[pd.Index, pd.Index, np.ndarray, np.ndarray]
+            (periods, categories, n_event, n_non_event); as contagens têm
+            shape (n_periods, n_categories). Períodos em ordem crescente e
+            categorias na ordem do WoeCalculator (ausentes por último).
+        """
+        periods, categories, n_event, n_non_event, _ = WoeByPeriod._counts(
+            df, target_col, feature_col, date_col, event_value,
+            check_target=check_target,
+        )
+        return periods, categories, n_event, n_non_event
+
+    @staticmethod
+    def _counts(
+        df, target_col, feature_col, date_col, event_value,
+        top_k=None, min_exposure=None, other_label=OTHER_LABEL,
+        check_target=True,
+    ):
+        """count_cube + agrupamento opcional de níveis raros (+ relatório)."""
         if date_col not in df.columns:
             raise KeyError(f"Column '{date_col}' not found in DataFrame")
 
         if df[date_col].isna().all():
             raise ValueError(f"Column '{date_col}' contains only null values")
 
-        results = []
+        if check_target:
+            WoeCalculator._validate(df, target_col, feature_col, event_value)
+        else:
+            for column in (target_col, feature_col):
+                if column not in df.columns:
+                    raise KeyError(f"Column '{column}' not found in DataFrame.")
+
+        period_codes, periods = pd.factorize(df[date_col], sort=True)
+        feature_codes, uniques = factorize(df[feature_col])
+        is_event = WoeCalculator.event_mask(df[target_col], event_value)
+
+        # período nulo -> slot extra, descartado depois
+        has_period = period_codes >= 0
+        period_codes[~has_period] = len(periods)
 
-        for period, df_period in df.groupby(date_col):
-            woe_table = WoeCalculator.compute_table(
-                df=df_period,
-                target_col=target_col,
-                feature_col=feature_col,
-                event_value=event_value,
-                add_totals=False,
+        # níveis observados (em períodos válidos)
+        rows = np.bincount(feature_codes[has_period], minlength=len(uniques) + 1)
+        observed = np.flatnonzero(rows)
+        categories = take_categories(df[feature_col], uniques, observed)
+
+        # código da feature -> coluna do cubo
+        remap = np.zeros(len(rows), dtype=np.intp)
+        report = None
+        if top_k is None and min_exposure is None:
+            remap[observed] = np.arange(len(observed))
+        else:
+            # agrupa antes de montar o cubo: memória O(períodos × níveis mantidos)
+            keep, folded, is_missing, report = WoeCalculator._fold_plan(
+                categories, rows[observed], top_k, min_exposure
             )
+            n_kept = int(keep.sum())
+            remap[observed[keep]] = np.arange(n_kept)
+            remap[observed[folded]] = n_kept
+            remap[observed[is_missing]] = n_kept + int(folded.any())
+            if folded.any():
+                categories = WoeCalculator._folded_labels(
+                    categories, keep, is_missing, other_label
+                )
+
+        n_periods = len(periods) + 1
+        n_groups = len(categories)
+
+        slots = period_codes.astype(np.intp, copy=False) * n_groups
+        slots += remap[feature_codes]
+        slots *= 2
+        slots += is_event
+        cube = np.bincount(slots, minlength=n_periods * n_groups * 2)
+        cube = cube.reshape(n_periods, n_groups, 2)[:-1]
+
+        return pd.Index(periods), categories, cube[..., 1], cube[..., 0], report
+
+    @staticmethod
+    def metrics_from_counts(
+        n_event: np.ndarray,
+        n_non_event: np.ndarray,
+        epsilon: float = 1e-8,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Métricas do WoeCalculator.table_from_counts para todos os períodos
+        de uma vez (linhas = períodos). Células vazias não entram nos
+        totais do período nem no iv_total.
+
+        Parameters
+        ----------
+        n_event, n_non_event : np.ndarray
+            Contagens com shape (n_periods, n_categories), por exemplo a
+            saída de count_cube. Para uma única tabela, use shape (1, k).
+        epsilon : float, optional
+            Proteção contra divisão por zero (default=1e-8).
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Chaves de TABLE_COLUMNS; matrizes (n_periods, n_categories),
+            exceto 'iv_total', com shape (n_periods,).
+        """
+        total_events = n_event.sum(axis=1, keepdims=True)
+        total_non_events = n_non_event.sum(axis=1, keepdims=True)
+        total_obs = total_events + total_non_events
+
+        event_rate = n_event / np.maximum(total_events, epsilon)
+        non_event_rate = n_non_event / np.maximum(total_non_events, epsilon)
+        exposure = (n_event + n_non_event) / np.maximum(total_obs, epsilon)
 
-            woe_table = woe_table.copy()
-            woe_table.insert(0, date_col, period)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            woe = np.log(event_rate / non_event_rate)
+            iv = (event_rate - non_event_rate) * woe
 
-            results.append(woe_table)
+        observed = (n_event + n_non_event) > 0
+        has_inf = (np.isinf(woe) & observed).any(axis=1)
+        iv_total = np.where(has_inf, np.inf, np.where(observed, iv, 0.0).sum(axis=1))
 
-        return pd.concat(results, ignore_index=True)
\ No newline at end of file
+        return {
+            "n_event": n_event,
+            "n_non_event": n_non_event,
+            "event_rate": event_rate,
+            "non_event_rate": non_event_rate,
+            "exposure": exposure,
+            "woe": woe,
+            "iv": iv,
+            "iv_total": iv_total,
+        }
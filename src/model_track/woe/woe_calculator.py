@@ -1,6 +1,12 @@
 import numpy as np
 import pandas as pd
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from model_track.utils import factorize, take_categories
+
+
+OTHER_LABEL = "__OTHER__"
 
 
 class WoeCalculator:
@@ -29,12 +35,21 @@ class WoeCalculator:
         event_value: int = 1,
         epsilon: float = 1e-8,
         add_totals: bool = True,
-        round: int = 4
+        round: int = 4,
+        top_k: Optional[int] = None,
+        min_exposure: Optional[float] = None,
+        other_label: str = OTHER_LABEL,
     ) -> pd.DataFrame:
         """
         Computes the Weight of Evidence (WOE) and Information Value (IV)
         table for a categorical feature.
 
+        High-cardinality features (IDs, ZIP codes) can keep only the top_k
+        levels by exposure and/or the levels with exposure >= min_exposure;
+        the remaining levels are folded into a single other_label row
+        (see fold_levels). The folding report is stored in
+        ``table.attrs["fold_report"]``.
+
         Returns
         -------
         pd.DataFrame
@@ -52,14 +67,139 @@ class WoeCalculator:
             Optionally includes a totals row identified by '__TOTAL__'.
         """
 
-        # --- validations -------------------------------------------------
+        WoeCalculator._validate(df, target_col, feature_col, event_value)
+
+        categories, n_event, n_non_event = WoeCalculator.count_events(
+            df[feature_col], df[target_col], event_value
+        )
+
+        report = None
+        if top_k is not None or min_exposure is not None:
+            categories, n_event, n_non_event, report = WoeCalculator.fold_levels(
+                categories, n_event, n_non_event,
+                top_k=top_k, min_exposure=min_exposure, other_label=other_label,
+            )
+
+        table = WoeCalculator.table_from_counts(
+            feature_col=feature_col,
+            categories=categories,
+            n_event=n_event,
+            n_non_event=n_non_event,
+            epsilon=epsilon,
+            add_totals=add_totals,
+            round=round,
+        )
+        if report is not None:
+            table.attrs["fold_report"] = report
+        return table
+
+    @staticmethod
+    def compute_tables(
+        df: pd.DataFrame,
+        target_col: str,
+        feature_cols: List[str],
+        event_value: int = 1,
+        epsilon: float = 1e-8,
+        add_totals: bool = True,
+        round: int = 4,
+        n_jobs: Optional[int] = 1,
+    ) -> Tuple[Dict[str, pd.DataFrame], pd.DataFrame]:
+        """
+        Computes the WOE/IV table of many features at once.
+
+        The target is validated and turned into an event mask a single
+        time; features are then counted independently (optionally on
+        several threads: factorization and np.bincount release the GIL
+        for most of their work).
+
+        Parameters
+        ----------
+        feature_cols : List[str]
+            Features to evaluate.
+        n_jobs : int, optional
+            Number of threads (1 = sequential, None or -1 = all cores).
+
+        Returns
+        -------
+        Tuple[Dict[str, pd.DataFrame], pd.DataFrame]
+            - {feature: compute_table output}
+            - IV summary with columns ['feature', 'iv', 'n_categories'],
+              sorted by IV descending.
+        """
+        feature_cols = list(feature_cols)
+        missing = [c for c in feature_cols if c not in df.columns]
+        if missing:
+            raise KeyError(f"Feature columns not found in DataFrame: {missing}")
+
+        WoeCalculator.validate_target(df, target_col, event_value)
+        is_event = WoeCalculator.event_mask(df[target_col], event_value)
+
+        def table(feature_col: str) -> pd.DataFrame:
+            categories, n_event, n_non_event = WoeCalculator._count(
+                df[feature_col], is_event
+            )
+            return WoeCalculator.table_from_counts(
+                feature_col, categories, n_event, n_non_event,
+                epsilon=epsilon, add_totals=add_totals, round=round,
+            )
+
+        if n_jobs == 1 or len(feature_cols) <= 1:
+            tables = [table(c) for c in feature_cols]
+        else:
+            workers = None if n_jobs in (None, -1) else n_jobs
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                tables = list(executor.map(table, feature_cols))
+
+        summary = pd.DataFrame(
+            {
+                "feature": feature_cols,
+                "iv": [t["iv_total"].iloc[0] if len(t) else 0.0 for t in tables],
+                "n_categories": [
+                    int((t[c] != "__TOTAL__").sum()) if add_totals else len(t)
+                    for c, t in zip(feature_cols, tables)
+                ],
+            }
+        )
+        summary = summary.sort_values("iv", ascending=False, kind="stable")
+
+        return dict(zip(feature_cols, tables)), summary.reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # Building blocks (shared by WoeByPeriod and the WOE utilities)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _validate(
+        df: pd.DataFrame,
+        target_col: str,
+        feature_col: str,
+        event_value: int = 1,
+    ):
         if target_col not in df.columns:
             raise KeyError(f"Target column '{target_col}' not found in DataFrame.")
 
         if feature_col not in df.columns:
             raise KeyError(f"Feature column '{feature_col}' not found in DataFrame.")
 
-        target_values = df[target_col].dropna().unique()
+        WoeCalculator.validate_target(df, target_col, event_value)
+
+    @staticmethod
+    def validate_target(df: pd.DataFrame, target_col: str, event_value: int = 1):
+        """
+        Checks that target_col exists, has exactly two non-null values and
+        contains event_value.
+
+        Raises
+        ------
+        KeyError
+            If target_col is not found.
+        ValueError
+            If the target is not binary or event_value is absent.
+        """
+        if target_col not in df.columns:
+            raise KeyError(f"Target column '{target_col}' not found in DataFrame.")
+
+        target_values = pd.unique(df[target_col])
+        target_values = target_values[~pd.isna(target_values)]
         if len(target_values) != 2:
             raise ValueError(
                 f"Target column '{target_col}' must be binary. "
@@ -71,20 +211,178 @@ class WoeCalculator:
                 f"event_value '{event_value}' not found in target column '{target_col}'."
             )
 
-        # --- prepare data -----------------------------------------------
-        data = df[[feature_col, target_col]].copy()
-        data["_event"] = (data[target_col] == event_value).astype(int)
-        data["_non_event"] = 1 - data["_event"]
-
-        # --- aggregation ------------------------------------------------
-        agg = (
-            data
-            .groupby(feature_col, dropna=False)
-            .agg(
-                n_event=("_event", "sum"),
-                n_non_event=("_non_event", "sum"),
-            )
-            .reset_index()
+    @staticmethod
+    def event_mask(target: pd.Series, event_value: int = 1) -> np.ndarray:
+        """
+        Boolean event flags (target == event_value) as a numpy array;
+        missing targets count as non-events. Used to encode the target
+        once and reuse it across features.
+        """
+        return (target == event_value).to_numpy(dtype=bool, na_value=False)
+
+    @staticmethod
+    def count_events(
+        feature: pd.Series,
+        target: pd.Series,
+        event_value: int = 1,
+    ) -> Tuple[pd.Index, np.ndarray, np.ndarray]:
+        """
+        Event / non-event counts per category with np.bincount.
+
+        The feature is factorized once (categorical codes are reused) and
+        counted on an event mask, without copying the DataFrame.
+
+        Returns
+        -------
+        Tuple[pd.Index, np.ndarray, np.ndarray]
+            (categories, n_event, n_non_event), with only observed
+            categories, ordered as groupby(sort=True, dropna=False,
+            observed=True): missing values last.
+        """
+        is_event = WoeCalculator.event_mask(target, event_value)
+        return WoeCalculator._count(feature, is_event)
+
+    @staticmethod
+    def _count(feature: pd.Series, is_event: np.ndarray):
+        """count_events with an already encoded target."""
+        codes, uniques = factorize(feature)
+
+        # one pass: slot 2 * code + is_event
+        n_groups = len(uniques) + 1
+        counts = np.bincount(
+            codes.astype(np.intp, copy=False) * 2 + is_event,
+            minlength=2 * n_groups,
+        ).reshape(n_groups, 2)
+
+        observed = np.flatnonzero(counts.sum(axis=1))
+        categories = take_categories(feature, uniques, observed)
+
+        return categories, counts[observed, 1], counts[observed, 0]
+
+    @staticmethod
+    def fold_levels(
+        categories: pd.Index,
+        n_event: np.ndarray,
+        n_non_event: np.ndarray,
+        top_k: Optional[int] = None,
+        min_exposure: Optional[float] = None,
+        other_label: str = OTHER_LABEL,
+    ) -> Tuple[pd.Index, np.ndarray, np.ndarray, Dict]:
+        """
+        Folds rare levels of a high-cardinality feature into one bucket.
+
+        A level is kept if it is among the top_k levels by number of
+        observations and its exposure (share of observations) is at least
+        min_exposure; the missing group is never folded. Works on counts
+        only, so cost depends on the number of levels, not of rows.
+
+        Parameters
+        ----------
+        categories : pd.Index
+            Levels, as returned by count_events (last axis of the counts).
+        n_event, n_non_event : np.ndarray
+            Counts with the levels on the last axis, e.g. (n_levels,) or
+            (n_periods, n_levels); exposure uses the sum over all other axes.
+
+        Returns
+        -------
+        Tuple[pd.Index, np.ndarray, np.ndarray, Dict]
+            (categories, n_event, n_non_event, report). Kept levels keep
+            their order, followed by other_label and the missing group.
+            The report holds n_levels, n_kept, n_folded, folded_rows and
+            folded_exposure.
+        """
+        n_event = np.asarray(n_event)
+        n_non_event = np.asarray(n_non_event)
+
+        rows = (n_event + n_non_event).reshape(-1, len(categories)).sum(axis=0)
+        keep, folded, is_missing, report = WoeCalculator._fold_plan(
+            categories, rows, top_k, min_exposure
+        )
+
+        if not folded.any():
+            return categories, n_event, n_non_event, report
+
+        def fold(counts):
+            parts = [counts[..., keep], counts[..., folded].sum(axis=-1, keepdims=True)]
+            if is_missing.any():
+                parts.append(counts[..., is_missing])
+            return np.concatenate(parts, axis=-1)
+
+        labels = WoeCalculator._folded_labels(categories, keep, is_missing, other_label)
+        return labels, fold(n_event), fold(n_non_event), report
+
+    @staticmethod
+    def _fold_plan(categories, rows, top_k, min_exposure):
+        """Masks (keep, folded, is_missing) over the levels + folding report."""
+        if top_k is not None and top_k < 1:
+            raise ValueError("top_k must be a positive integer")
+
+        if min_exposure is not None and not 0 <= min_exposure <= 1:
+            raise ValueError("min_exposure must be between 0 and 1")
+
+        total_rows = rows.sum()
+        is_missing = np.asarray(pd.isna(categories))
+        keep = ~is_missing
+
+        if min_exposure is not None:
+            keep &= rows >= min_exposure * total_rows
+
+        if top_k is not None and keep.sum() > top_k:
+            candidates = np.flatnonzero(keep)
+            # mais observações primeiro; empates mantêm a ordem original
+            order = np.argsort(-rows[candidates], kind="stable")
+            keep[:] = False
+            keep[candidates[order[:top_k]]] = True
+
+        folded = ~keep & ~is_missing
+        folded_rows = int(rows[folded].sum())
+
+        report = {
+            "n_levels": int((~is_missing).sum()),
+            "n_kept": int(keep.sum()),
+            "n_folded": int(folded.sum()),
+            "folded_rows": folded_rows,
+            "folded_exposure": folded_rows / total_rows if total_rows else 0.0,
+        }
+        return keep, folded, is_missing, report
+
+    @staticmethod
+    def _folded_labels(categories, keep, is_missing, other_label) -> pd.Index:
+        """Kept levels, then other_label, then the missing group."""
+        labels = list(pd.Index(categories).astype(object)[keep]) + [other_label]
+        if is_missing.any():
+            labels.append(np.nan)
+        return pd.Index(labels, dtype=object)
+
+    @staticmethod
+    def table_from_counts(
+        feature_col: str,
+        categories,
+        n_event,
+        n_non_event,
+        epsilon: float = 1e-8,
+        add_totals: bool = True,
+        round: int = 4,
+    ) -> pd.DataFrame:
+        """
+        Builds the compute_table output from per-category counts.
+
+        Parameters
+        ----------
+        feature_col : str
+            Name of the category column of the table.
+        categories : array-like
+            Category labels, one per count.
+        n_event, n_non_event : array-like
+            Event / non-event counts per category.
+        """
+        agg = pd.DataFrame(
+            {
+                feature_col: categories,
+                "n_event": np.asarray(n_event),
+                "n_non_event": np.asarray(n_non_event),
+            }
         )
 
         total_events = agg["n_event"].sum()
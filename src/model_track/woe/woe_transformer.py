@@ -0,0 +1,209 @@
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .woe_calculator import WoeCalculator
+
+
+TOTAL_LABEL = "__TOTAL__"
+
+
+class WoeTransformer:
+    """
+    Transforms categorical features into WOE values by array lookup.
+
+    Each feature's categories are stored in a pd.Index plus a WOE array
+    with two extra slots (unseen, missing). transform() encodes a column
+    into integer positions once (hash lookup, or a remap of the category
+    codes for categorical columns) and indexes the WOE array, instead of
+    Series.map(dict) on object labels.
+
+    Parameters
+    ----------
+    tables : Dict[str, pd.DataFrame or Dict]
+        Per feature, a WoeCalculator.compute_table output (totals row is
+        ignored) or a compute_mapping dict {category: woe}.
+    unseen : str or float
+        Value for categories absent from the table: "nan" (default),
+        "zero", "error" (raise ValueError) or a number.
+    missing : str or float
+        Value for missing entries when the table has no missing-category
+        row (same options as unseen). If the table has that row, its WOE
+        is used.
+    dtype : numpy dtype
+        Output dtype (np.float64 or np.float32).
+    """
+
+    _POLICIES = ("nan", "zero", "error")
+
+    def __init__(
+        self,
+        tables: Dict[str, Union[pd.DataFrame, Dict]],
+        unseen: Union[str, float] = "nan",
+        missing: Union[str, float] = "nan",
+        dtype=np.float64,
+    ):
+        self.unseen = self._check_policy("unseen", unseen)
+        self.missing = self._check_policy("missing", missing)
+        self.dtype = np.dtype(dtype)
+
+        self.features: List[str] = list(tables)
+        self._categories: Dict[str, pd.Index] = {}
+        self._lookup: Dict[str, np.ndarray] = {}
+        self._has_missing: Dict[str, bool] = {}
+
+        for feature, table in tables.items():
+            categories, woe = self._parse_table(feature, table)
+            missing_woe = self._policy_value(self.missing)
+
+            is_missing = pd.isna(categories)
+            self._has_missing[feature] = bool(is_missing.any())
+            if is_missing.any():
+                missing_woe = woe[is_missing][0]
+                categories, woe = categories[~is_missing], woe[~is_missing]
+
+            self._categories[feature] = pd.Index(categories)
+            # slots: [woe por categoria..., unseen, missing]
+            self._lookup[feature] = np.concatenate(
+                [woe, [self._policy_value(self.unseen), missing_woe]]
+            )
+
+    @classmethod
+    def fit(
+        cls,
+        df: pd.DataFrame,
+        target_col: str,
+        feature_cols: List[str],
+        event_value: int = 1,
+        n_jobs: Optional[int] = 1,
+        **kwargs,
+    ) -> "WoeTransformer":
+        """Builds the transformer from WoeCalculator.compute_tables."""
+        tables, _ = WoeCalculator.compute_tables(
+            df, target_col, feature_cols,
+            event_value=event_value, add_totals=False, n_jobs=n_jobs,
+        )
+        return cls(tables, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Transform
+    # ------------------------------------------------------------------
+    def transform(
+        self,
+        df: pd.DataFrame,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Replaces each feature by its WOE values.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Data with the feature columns.
+        columns : List[str], optional
+            Subset of the fitted features (default: all).
+
+        Returns
+        -------
+        pd.DataFrame
+            One WOE column per feature, same index as df.
+        """
+        columns = self.features if columns is None else list(columns)
+
+        unknown = [c for c in columns if c not in self._lookup]
+        if unknown:
+            raise KeyError(f"No WOE table for features: {unknown}")
+
+        missing = [c for c in columns if c not in df.columns]
+        if missing:
+            raise KeyError(f"Columns not found in DataFrame: {missing}")
+
+        out = np.empty((len(df), len(columns)), dtype=self.dtype)
+        for j, column in enumerate(columns):
+            out[:, j] = self.transform_column(df[column])
+
+        return pd.DataFrame(out, index=df.index, columns=columns)
+
+    def transform_column(self, series: pd.Series) -> np.ndarray:
+        """WOE values of one column (series.name must be a fitted feature)."""
+        feature = series.name
+        if feature not in self._lookup:
+            raise KeyError(f"No WOE table for feature '{feature}'")
+
+        categories = self._categories[feature]
+        lookup = self._lookup[feature]
+        n_categories = len(categories)
+
+        codes, is_missing = self._encode(series, categories)
+
+        # -1 -> slot "unseen"; ausentes -> slot "missing"
+        is_unseen = codes < 0
+        if is_unseen.any():
+            if self.unseen == "error" and (is_unseen & ~is_missing).any():
+                examples = pd.unique(series[is_unseen & ~is_missing])[:5]
+                raise ValueError(
+                    f"Unseen categories in feature '{feature}': {list(examples)}"
+                )
+            if (
+                self.missing == "error"
+                and not self._has_missing[feature]
+                and is_missing.any()
+            ):
+                raise ValueError(f"Missing values in feature '{feature}'")
+            codes[is_unseen] = n_categories
+            codes[is_missing] = n_categories + 1
+
+        return lookup[codes].astype(self.dtype, copy=False)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _encode(series: pd.Series, categories: pd.Index):
+        """Positions in categories (-1 = unseen or missing) + missing mask."""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # remapeia só as categorias do dtype, não as linhas
+            position = np.append(categories.get_indexer(series.cat.categories), -1)
+            raw = series.cat.codes.to_numpy()
+            return position[raw], raw < 0
+
+        codes = categories.get_indexer(series)
+
+        # isna só nas linhas sem correspondência (em geral poucas)
+        is_missing = np.zeros(len(codes), dtype=bool)
+        unmatched = np.flatnonzero(codes < 0)
+        is_missing[unmatched] = pd.isna(series.to_numpy()[unmatched])
+        return codes, is_missing
+
+    @staticmethod
+    def _parse_table(feature, table):
+        if isinstance(table, pd.DataFrame):
+            if "woe" not in table.columns:
+                raise ValueError(f"WOE table of '{feature}' has no 'woe' column")
+            label_col = feature if feature in table.columns else table.columns[0]
+            table = table[table[label_col].astype(object) != TOTAL_LABEL]
+            categories = table[label_col].astype(object).to_numpy()
+            woe = table["woe"].to_numpy(dtype=float)
+        else:
+            categories = np.asarray(list(table), dtype=object)
+            woe = np.asarray(list(table.values()), dtype=float)
+        return categories, woe
+
+    def _check_policy(self, name, policy):
+        if isinstance(policy, str):
+            if policy not in self._POLICIES:
+                raise ValueError(
+                    f"{name} must be one of {self._POLICIES} or a number"
+                )
+            return policy
+        return float(policy)
+
+    @staticmethod
+    def _policy_value(policy) -> float:
+        if policy == "zero":
+            return 0.0
+        if isinstance(policy, str):
+            # "nan" e "error" (o erro é levantado no transform)
+            return np.nan
+        return policy
@@ -1,6 +1,7 @@
+import numpy as np
 import pandas as pd
 import pytest
-from model_track.binning import BinApplier
+from model_track.binning import BinApplier, bin_codes
 
 
 @pytest.fixture
@@ -44,8 +45,14 @@ def test_bin_applier_invalid_bins():
     with pytest.raises(ValueError):
         applier.apply("x", [2, 2])
 
-    with pytest.raises(ValueError):
-        applier.apply("x", [])
+
+def test_bin_applier_without_cut_points():
+    # binner sem split (bins_ == []): bin único + "N/A"
+    df = pd.DataFrame({"x": [1.0, 5.0, None]})
+    result = BinApplier(df).apply("x", [])
+
+    assert BinApplier.labels([]) == ["(-inf, inf)", "N/A"]
+    assert result.tolist() == ["(-inf, inf)", "(-inf, inf)", "N/A"]
 
 
 def test_bin_applier_non_dataframe_input():
@@ -70,3 +77,143 @@ def test_bin_applier_with_none_and_nan():
     assert "N/A" in result.values
     assert sorted([v for v in result.unique() if v != "N/A"]) == ["(2, 4]", "<= 2", "> 4"]
 
+
+
+# ------------------------------------------------------------------
+# apply_many
+# ------------------------------------------------------------------
+
+def test_apply_many_matches_apply():
+    df = pd.DataFrame({
+        "age": [10, 20, 30, 40, 50, None],
+        "income": [1.5, None, 3.0, 0.5, 2.0, 9.0],
+    })
+    bins = {"age": [20, 40], "income": [1.0, 2.0]}
+    applier = BinApplier(df)
+
+    codes, labels = applier.apply_many(bins)
+
+    for column, column_bins in bins.items():
+        lookup = labels[labels["feature"] == column].set_index("code")["label"]
+        decoded = codes[column].map(lookup)
+        expected = applier.apply(column, column_bins)
+        assert decoded.tolist() == expected.tolist()
+
+
+def test_apply_many_compact_codes_and_missing_code():
+    df = pd.DataFrame({"x": [1.0, 2.0, None, 4.0]})
+    codes, labels = BinApplier(df).apply_many({"x": [2.0]})
+
+    assert codes["x"].dtype == "int8"
+    assert codes["x"].tolist() == [0, 0, 2, 1]
+    assert labels["label"].tolist() == ["<= 2.0", "> 2.0", "N/A"]
+
+
+def test_apply_many_threaded_same_result():
+    df = pd.DataFrame({f"f{i}": range(i, i + 20) for i in range(6)})
+    bins = {c: [5, 10, 15] for c in df.columns}
+    applier = BinApplier(df)
+
+    sequential, _ = applier.apply_many(bins, n_jobs=1)
+    threaded, _ = applier.apply_many(bins, n_jobs=3)
+
+    pd.testing.assert_frame_equal(sequential, threaded)
+
+
+def test_apply_many_validates_inputs(sample_df):
+    applier = BinApplier(sample_df)
+
+    with pytest.raises(ValueError):
+        applier.apply_many({"unknown": [10]})
+
+    with pytest.raises(ValueError):
+        applier.apply_many({"age": [30, 10]})
+
+
+# ------------------------------------------------------------------
+# Output modes
+# ------------------------------------------------------------------
+
+def test_bin_applier_category_output(sample_df):
+    applier = BinApplier(sample_df)
+    result = applier.apply("age", [20, 40], output="category")
+
+    assert isinstance(result.dtype, pd.CategoricalDtype)
+    assert list(result.cat.categories) == ["<= 20", "(20, 40]", "> 40", "N/A"]
+    assert result.astype(object).tolist() == applier.apply("age", [20, 40]).tolist()
+
+
+def test_bin_applier_codes_output(sample_df):
+    applier = BinApplier(sample_df)
+    result = applier.apply("age", [20, 40], output="codes")
+    labels = applier.labels([20, 40])
+
+    assert result.dtype == "int8"
+    assert result.tolist() == [0, 0, 1, 1, 2, 3]
+    assert labels[-1] == "N/A"
+    assert [labels[c] for c in result] == applier.apply("age", [20, 40]).tolist()
+
+
+def test_bin_applier_invalid_output(sample_df):
+    applier = BinApplier(sample_df)
+    with pytest.raises(ValueError):
+        applier.apply("age", [20], output="unknown")
+
+
+def test_apply_stream_matches_apply_on_chunks():
+    df = pd.DataFrame({
+        "id": range(7),
+        "age": [10, 20, 30, 40, 50, None, 35],
+        "score": [0.1, 0.5, None, 0.9, 0.2, 0.7, 0.4],
+    })
+    bins = {"age": [20, 40], "score": [0.5]}
+    chunks = (df.iloc[i:i + 3] for i in range(0, len(df), 3))
+
+    frames = list(BinApplier.apply_stream(chunks, bins, output="object", keep_columns=["id"]))
+
+    assert [len(f) for f in frames] == [3, 3, 1]
+    result = pd.concat(frames, ignore_index=True)
+    assert list(result.columns) == ["id", "age", "score"]
+    assert result["id"].tolist() == list(range(7))
+
+    applier = BinApplier(df)
+    for column, column_bins in bins.items():
+        assert result[column].tolist() == applier.apply(column, column_bins).tolist()
+
+
+def test_apply_stream_validates_inputs():
+    chunks = [pd.DataFrame({"age": [1.0, 2.0]})]
+
+    with pytest.raises(ValueError):
+        list(BinApplier.apply_stream(chunks, {"missing": [1]}))
+
+    with pytest.raises(ValueError):
+        list(BinApplier.apply_stream(chunks, {"age": [2, 1]}))
+
+    with pytest.raises(ValueError):
+        list(BinApplier.apply_stream(chunks, {"age": [1]}, output="bad"))
+
+
+def test_to_parquet_with_record_batches(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+
+    batches = [
+        pa.RecordBatch.from_pydict({"id": [1, 2], "age": [10.0, None]}),
+        pa.RecordBatch.from_pydict({"id": [3, 4], "age": [30.0, 50.0]}),
+    ]
+    path = tmp_path / "binned.parquet"
+
+    label_table = BinApplier.to_parquet(batches, {"age": [20, 40]}, str(path), keep_columns=["id"])
+
+    result = pd.read_parquet(path)
+    assert result["id"].tolist() == [1, 2, 3, 4]
+    assert result["age"].tolist() == [0, 3, 1, 2]
+    assert label_table["label"].tolist() == ["<= 20", "(20, 40]", "> 40", "N/A"]
+
+
+def test_bin_codes_matches_apply_codes(sample_df):
+    bins = [20, 40]
+    codes = bin_codes(sample_df["age"].to_numpy(dtype=float), bins)
+
+    assert codes.tolist() == [0, 0, 1, 1, 2, 3]
+    assert codes.tolist() == BinApplier(sample_df).apply("age", bins, output="codes").tolist()
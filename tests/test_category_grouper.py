@@ -1,3 +1,8 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_track.binning import SINGLE_BIN_LABEL
 from model_track.stability.category_mapper import CategoryMapper
 
 
@@ -276,3 +281,234 @@ def test_parse_interval_bounded():
     interval = mapper._parse_interval("(3,7]")
 
     assert interval == (3.0, 7.0)
+
+
+# ------------------------------------------------------------------
+# Transform
+# ------------------------------------------------------------------
+
+@pytest.fixture
+def fitted_mapper():
+    mapper = CategoryMapper()
+    mapper.set("grade", {"A": "A|B", "B": "A|B", "C": "C"})
+    mapper.set("score", {"1": "<=2", "2": "<=2", "3": ">=3"})
+    return mapper
+
+
+@pytest.fixture
+def raw_df():
+    return pd.DataFrame(
+        {
+            "grade": ["A", "B", "C", "D", None, "A"],
+            "score": [1, 2, 3, 4, 1, 3],
+        }
+    )
+
+
+def test_transform_matches_string_map(fitted_mapper, raw_df):
+    out = fitted_mapper.transform(raw_df)
+
+    assert list(out.columns) == ["grade", "score"]
+    assert out.index.equals(raw_df.index)
+    for feature in ["grade", "score"]:
+        assert isinstance(out[feature].dtype, pd.CategoricalDtype)
+        expected = raw_df[feature].astype(str).map(fitted_mapper.get(feature))
+        assert out[feature].astype(object).tolist() == expected.tolist()
+
+    assert list(out["grade"].cat.categories) == ["A|B", "C"]
+
+
+def test_transform_missing_values_ignore_nan_keys(raw_df):
+    mapper = CategoryMapper()
+    mapper.set("grade", {"A": "A", "None": "missing", "nan": "missing"})
+    mapper.set("score", {"1.0": "one", "nan": "missing"})
+    df = raw_df.assign(score=[1.0, np.nan, 1.0, 1.0, 1.0, 1.0])
+
+    out = mapper.transform(df)
+
+    # o map de strings usa as chaves "None" / "nan"; o transform não
+    assert df["grade"].astype(str).map(mapper.get("grade"))[4] == "missing"
+    assert df["score"].astype(str).map(mapper.get("score"))[1] == "missing"
+    assert pd.isna(out["grade"].iloc[4])
+    assert pd.isna(out["score"].iloc[1])
+    assert out["score"].iloc[0] == "one"
+
+
+def test_transform_categorical_input(fitted_mapper, raw_df):
+    df = raw_df.astype({"grade": "category"})
+
+    out = fitted_mapper.transform(df, features=["grade"])
+
+    assert out["grade"].astype(object).tolist() == ["A|B", "A|B", "C", np.nan, np.nan, "A|B"]
+
+
+def test_transform_unmapped_policies(fitted_mapper, raw_df):
+    keep = fitted_mapper.transform(raw_df, unmapped="keep")
+    assert keep["grade"].tolist()[3] == "D"
+    assert keep["score"].tolist()[3] == "4"
+    # ausente continua ausente
+    assert pd.isna(keep["grade"].iloc[4])
+
+    other = fitted_mapper.transform(raw_df, unmapped="__OTHER__")
+    assert list(other["grade"].cat.categories) == ["A|B", "C", "__OTHER__"]
+    assert other["grade"].iloc[3] == "__OTHER__"
+
+    with pytest.raises(ValueError, match="'D'"):
+        fitted_mapper.transform(raw_df, unmapped="error")
+
+    # categorias do dtype sem linhas não disparam o erro
+    df = raw_df[raw_df["grade"] != "D"].astype({"grade": "category"})
+    df["grade"] = df["grade"].cat.add_categories(["Z"])
+    fitted_mapper.transform(df, features=["grade"], unmapped="error")
+
+
+def test_transform_integer_codes_with_gaps(fitted_mapper):
+    # faixa densa -3..7: valores do intervalo sem linhas não contam como não mapeados
+    series = pd.Series(np.array([1, 3, 2, 1, -3, 7], dtype=np.int8), name="score")
+    mapper = CategoryMapper()
+    mapper.set("score", {**fitted_mapper.get("score"), "-3": "low", "7": "high"})
+
+    out = mapper.transform_column(series, unmapped="error")
+    kept = mapper.transform_column(series, unmapped="keep")
+
+    assert out.tolist() == ["<=2", ">=3", "<=2", "<=2", "low", "high"]
+    assert list(kept.categories) == ["<=2", ">=3", "low", "high"]
+
+
+def test_transform_unknown_features(fitted_mapper, raw_df):
+    with pytest.raises(KeyError):
+        fitted_mapper.transform(raw_df, features=["missing"])
+
+    mapper = CategoryMapper()
+    mapper.set("other", {"x": "y"})
+    with pytest.raises(KeyError):
+        mapper.transform(raw_df)
+
+
+# ------------------------------------------------------------------
+# Automatic grouping
+# ------------------------------------------------------------------
+
+@pytest.fixture
+def binned_woe_table():
+    # rótulos do BinApplier, na ordem do compute_table (WOE decrescente)
+    return pd.DataFrame(
+        {
+            "x": ["<= 1", "(1, 2]", "> 4", "(2, 3]", "N/A", "(3, 4]", "__TOTAL__"],
+            "n_event": [90, 70, 10, 30, 20, 15, 235],
+            "n_non_event": [100, 110, 120, 140, 60, 150, 680],
+            "woe": [0.0] * 6 + [None],
+        }
+    )
+
+
+def _brute_force_iv(n_event, n_non_event, max_groups, min_exposure):
+    import itertools
+
+    n_event, n_non_event = np.asarray(n_event), np.asarray(n_non_event)
+    total = n_event.sum() + n_non_event.sum()
+    best = -np.inf
+    m = len(n_event)
+    for k in range(1, min(max_groups, m) + 1):
+        for cuts in itertools.combinations(range(1, m), k - 1):
+            bounds = [0, *cuts, m]
+            iv, ok = 0.0, True
+            for a, b in zip(bounds[:-1], bounds[1:]):
+                e, ne = n_event[a:b].sum(), n_non_event[a:b].sum()
+                if e == 0 or ne == 0 or e + ne < min_exposure * total:
+                    ok = False
+                    break
+                er, nr = e / n_event.sum(), ne / n_non_event.sum()
+                iv += (er - nr) * np.log(er / nr)
+            if ok:
+                best = max(best, iv)
+    return best
+
+
+def test_optimal_groups_matches_brute_force():
+    rng = np.random.default_rng(0)
+    for _ in range(30):
+        m = rng.integers(2, 8)
+        n_event = rng.integers(1, 40, m)
+        n_non_event = rng.integers(1, 60, m)
+        order = np.arange(m)
+
+        groups, iv = CategoryMapper.optimal_groups(
+            n_event, n_non_event, max_groups=3, min_exposure=0.1, order=order
+        )
+
+        assert iv == pytest.approx(_brute_force_iv(n_event, n_non_event, 3, 0.1))
+        assert sorted(i for g in groups for i in g) == list(range(m))
+        assert len(groups) <= 3
+
+
+def test_optimal_groups_nominal_sorts_by_event_rate():
+    n_event = np.array([10, 50, 12, 48])
+    n_non_event = np.array([90, 50, 88, 52])
+
+    groups, _ = CategoryMapper.optimal_groups(n_event, n_non_event, max_groups=2, min_exposure=0)
+
+    assert sorted(map(sorted, groups)) == [[0, 2], [1, 3]]
+
+
+def test_optimal_groups_constraints():
+    # nenhum par de grupos atinge 90% de exposição: um grupo só
+    groups, iv = CategoryMapper.optimal_groups([9, 1], [1, 9], max_groups=2, min_exposure=0.9)
+    assert groups == [[1, 0]] and iv == 0
+
+    # categorias fora da busca (N/A sem não-eventos) não entram no IV
+    groups, iv = CategoryMapper.optimal_groups([0, 10, 20, 5], [10, 30, 40, 0], order=[1, 2])
+    assert np.isfinite(iv)
+    er, nr = np.array([10, 20]) / 35, np.array([30, 40]) / 80
+    assert groups == [[1], [2]]
+    assert iv == pytest.approx(((er - nr) * np.log(er / nr)).sum())
+
+    with pytest.raises(ValueError):
+        CategoryMapper.optimal_groups([0, 0], [5, 5])
+
+
+def test_auto_map_ordered_intervals(binned_woe_table):
+    mapper = CategoryMapper()
+
+    mapping = mapper.auto_map(
+        binned_woe_table, "x", "x", max_groups=2, min_exposure=0.1, ordered=True
+    )
+
+    # N/A não é ordenável: fica sozinho
+    assert mapping["N/A"] == "N/A"
+    assert mapping["<= 1"] == mapping["(1, 2]"] == "<=2"
+    assert mapping["(2, 3]"] == mapping["(3, 4]"] == mapping["> 4"] == ">2"
+    assert mapper.get("x") is mapping
+
+    mapping = mapper.auto_map(
+        binned_woe_table, "x", "x", max_groups=3, min_exposure=0.1, ordered=True
+    )
+    assert mapping["(2, 3]"] == "(2, 3]"
+    assert mapping["(3, 4]"] == mapping["> 4"] == ">3"
+
+
+def test_auto_map_numeric_and_nominal(global_woe_numeric_category_mapper):
+    table = global_woe_numeric_category_mapper.assign(
+        n_event=[80, 70, 40, 30, 10, 5, 235],
+        n_non_event=[20, 30, 60, 70, 90, 95, 365],
+    )
+    mapper = CategoryMapper()
+
+    ordered = mapper.auto_map(table, "income", "income", max_groups=3, min_exposure=0.2, ordered=True)
+    assert ordered["10"] == ordered["20"] == "<=20"
+    assert ordered["50"] == ordered["60"] == ">=50"
+
+    nominal = mapper.auto_map(table, "income_nominal", "income", max_groups=2, min_exposure=0.2)
+    assert nominal["10"] == nominal["20"]
+    assert nominal["50"] == nominal["60"]
+    assert nominal["10"] != nominal["60"]
+    assert " | " in nominal["10"]
+
+
+def test_merge_interval_labels_with_open_upper_bin():
+    mapper = CategoryMapper()
+
+    assert mapper._merge_interval_labels(["(2, 3]", "> 3"]) == ">2"
+    assert mapper._merge_interval_labels(["<= 1", "(1, 2]", "> 2"]) == SINGLE_BIN_LABEL
+    assert mapper._parse_interval(SINGLE_BIN_LABEL) == (-np.inf, np.inf)
+    assert mapper._parse_interval("> 3.5") == (3.5, float("inf"))
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_track.binning import BinApplier, QuantileBinner, TreeBinner
+from model_track.selection import IvScreener
+from model_track.woe import WoeCalculator
+
+
+@pytest.fixture
+def screening_df():
+    rng = np.random.default_rng(21)
+    n = 4000
+    signal = rng.normal(size=n)
+    target = (rng.random(n) < 1 / (1 + np.exp(-2 * signal))).astype(int)
+    df = pd.DataFrame(
+        {
+            "strong": signal + rng.normal(scale=0.3, size=n),
+            "weak": signal + rng.normal(scale=3.0, size=n),
+            "noise_1": rng.normal(size=n),
+            "noise_2": rng.uniform(size=n),
+            "target": target,
+        }
+    )
+    df.loc[df.sample(200, random_state=1).index, "strong"] = np.nan
+    return df
+
+
+def test_iv_matches_woe_table(screening_df):
+    ranking = IvScreener(binner=QuantileBinner(n_bins=5)).screen(screening_df, "target")
+
+    assert ranking["feature"].iloc[0] == "strong"
+    assert set(ranking["feature"]) == {"strong", "weak", "noise_1", "noise_2"}
+
+    bins = QuantileBinner(n_bins=5).fit(screening_df, "strong").bins_
+    binned = screening_df.assign(strong=BinApplier(screening_df).apply("strong", bins))
+    table = WoeCalculator.compute_table(binned, "target", "strong")
+
+    iv = ranking.set_index("feature").loc["strong", "iv"]
+    assert np.isclose(iv, table["iv_total"].iloc[0], atol=1e-4)
+    assert ranking.set_index("feature").loc["strong", "n_bins"] == 5
+
+
+def test_sample_pruning(screening_df):
+    screener = IvScreener(
+        binner=TreeBinner(max_depth=2, min_samples_leaf=50),
+        min_iv=0.1,
+        sample_size=1000,
+        random_state=0,
+    )
+    ranking = screener.screen(screening_df, "target")
+
+    pruned = ranking[ranking["pruned"]]
+    assert set(pruned["feature"]) == {"noise_1", "noise_2"}
+    assert pruned["iv"].isna().all()
+    assert ranking["iv_sample"].notna().all()
+
+    # ranking: não podados primeiro, por IV
+    assert ranking["feature"].tolist()[:2] == ["strong", "weak"]
+    assert ranking.loc[~ranking["pruned"], "passed"].all()
+
+    assert set(screener.timings_) == {"setup", "sample", "exact", "total"}
+    assert (ranking["seconds"] > 0).all()
+
+
+def test_threads_match_sequential(screening_df):
+    sequential = IvScreener().screen(screening_df, "target")
+    threaded = IvScreener(n_jobs=2).screen(screening_df, "target")
+
+    pd.testing.assert_frame_equal(
+        sequential.drop(columns="seconds"), threaded.drop(columns="seconds")
+    )
+
+
+def test_validations(screening_df):
+    with pytest.raises(KeyError):
+        IvScreener().screen(screening_df, "target", features=["missing"])
+
+    with pytest.raises(KeyError):
+        IvScreener().screen(screening_df, "missing")
+
+    with pytest.raises(ValueError):
+        IvScreener(sample_size=0)
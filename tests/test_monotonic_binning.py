@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_track.binning import BinApplier, MonotonicBinner
+from model_track.woe import WoeCalculator
+
+
+@pytest.fixture
+def monotonic_df():
+    rng = np.random.default_rng(7)
+    x = rng.uniform(0, 100, size=20_000)
+    # event rate decreases with x, plus noise
+    p = 0.4 - 0.003 * x + 0.03 * np.sin(x / 3)
+    y = (rng.uniform(size=len(x)) < p).astype(int)
+    x[rng.uniform(size=len(x)) < 0.02] = np.nan
+    return pd.DataFrame({"x": x, "y": y})
+
+
+def _woe_by_bin(df, bins):
+    binned = df.assign(x_cat=BinApplier(df).apply("x", bins, output="codes"))
+    binned = binned[binned["x"].notna()]
+    table = WoeCalculator.compute_table(binned, "y", "x_cat", add_totals=False)
+    return table.sort_values("x_cat")["woe"].to_numpy()
+
+
+def test_monotonic_binner_produces_monotonic_woe(monotonic_df):
+    binner = MonotonicBinner(n_prebins=30, min_bin_size=0.05)
+    binner.fit(monotonic_df, feature="x", target="y")
+
+    woe = _woe_by_bin(monotonic_df, binner.bins_)
+
+    assert len(binner.bins_) > 1
+    assert binner.bins_ == sorted(binner.bins_)
+    assert (np.diff(woe) < 0).all()
+
+
+def test_monotonic_binner_min_bin_size(monotonic_df):
+    binner = MonotonicBinner(n_prebins=50, min_bin_size=0.15)
+    binner.fit(monotonic_df, feature="x", target="y")
+
+    sizes = binner.n_event_ + binner.n_non_event_
+    assert (sizes / sizes.sum() >= 0.15).all()
+
+
+def test_monotonic_binner_min_iv_reduces_bins(monotonic_df):
+    loose = MonotonicBinner(n_prebins=30, min_bin_size=0.01).fit(monotonic_df, "x", "y")
+    strict = MonotonicBinner(n_prebins=30, min_bin_size=0.01, min_iv=0.02).fit(monotonic_df, "x", "y")
+
+    assert len(strict.bins_) < len(loose.bins_)
+    assert strict.iv_ <= loose.iv_
+
+
+def test_fit_counts_pool_adjacent_violators():
+    binner = MonotonicBinner(min_bin_size=0.0, direction="ascending")
+    binner.fit_counts(
+        edges=[1.0, 2.0, 3.0, 4.0],
+        n_event=[10, 30, 20, 40, 60],
+        n_non_event=[90, 70, 80, 60, 40],
+    )
+
+    # bins 2 e 3 violam a ordem e são agrupados
+    assert binner.bins_ == [1.0, 3.0, 4.0]
+    assert binner.n_event_.tolist() == [10, 50, 40, 60]
+
+
+def test_fit_counts_auto_direction():
+    binner = MonotonicBinner(min_bin_size=0.0)
+    binner.fit_counts(
+        edges=[1.0, 2.0],
+        n_event=[60, 30, 10],
+        n_non_event=[40, 70, 90],
+    )
+
+    assert binner.bins_ == [1.0, 2.0]
+    assert binner.iv_ > 0
+
+
+def test_fit_counts_invalid_inputs():
+    with pytest.raises(ValueError):
+        MonotonicBinner(direction="up").fit_counts([1.0], [1, 2], [2, 1])
+
+    with pytest.raises(ValueError):
+        MonotonicBinner().fit_counts([1.0], [1, 2, 3], [2, 1, 0])
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_track.binning import QuantileBinner, TreeBinner
+
+
+@pytest.fixture
+def wide_df():
+    rng = np.random.default_rng(3)
+    n = 3000
+    data = {f"f{i}": rng.normal(i, 1 + i, size=n) for i in range(6)}
+    df = pd.DataFrame(data)
+    df.loc[rng.uniform(size=n) < 0.05, "f1"] = np.nan
+    df["y"] = (rng.uniform(size=n) < 1 / (1 + np.exp(-df["f0"]))).astype(int)
+    df.loc[::97, "y"] = np.nan
+    return df
+
+
+FEATURES = [f"f{i}" for i in range(6)]
+
+
+def test_tree_fit_many_matches_fit(wide_df):
+    binner = TreeBinner(max_depth=2, min_samples_leaf=100)
+
+    result = binner.fit_many(wide_df, FEATURES, target="y")
+
+    for feature in FEATURES:
+        expected = TreeBinner(max_depth=2, min_samples_leaf=100).fit(wide_df, feature, "y").bins_
+        assert result[feature] == expected
+
+
+def test_quantile_fit_many_matches_fit(wide_df):
+    result = QuantileBinner(n_bins=5).fit_many(wide_df, FEATURES)
+
+    for feature in FEATURES:
+        assert result[feature] == QuantileBinner(n_bins=5).fit(wide_df, feature).bins_
+
+
+@pytest.mark.parametrize("binner", [TreeBinner(max_depth=3, min_samples_leaf=50), QuantileBinner(n_bins=4)])
+def test_fit_many_processes_match_sequential(wide_df, binner):
+    sequential = binner.fit_many(wide_df, FEATURES, target="y", n_jobs=1)
+    parallel = binner.fit_many(wide_df, FEATURES, target="y", n_jobs=2)
+
+    assert parallel == sequential
+    assert binner.bins_ == []
+
+
+def test_fit_many_missing_column(wide_df):
+    with pytest.raises(KeyError):
+        TreeBinner().fit_many(wide_df, ["f0", "unknown"], target="y")
+
+    with pytest.raises(ValueError):
+        QuantileBinner().fit_many(wide_df, FEATURES, n_jobs=0)
+
+
+def test_fit_arrays_matches_fit_without_touching_bins(wide_df):
+    x = wide_df["f1"].to_numpy(dtype=float)
+    y = wide_df["y"].to_numpy(dtype=float)
+
+    for binner in (QuantileBinner(n_bins=5), TreeBinner(max_depth=2)):
+        cuts = binner.fit_arrays(x, y)
+        assert binner.bins_ == []
+        assert cuts == binner.fit(wide_df, "f1", "y").bins_
@@ -37,4 +37,49 @@ def test_quantile_binner_few_distinct():
     df = pd.DataFrame({"x": [1, 2, 2, 2, 3, 3, 4, 4, 5]})
     qb = QuantileBinner(n_bins=0)
     qb.fit(df, "x")
-    assert qb.bins_ == []
\ No newline at end of file
+    assert qb.bins_ == []
+
+def test_quantile_binner_partial_fit_small_data():
+    df = pd.DataFrame({"x": np.arange(1, 101)})
+
+    qb = QuantileBinner(n_bins=4)
+    for chunk in np.array_split(df, 5):
+        qb.partial_fit(chunk, "x")
+
+    # sem compactação no sketch: os cortes são valores observados
+    assert qb.bins_ == [25.0, 50.0, 75.0]
+
+
+def test_quantile_binner_partial_fit_approximates_fit():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x": rng.normal(size=50_000)})
+
+    exact = QuantileBinner(n_bins=4).fit(df, "x")
+    streaming = QuantileBinner(n_bins=4, random_state=0)
+    for chunk in np.array_split(df, 10):
+        streaming.partial_fit(chunk, "x")
+
+    # ~1.3% de erro de rank na normal padrão ≈ 0.05 em valor
+    assert np.allclose(streaming.bins_, exact.bins_, atol=0.05)
+
+
+def test_quantile_binner_merge_workers():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"x": rng.uniform(0, 100, size=40_000)})
+    chunks = np.array_split(df, 4)
+
+    workers = [QuantileBinner(n_bins=2, random_state=i).partial_fit(c, "x") for i, c in enumerate(chunks)]
+    combined = QuantileBinner(n_bins=2)
+    for worker in workers:
+        combined.merge(worker)
+
+    assert len(combined.bins_) == 1
+    assert abs(combined.bins_[0] - 50) < 2
+
+
+def test_quantile_binner_partial_fit_low_unique():
+    qb = QuantileBinner(n_bins=3)
+    qb.partial_fit(pd.DataFrame({"x": [10, 10]}), "x")
+    qb.partial_fit(pd.DataFrame({"x": [10, None]}), "x")
+
+    assert qb.bins_ == []
@@ -0,0 +1,78 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from model_track.binning import QuantileSketch
+
+
+def _rank_errors(sketch, values, q):
+    sorted_values = np.sort(values)
+    ranks = np.searchsorted(sorted_values, sketch.quantiles(q)) / len(values)
+    return np.abs(ranks - q)
+
+
+def test_sketch_rank_error_within_bound():
+    values = np.random.default_rng(0).lognormal(size=200_000)
+    sketch = QuantileSketch(k=200, random_state=0)
+
+    for chunk in np.array_split(values, 10):
+        sketch.update(chunk)
+
+    q = np.array([0.1, 0.25, 0.5, 0.75, 0.9])
+
+    assert sketch.n == len(values)
+    assert (_rank_errors(sketch, values, q) <= sketch.normalized_rank_error()).all()
+
+
+def test_sketch_memory_is_bounded():
+    sketch = QuantileSketch(k=64, random_state=0)
+    sketch.update(np.arange(1_000_000, dtype=float))
+
+    retained = sum(len(level) for level in sketch._levels)
+    assert retained < 3 * 64
+
+
+def test_sketch_merge_matches_single_stream():
+    values = np.random.default_rng(1).normal(size=100_000)
+    parts = [
+        QuantileSketch(k=200, random_state=i).update(chunk)
+        for i, chunk in enumerate(np.array_split(values, 4))
+    ]
+
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+
+    q = np.array([0.2, 0.5, 0.8])
+    assert merged.n == len(values)
+    assert (_rank_errors(merged, values, q) <= merged.normalized_rank_error()).all()
+
+
+def test_sketch_extremes_are_exact_and_nans_ignored():
+    sketch = QuantileSketch(k=16).update([3.0, np.nan, -1.0, 7.5])
+
+    assert sketch.n == 3
+    assert sketch.quantiles([0.0, 1.0]).tolist() == [-1.0, 7.5]
+
+
+def test_sketch_serialization_roundtrip():
+    sketch = QuantileSketch(k=32, random_state=0).update(np.arange(1000.0))
+
+    restored = QuantileSketch.from_dict(sketch.to_dict())
+    unpickled = pickle.loads(pickle.dumps(sketch))
+
+    q = [0.25, 0.5, 0.75]
+    assert restored.quantiles(q).tolist() == sketch.quantiles(q).tolist()
+    assert unpickled.quantiles(q).tolist() == sketch.quantiles(q).tolist()
+
+
+def test_sketch_invalid_usage():
+    with pytest.raises(ValueError):
+        QuantileSketch(k=2)
+
+    with pytest.raises(ValueError):
+        QuantileSketch().quantiles([0.5])
+
+    with pytest.raises(ValueError):
+        QuantileSketch().merge("not a sketch")
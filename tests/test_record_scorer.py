@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_track.binning import QuantileBinner
+from model_track.scoring import RecordScorer, benchmark_latency
+
+
+@pytest.fixture
+def scorer():
+    bins = {"age": [30.0, 50.0], "income": [1000.0]}
+    woe = {
+        "age": {"<= 30.0": 0.4, "(30.0, 50.0]": 0.1, "> 50.0": -0.3, "N/A": 0.05},
+        "income": {"<= 1000.0": 0.7, "> 1000.0": -0.2},
+    }
+    return RecordScorer.from_fitted(bins, woe, default_woe=0.0)
+
+
+def test_score_record_matches_artifact(scorer):
+    records = [
+        {"age": 30.0, "income": 1000.5},
+        {"age": 31, "income": None},
+        {"age": float("nan"), "income": 10.0},
+        {"income": 5000.0},
+    ]
+
+    scored = [scorer.score_record(r) for r in records]
+
+    assert scored[0] == {"age": 0.4, "income": -0.2}
+    assert scored[1] == {"age": 0.1, "income": 0.0}
+    assert scored[2] == {"age": 0.05, "income": 0.7}
+    assert scored[3] == {"age": 0.05, "income": -0.2}
+
+    X = np.array([[r.get("age", np.nan), r.get("income") or np.nan] for r in records], dtype=float)
+    expected = np.array([[s["age"], s["income"]] for s in scored])
+    assert np.allclose(scorer.score_array(X), expected)
+
+
+def test_score_batches(scorer):
+    records = [{"age": float(a), "income": 900.0} for a in range(10, 80, 7)]
+
+    batches = list(scorer.score_batches(records, batch_size=4))
+
+    assert [len(b) for b in batches] == [4, 4, 2]
+    stacked = np.vstack(batches)
+    assert stacked[:, 0].tolist() == [scorer.score_record(r)["age"] for r in records]
+
+    with pytest.raises(ValueError):
+        list(scorer.score_batches(records, batch_size=0))
+
+
+def test_from_fitted_accepts_binners():
+    df = pd.DataFrame({"x": np.arange(100.0)})
+    binner = QuantileBinner(n_bins=2).fit(df, "x")
+
+    scorer = RecordScorer.from_fitted({"x": binner}, {"x": {"<= 49.5": 1.0, "> 49.5": -1.0}})
+
+    assert scorer.score_record({"x": 10}) == {"x": 1.0}
+    assert scorer.score_record({"x": 60}) == {"x": -1.0}
+
+
+def test_benchmark_latency_reports_percentiles(scorer):
+    records = [{"age": float(i % 90), "income": float(i)} for i in range(500)]
+
+    report = benchmark_latency(scorer, records, n_warmup=10)
+
+    assert report["n_records"] == 500
+    assert 0 < report["p50_us"] <= report["p99_us"]
+
+    with pytest.raises(ValueError):
+        benchmark_latency(scorer, [])
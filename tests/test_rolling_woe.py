@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_track.woe import RollingWoe, WoeCalculator
+
+
+@pytest.fixture
+def monthly_df():
+    rng = np.random.default_rng(11)
+    months = [f"2024-{m:02d}" for m in range(1, 7)]
+    n = 120
+    return pd.DataFrame(
+        {
+            "month": np.repeat(months, n),
+            "feature": rng.choice(["A", "B", "C", None], n * len(months)),
+            "target": rng.integers(0, 2, n * len(months)),
+        }
+    )
+
+
+def _month(df, month):
+    return df[df["month"] == month]
+
+
+def test_fixed_window_matches_recompute(monthly_df):
+    rolling = RollingWoe("feature", "target", window=3)
+    months = sorted(monthly_df["month"].unique())
+
+    for i, month in enumerate(months):
+        table = rolling.update(_month(monthly_df, month), "month")
+
+        window = monthly_df[monthly_df["month"].isin(months[max(0, i - 2):i + 1])]
+        expected = WoeCalculator.compute_table(window, "target", "feature")
+        pd.testing.assert_frame_equal(table, expected)
+
+    assert rolling.periods == months[-3:]
+
+    history = rolling.iv_history()
+    assert history["period"].tolist() == months
+    assert history["n_periods"].tolist() == [1, 2, 3, 3, 3, 3]
+
+
+def test_expanding_window_and_multi_period_update(monthly_df):
+    rolling = RollingWoe("feature", "target", window=None)
+
+    # vários períodos de uma vez + dado atrasado de um período existente
+    rolling.update(monthly_df.iloc[:500], "month")
+    table = rolling.update(monthly_df.iloc[500:], "month")
+
+    expected = WoeCalculator.compute_table(monthly_df, "target", "feature")
+    pd.testing.assert_frame_equal(table, expected)
+    assert len(rolling.periods) == 6
+
+
+def test_save_and_load(tmp_path, monthly_df):
+    rolling = RollingWoe("feature", "target", window=2)
+    rolling.update(_month(monthly_df, "2024-01"), "month")
+    rolling.update(_month(monthly_df, "2024-02"), "month")
+
+    path = tmp_path / "rolling.pkl"
+    rolling.save(str(path))
+    restored = RollingWoe.load(str(path))
+
+    pd.testing.assert_frame_equal(restored.table(), rolling.table())
+    assert restored.periods == rolling.periods
+
+    # continua de onde parou
+    table = restored.update(_month(monthly_df, "2024-03"), "month")
+    expected = WoeCalculator.compute_table(
+        monthly_df[monthly_df["month"].isin(["2024-02", "2024-03"])], "target", "feature"
+    )
+    pd.testing.assert_frame_equal(table, expected)
+    assert len(restored.iv_history()) == 3
+
+
+def test_invalid_window():
+    with pytest.raises(ValueError):
+        RollingWoe("feature", "target", window=0)
+
+
+def test_period_without_events_is_accepted():
+    rolling = RollingWoe("feature", "target", window=2)
+    first = pd.DataFrame(
+        {"month": "2024-01", "feature": ["A", "B", "A", "B"], "target": [1, 0, 0, 1]}
+    )
+    second = pd.DataFrame({"month": "2024-02", "feature": ["A", "B"], "target": [0, 0]})
+
+    rolling.update(first, "month")
+    table = rolling.update(second, "month")
+
+    expected = WoeCalculator.compute_table(pd.concat([first, second]), "target", "feature")
+    pd.testing.assert_frame_equal(table, expected)
+
+
+def test_non_binary_batch_raises_without_changing_state(monthly_df):
+    rolling = RollingWoe("feature", "target", window=3)
+    rolling.update(_month(monthly_df, "2024-01"), "month")
+
+    bad = pd.DataFrame({"month": "2024-02", "feature": ["A", "B", "C"], "target": [0, 1, 2]})
+    with pytest.raises(ValueError, match="binary"):
+        rolling.update(bad, "month")
+    assert rolling.periods == ["2024-01"]
+
+
+def test_batch_conflicting_with_window_leaves_state_unchanged():
+    rolling = RollingWoe("feature", "target", window=2)
+    for month, target in ((1, [1, 0, 0, 1]), (2, [0, 1, 1, 0])):
+        rolling.update(
+            pd.DataFrame({"month": month, "feature": ["A", "B", "A", "B"], "target": target}),
+            "month",
+        )
+    before = rolling.table()
+
+    # binário no lote, mas {0, 1, 2} na janela
+    conflicting = pd.DataFrame({"month": 3, "feature": ["A", "B"], "target": [1, 2]})
+    with pytest.raises(ValueError, match="binary"):
+        rolling.update(conflicting, "month")
+
+    assert rolling.periods == [1, 2]
+    assert rolling.target_values == [1, 0]
+    assert len(rolling.iv_history()) == 2
+    pd.testing.assert_frame_equal(rolling.table(), before)
+
+
+def test_check_target_requires_event_value():
+    rolling = RollingWoe("feature", "target", window=None)
+    rolling.update(pd.DataFrame({"month": 1, "feature": ["A", "B"], "target": [0, 1]}), "month")
+
+    assert rolling.check_target([0]) == [0, 1]
+    with pytest.raises(ValueError):
+        RollingWoe("feature", "target").check_target([0, 2])
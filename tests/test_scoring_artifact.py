@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_track.binning import BinApplier, QuantileBinner
+from model_track.scoring import ScoringArtifact
+from model_track.stability import CategoryMapper
+from model_track.woe import WoeCalculator
+
+
+@pytest.fixture
+def scoring_setup():
+    rng = np.random.default_rng(11)
+    n = 2000
+    df = pd.DataFrame({
+        "age": rng.uniform(18, 80, size=n).round(0),
+        "income": rng.lognormal(8, 0.5, size=n),
+    })
+    df.loc[rng.uniform(size=n) < 0.05, "income"] = np.nan
+    df["y"] = (rng.uniform(size=n) < np.where(df["age"] < 30, 0.3, 0.1)).astype(int)
+
+    bins = {"age": [30.0, 45.0, 60.0], "income": [2500.0, 4000.0]}
+    applier = BinApplier(df)
+    for feature, feature_bins in bins.items():
+        df[f"{feature}_cat"] = applier.apply(feature, feature_bins)
+
+    # agrupa as duas últimas faixas de idade
+    mapper = CategoryMapper()
+    mapper.set("age", {"(45.0, 60.0]": "> 45.0", "> 60.0": "> 45.0"})
+    df["age_grp"] = df["age_cat"].map(lambda v: mapper.get("age").get(v, v))
+
+    woe = {
+        "age": WoeCalculator.compute_mapping(df, "y", "age_grp"),
+        "income": WoeCalculator.compute_mapping(df, "y", "income_cat"),
+    }
+    return df, bins, mapper, woe
+
+
+def _expected(df, woe):
+    return pd.DataFrame({
+        "age": df["age_grp"].map(woe["age"]),
+        "income": df["income_cat"].map(woe["income"]),
+    })
+
+
+def test_transform_matches_string_chain(scoring_setup):
+    df, bins, mapper, woe = scoring_setup
+    artifact = ScoringArtifact.compile(bins, woe, category_maps=mapper.get())
+
+    result = artifact.transform(df[["age", "income"]])
+
+    pd.testing.assert_frame_equal(result, _expected(df, woe))
+
+
+def test_transform_accepts_arrays_and_dicts(scoring_setup):
+    df, bins, mapper, woe = scoring_setup
+    artifact = ScoringArtifact.compile(bins, woe, category_maps=mapper.get())
+    expected = _expected(df, woe).to_numpy()
+
+    from_array = artifact.transform(df[["age", "income"]].to_numpy())
+    from_dict = artifact.transform({"age": df["age"].to_numpy(), "income": df["income"].to_numpy()})
+
+    assert np.allclose(from_array, expected)
+    assert np.allclose(from_dict, expected)
+
+
+def test_save_and_load_memory_mapped(tmp_path, scoring_setup):
+    df, bins, mapper, woe = scoring_setup
+    artifact = ScoringArtifact.compile(bins, woe, category_maps=mapper.get())
+    artifact.save(str(tmp_path / "artifact"))
+
+    loaded = ScoringArtifact.load(str(tmp_path / "artifact"))
+
+    assert isinstance(loaded.arrays["edges"], np.memmap)
+    assert loaded.features == ["age", "income"]
+    assert loaded.group_labels["age"][-2:] == ["> 45.0", "N/A"]
+    pd.testing.assert_frame_equal(
+        loaded.transform(df[["age", "income"]]),
+        artifact.transform(df[["age", "income"]]),
+    )
+
+
+def test_unseen_labels_use_default_woe():
+    artifact = ScoringArtifact.compile(
+        bins={"x": [1.0]},
+        woe={"x": {"<= 1.0": 0.5}},
+        default_woe=-9.0,
+    )
+
+    result = artifact.transform(np.array([[0.0], [2.0], [np.nan]]))
+
+    assert result[:, 0].tolist() == [0.5, -9.0, -9.0]
+
+
+def test_public_lookup_accessors_are_read_only():
+    artifact = ScoringArtifact.compile(
+        bins={"x": [1.0, 2.0], "z": [0.0]},
+        woe={"x": {"<= 1.0": 0.5, "(1.0, 2.0]": 0.1, "> 2.0": -0.2, "N/A": 0.0},
+             "z": {"<= 0.0": 0.3}},
+        default_woe=-9.0,
+    )
+
+    assert [e.tolist() for e in artifact.edges] == [[1.0, 2.0], [0.0]]
+    assert [w.tolist() for w in artifact.code_woe] == [
+        [0.5, 0.1, -0.2, 0.0],
+        [0.3, -9.0, -9.0],
+    ]
+
+    with pytest.raises(ValueError):
+        artifact.edges[0][0] = 5.0
+    with pytest.raises(ValueError):
+        artifact.code_woe[0][0] = 5.0
+    assert artifact.transform(np.array([[0.5, -1.0]])).tolist() == [[0.5, 0.3]]
+
+
+def test_compile_and_transform_validation():
+    with pytest.raises(KeyError):
+        ScoringArtifact.compile(bins={"x": [1.0]}, woe={})
+
+    artifact = ScoringArtifact.compile(bins={"x": [1.0]}, woe={"x": {}})
+    with pytest.raises(ValueError):
+        artifact.transform(np.zeros((3, 2)))
+    with pytest.raises(KeyError):
+        artifact.transform(pd.DataFrame({"y": [1.0]}))
+
+
+def test_compile_feature_without_cut_points(tmp_path):
+    # binner sem split: bins_ == []
+    df = pd.DataFrame(
+        {
+            "x": [1.0, 1.0, 2.0, np.nan, np.nan, 1.0],
+            "y": [-1.0, 1.0, 1.0, -1.0, 1.0, -1.0],
+            "target": [1, 0, 1, 0, 1, 0],
+        }
+    )
+    binner = QuantileBinner()
+    binner.fit(df, "x")
+    assert binner.bins_ == []
+
+    bins = {"x": binner, "y": [0.0]}
+    binned = df.assign(
+        x=BinApplier(df).apply("x", binner.bins_), y=BinApplier(df).apply("y", [0.0])
+    )
+    woe = {f: WoeCalculator.compute_mapping(binned, "target", f) for f in ("x", "y")}
+    artifact = ScoringArtifact.compile(bins=bins, woe=woe, default_woe=-99.0)
+
+    expected = np.column_stack([binned["x"].map(woe["x"]), binned["y"].map(woe["y"])])
+    assert np.isfinite(expected).all() and (expected != -99.0).all()
+    np.testing.assert_allclose(artifact.transform(df).to_numpy(), expected)
+
+    artifact.save(str(tmp_path / "artifact"))
+    restored = ScoringArtifact.load(str(tmp_path / "artifact"))
+    np.testing.assert_allclose(restored.transform(df).to_numpy(), expected)
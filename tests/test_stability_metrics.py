@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_track.stability import StabilityMetrics
+from model_track.woe import WoeByPeriod
+
+
+@pytest.fixture
+def drift_df():
+    rng = np.random.default_rng(0)
+    n = 3000
+    df = pd.DataFrame(
+        {
+            "period": np.repeat(pd.date_range("2024-01", periods=3, freq="MS"), n // 3),
+            "bin": rng.integers(0, 4, n),
+            "cat": pd.Categorical(rng.choice(list("xyz"), n)),
+            "obj": rng.choice(["u", "v", None], n),
+            "target": rng.integers(0, 2, n),
+        }
+    )
+    # último período desloca a distribuição de 'bin'
+    df.loc[2000:, "bin"] = rng.integers(2, 6, 1000)
+    return df
+
+
+def _manual_psi(expected, actual, epsilon=1e-4):
+    e = expected.value_counts(normalize=True, dropna=False)
+    a = actual.value_counts(normalize=True, dropna=False)
+    index = e.index.union(a.index)
+    e = e.reindex(index, fill_value=0).clip(lower=epsilon)
+    a = a.reindex(index, fill_value=0).clip(lower=epsilon)
+    return float(((a - e) * np.log(a / e)).sum())
+
+
+def test_psi_matches_manual_computation(drift_df):
+    metrics = StabilityMetrics().fit(drift_df, "period", target_col="target")
+    psi = metrics.psi()
+
+    assert list(psi.columns) == ["bin", "cat", "obj"]
+    assert (psi.iloc[0] == 0).all()
+
+    first, _, last = metrics.periods_
+    for feature in ["bin", "cat", "obj"]:
+        expected = _manual_psi(
+            drift_df.loc[drift_df["period"] == first, feature],
+            drift_df.loc[drift_df["period"] == last, feature],
+        )
+        assert psi.loc[last, feature] == pytest.approx(expected, abs=1e-4)
+
+    assert psi.loc[last, "bin"] > 0.25
+
+
+def test_reference_options(drift_df):
+    metrics = StabilityMetrics().fit(drift_df, "period", ["bin"])
+    periods = metrics.periods_
+
+    previous = metrics.psi("previous")
+    assert previous.iloc[0].isna().all()
+    assert previous.iloc[1, 0] == metrics.psi().iloc[1, 0]
+
+    fixed = metrics.psi(periods[2])
+    assert fixed.loc[periods[2], "bin"] == 0
+
+    with pytest.raises(KeyError):
+        metrics.psi(pd.Timestamp("1999-01-01"))
+
+
+def test_drift_woe_matches_woe_by_period(drift_df):
+    metrics = StabilityMetrics().fit(drift_df, "period", ["cat"], target_col="target")
+    drift = metrics.drift()
+
+    csi = drift.groupby("period")["csi"].sum()
+    np.testing.assert_allclose(csi.to_numpy(), metrics.psi()["cat"].to_numpy(), atol=1e-3)
+
+    expected = WoeByPeriod.compute(drift_df, "target", "cat", "period")
+    merged = drift.merge(
+        expected.rename(columns={"cat": "bin"}).astype({"bin": object}),
+        on=["period", "bin"],
+        suffixes=("", "_expected"),
+    )
+    assert len(merged) == len(drift)
+    np.testing.assert_allclose(merged["woe"], merged["woe_expected"], atol=1e-4)
+
+    first = drift[drift["period"] == metrics.periods_[0]]
+    assert (first["woe_drift"] == 0).all()
+    assert (first["event_rate_drift"] == 0).all()
+
+
+def test_woe_matrix_matches_compute_matrix(drift_df):
+    metrics = StabilityMetrics().fit(drift_df, "period", ["bin", "cat"], target_col="target")
+
+    for feature in ("bin", "cat"):
+        expected = WoeByPeriod.compute_matrix(drift_df, "target", feature, "period")
+        result = metrics.woe_matrix(feature)
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-4)
+        assert list(result.columns) == list(expected.columns)
+
+    assert list(metrics.woe_matrices()) == ["bin", "cat"]
+    with pytest.raises(KeyError):
+        metrics.woe_matrix("obj")
+    with pytest.raises(ValueError):
+        StabilityMetrics().fit(drift_df, "period", ["bin"]).woe_matrices()
+
+
+def test_drift_rows_for_bins_missing_in_one_side(drift_df):
+    metrics = StabilityMetrics().fit(drift_df, "period", ["bin"])
+    drift = metrics.drift()
+    last = drift[drift["period"] == metrics.periods_[-1]]
+
+    # bins 0/1 só na referência, 4/5 só no último período
+    assert sorted(last["bin"]) == [0, 1, 2, 3, 4, 5]
+    assert (last.loc[last["bin"].isin([0, 1]), "n"] == 0).all()
+    assert (last.loc[last["bin"].isin([4, 5]), "ref_share"] == 0).all()
+    assert "woe" not in drift.columns
+
+
+def test_summary_has_one_row_per_period_and_feature(drift_df):
+    metrics = StabilityMetrics().fit(drift_df, "period", target_col="target")
+    summary = metrics.summary()
+
+    assert len(summary) == 3 * 3
+    assert list(summary.columns) == [
+        "period", "feature", "psi", "max_event_rate_drift", "max_woe_drift",
+    ]
+    pd.testing.assert_series_equal(
+        summary.set_index(["period", "feature"])["psi"],
+        metrics.psi().stack().rename("psi").reorder_levels(["period", "feature"]),
+        check_names=False,
+    )
+
+
+def test_validation_errors(drift_df):
+    with pytest.raises(KeyError):
+        StabilityMetrics().fit(drift_df, "missing")
+
+    with pytest.raises(KeyError):
+        StabilityMetrics().fit(drift_df, "period", ["missing"])
+
+    raw = drift_df.assign(score=np.linspace(0, 1, len(drift_df)))
+    with pytest.raises(ValueError, match="bin it first"):
+        StabilityMetrics(max_bins=50).fit(raw, "period", ["score"])
+
+    with pytest.raises(ValueError):
+        StabilityMetrics().psi()
@@ -0,0 +1,65 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_track.stability import StabilityReport
+from model_track.woe import WoeByPeriod
+
+
+@pytest.fixture
+def report_df():
+    rng = np.random.default_rng(1)
+    n = 1200
+    df = pd.DataFrame(
+        {
+            "period": np.repeat(pd.date_range("2024-01", periods=4, freq="MS"), n // 4),
+            "target": rng.integers(0, 2, n),
+        }
+    )
+    for i in range(5):
+        df[f"f{i}"] = rng.integers(0, 4, n)
+    df["cat"] = rng.choice(["a", "b", None], n)
+    return df
+
+
+def test_tables_match_woe_by_period(report_df):
+    report = StabilityReport(report_df, "period", "target")
+    tables = report.tables()
+
+    assert list(tables) == ["f0", "f1", "f2", "f3", "f4", "cat"]
+    for feature in ["f0", "cat"]:
+        expected = WoeByPeriod.compute_matrix(report_df, "target", feature, "period")
+        np.testing.assert_allclose(
+            tables[feature].to_numpy(), expected.to_numpy(), atol=1e-4
+        )
+
+    # calculado uma vez
+    assert report.tables() is tables
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2, -1])
+def test_build_writes_pages(report_df, tmp_path, n_jobs):
+    report = StabilityReport(report_df, "period", "target")
+    paths = report.build(
+        str(tmp_path), formats=("pdf", "html"), per_page=4, ncols=2, n_jobs=n_jobs
+    )
+
+    names = sorted(os.path.basename(p) for p in paths)
+    assert names == [
+        "index.html", "page_001.pdf", "page_001.png", "page_002.pdf", "page_002.png",
+    ]
+    assert all(os.path.getsize(p) > 0 for p in paths)
+
+    index = (tmp_path / "index.html").read_text()
+    assert 'src="page_002.png"' in index
+    assert "f4, cat" in index
+
+
+def test_build_validates_arguments(report_df, tmp_path):
+    report = StabilityReport(report_df, "period", "target")
+    with pytest.raises(ValueError):
+        report.build(str(tmp_path), formats=("svg",))
+    with pytest.raises(ValueError):
+        report.build(str(tmp_path), n_jobs=0)
@@ -1,3 +1,5 @@
+import numpy as np
+import pytest
 import pandas as pd
 from model_track.binning.tree_binner import TreeBinner
 
@@ -86,4 +88,87 @@ def test_tree_binner_min_samples_leaf_too_large():
     binner = TreeBinner(max_depth=3, min_samples_leaf=10)
     binner.fit(df, feature="x", target="y")
 
-    assert binner.bins_ == []
\ No newline at end of file
+    assert binner.bins_ == []
+
+# ------------------------------------------------------------------
+# Engines
+# ------------------------------------------------------------------
+
+@pytest.fixture
+def noisy_df():
+    rng = np.random.default_rng(42)
+    x = np.round(rng.normal(50, 15, size=2000), 1)
+    y = (rng.uniform(size=2000) < np.where(x > 55, 0.4, 0.1)).astype(int)
+    x[rng.uniform(size=2000) < 0.05] = np.nan
+    return pd.DataFrame({"x": x, "y": y})
+
+
+@pytest.mark.parametrize("criterion", ["gini", "entropy"])
+@pytest.mark.parametrize("max_depth,min_samples_leaf", [(1, 1), (2, 50), (3, 20)])
+def test_exact_engine_matches_sklearn(noisy_df, criterion, max_depth, min_samples_leaf):
+    exact = TreeBinner(max_depth, min_samples_leaf, criterion=criterion, engine="exact")
+    reference = TreeBinner(max_depth, min_samples_leaf, criterion=criterion, engine="sklearn")
+
+    exact.fit(noisy_df, feature="x", target="y")
+    reference.fit(noisy_df, feature="x", target="y")
+
+    assert exact.bins_ == reference.bins_
+    assert exact.model_ is None
+    assert reference.model_ is not None
+
+
+def test_exact_engine_respects_min_samples_leaf(noisy_df):
+    binner = TreeBinner(max_depth=4, min_samples_leaf=300)
+    binner.fit(noisy_df, feature="x", target="y")
+
+    edges = [-np.inf] + binner.bins_ + [np.inf]
+    x = noisy_df["x"].dropna()
+    counts = pd.cut(x, edges).value_counts()
+
+    assert len(binner.bins_) > 0
+    assert counts.min() >= 300
+
+
+def test_tree_binner_invalid_engine_or_criterion():
+    df = pd.DataFrame({"x": [1, 2, 3, 10, 11, 12], "y": [0, 0, 0, 1, 1, 1]})
+
+    with pytest.raises(ValueError):
+        TreeBinner(engine="unknown").fit(df, feature="x", target="y")
+
+    with pytest.raises(ValueError):
+        TreeBinner(criterion="unknown").fit(df, feature="x", target="y")
+
+
+def test_hist_engine_matches_exact_on_low_cardinality():
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 30, size=5000).astype(float)
+    y = (rng.uniform(size=5000) < np.where(x > 12, 0.35, 0.1)).astype(int)
+    df = pd.DataFrame({"x": x, "y": y})
+
+    exact = TreeBinner(max_depth=3, min_samples_leaf=100, engine="exact")
+    hist = TreeBinner(max_depth=3, min_samples_leaf=100, engine="hist")
+
+    assert hist.fit(df, "x", "y").bins_ == exact.fit(df, "x", "y").bins_
+
+
+def test_hist_engine_close_to_exact_on_continuous(noisy_df):
+    exact = TreeBinner(max_depth=1, min_samples_leaf=50).fit(noisy_df, "x", "y")
+    hist = TreeBinner(
+        max_depth=1,
+        min_samples_leaf=50,
+        engine="hist",
+        max_bins=32,
+        subsample=500,
+        random_state=0,
+    ).fit(noisy_df, "x", "y")
+
+    assert len(hist.bins_) == 1
+    assert abs(hist.bins_[0] - exact.bins_[0]) < 5
+
+
+def test_hist_engine_bounded_number_of_candidates(noisy_df):
+    binner = TreeBinner(max_depth=3, min_samples_leaf=1, engine="hist", max_bins=4)
+    binner.fit(noisy_df, "x", "y")
+
+    # at most max_bins buckets => at most max_bins - 1 cut points
+    assert 0 < len(binner.bins_) <= 3
@@ -0,0 +1,89 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_track.woe import WoeAccumulator, WoeCalculator
+
+
+@pytest.fixture
+def chunked_df():
+    rng = np.random.default_rng(7)
+    n = 600
+    return pd.DataFrame(
+        {
+            "feature": rng.choice(["A", "B", "C", None], n),
+            "target": rng.choice([0, 1, np.nan], n, p=[0.6, 0.35, 0.05]),
+        }
+    )
+
+
+def _chunks(df, size):
+    return [df.iloc[i:i + size] for i in range(0, len(df), size)]
+
+
+def test_update_matches_compute_table(chunked_df):
+    acc = WoeAccumulator("feature", "target")
+    for chunk in _chunks(chunked_df, 70):
+        acc.update(chunk)
+
+    expected = WoeCalculator.compute_table(chunked_df, "target", "feature")
+
+    pd.testing.assert_frame_equal(acc.to_table(), expected)
+    assert acc.n_rows_ == len(chunked_df)
+    assert acc.to_mapping() == WoeCalculator.compute_mapping(chunked_df, "target", "feature")
+
+
+def test_merge_partitions_through_dict(chunked_df):
+    chunks = _chunks(chunked_df, 100)
+
+    # cada partição em um "worker", estado trafegando como JSON
+    states = []
+    for part in (chunks[:3], chunks[3:]):
+        acc = WoeAccumulator("feature", "target")
+        for chunk in part:
+            acc.update(chunk)
+        states.append(json.dumps(acc.to_dict()))
+
+    merged = WoeAccumulator.from_dict(json.loads(states[0]))
+    merged.merge(WoeAccumulator.from_dict(json.loads(states[1])))
+
+    expected = WoeCalculator.compute_table(chunked_df, "target", "feature")
+    pd.testing.assert_frame_equal(merged.to_table(), expected)
+
+
+def test_categorical_and_numeric_features():
+    df = pd.DataFrame(
+        {
+            "cat": pd.Categorical(["hi", "lo", "lo", None, "hi", "lo"], categories=["lo", "mid", "hi"]),
+            "num": [1.5, 2.0, np.nan, 2.0, 1.5, 3.0],
+            "target": [1, 0, 1, 0, 0, 1],
+        }
+    )
+
+    for feature in ("cat", "num"):
+        acc = WoeAccumulator(feature, "target")
+        acc.update(df.iloc[:2]).update(df.iloc[2:])
+        pd.testing.assert_frame_equal(
+            acc.to_table(add_totals=False),
+            WoeCalculator.compute_table(df, "target", feature, add_totals=False),
+        )
+
+
+def test_validations():
+    acc = WoeAccumulator("feature", "target")
+    acc.update(pd.DataFrame({"feature": ["A"], "target": [0]}))
+
+    # apenas uma classe vista até agora
+    with pytest.raises(ValueError):
+        acc.to_table()
+
+    with pytest.raises(ValueError):
+        acc.update(pd.DataFrame({"feature": ["A", "B"], "target": [1, 2]}))
+
+    with pytest.raises(KeyError):
+        acc.update(pd.DataFrame({"other": ["A"], "target": [0]}))
+
+    with pytest.raises(ValueError):
+        acc.merge(WoeAccumulator("other", "target"))
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_track.woe import WoeBootstrap, WoeCalculator
+
+
+@pytest.fixture
+def boot_df():
+    rng = np.random.default_rng(5)
+    n = 3000
+    feature = rng.choice(["A", "B", "C"], n)
+    rate = pd.Series(feature).map({"A": 0.1, "B": 0.3, "C": 0.5}).to_numpy()
+    return pd.DataFrame(
+        {
+            "month": rng.choice(["2024-01", "2024-02"], n),
+            "feature": feature,
+            "target": (rng.random(n) < rate).astype(int),
+        }
+    )
+
+
+@pytest.mark.parametrize("method", ["multinomial", "poisson"])
+def test_intervals_contain_point_estimate(boot_df, method):
+    boot = WoeBootstrap(n_boot=300, method=method, random_state=0)
+
+    result = boot.compute(boot_df, "target", "feature")
+    table = WoeCalculator.compute_table(boot_df, "target", "feature", add_totals=False)
+
+    expected = dict(zip(table["feature"], table["woe"]))
+    for _, row in result.iterrows():
+        assert row["woe"] == expected[row["feature"]]
+        assert row["woe_lower"] < row["woe"] < row["woe_upper"]
+
+    assert (result["iv_lower"] < result["iv_total"]).all()
+    assert (result["iv_total"] < result["iv_upper"]).all()
+    assert np.isclose(result["iv_total"].iloc[0], table["iv_total"].iloc[0], atol=1e-4)
+
+
+def test_resample_shapes_and_totals():
+    boot = WoeBootstrap(n_boot=50, random_state=1)
+    n_event, n_non_event = np.array([10, 20, 5]), np.array([90, 60, 15])
+
+    boot_event, boot_non_event = boot.resample(n_event, n_non_event)
+
+    assert boot_event.shape == (50, 3)
+    assert boot_non_event.shape == (50, 3)
+    # multinomial preserva o total de linhas
+    assert (boot_event.sum(axis=1) + boot_non_event.sum(axis=1) == 200).all()
+
+
+def test_interval_width_shrinks_with_more_data():
+    boot = WoeBootstrap(n_boot=500, random_state=2)
+    small = boot.from_counts("f", ["A", "B"], [10, 20], [90, 80])
+    large = boot.from_counts("f", ["A", "B"], [1000, 2000], [9000, 8000])
+
+    small_width = (small["woe_upper"] - small["woe_lower"]).to_numpy()
+    large_width = (large["woe_upper"] - large["woe_lower"]).to_numpy()
+    assert (large_width < small_width).all()
+
+
+def test_compute_by_period(boot_df):
+    result = WoeBootstrap(n_boot=100, random_state=3).compute_by_period(
+        boot_df, "target", "feature", "month"
+    )
+
+    assert list(result.columns[:2]) == ["month", "feature"]
+    assert set(result["month"]) == {"2024-01", "2024-02"}
+    assert len(result) == 6
+    assert (result["woe_lower"] <= result["woe_upper"]).all()
+
+
+def test_invalid_params():
+    with pytest.raises(ValueError):
+        WoeBootstrap(n_boot=0)
+
+    with pytest.raises(ValueError):
+        WoeBootstrap(method="jackknife")
+
+    with pytest.raises(ValueError):
+        WoeBootstrap(ci=1.5)
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 from model_track.woe import WoeCalculator
@@ -80,3 +81,86 @@ def test_all_null_dates(sample_df_woe_by_period):
             feature_col="feature",
             date_col="date",
         )
+
+
+def test_long_output_columns_and_order(sample_df_woe_by_period):
+    result = WoeByPeriod.compute(
+        df=sample_df_woe_by_period,
+        target_col="target",
+        feature_col="feature",
+        date_col="date",
+    )
+
+    assert list(result.columns) == [
+        "date", "feature", "n_event", "n_non_event", "event_rate",
+        "non_event_rate", "exposure", "woe", "iv", "iv_total",
+    ]
+    assert result["date"].is_monotonic_increasing
+
+    for _, g in result.groupby("date"):
+        assert g["woe"].is_monotonic_decreasing
+
+
+def test_count_cube(sample_df_woe_by_period):
+    periods, categories, n_event, n_non_event = WoeByPeriod.count_cube(
+        df=sample_df_woe_by_period,
+        target_col="target",
+        feature_col="feature",
+        date_col="date",
+    )
+
+    assert periods.tolist() == ["2024-01", "2024-02"]
+    assert categories.tolist() == ["A", "B"]
+    assert n_event.tolist() == [[1, 0], [0, 1]]
+    assert n_non_event.tolist() == [[0, 1], [1, 1]]
+
+
+def test_compute_matrix_matches_long_output():
+    df = pd.DataFrame(
+        {
+            "date": ["2024-01"] * 4 + ["2024-02"] * 4 + [None],
+            "feature": ["A", "B", "A", "B", "A", "A", "C", "C", "B"],
+            "target": [1, 0, 0, 1, 1, 0, 1, 0, 1],
+        }
+    )
+
+    long = WoeByPeriod.compute(df, "target", "feature", "date")
+    matrix = WoeByPeriod.compute_matrix(df, "target", "feature", "date")
+
+    assert matrix.index.tolist() == ["2024-01", "2024-02"]
+    assert matrix.columns.tolist() == ["A", "B", "C"]
+
+    # categoria não observada no período -> NaN
+    assert np.isnan(matrix.loc["2024-01", "C"])
+    assert np.isnan(matrix.loc["2024-02", "B"])
+
+    for _, row in long.iterrows():
+        assert np.isclose(matrix.loc[row["date"], row["feature"]], row["woe"])
+
+    counts = WoeByPeriod.compute_matrix(df, "target", "feature", "date", value="n_event")
+    assert counts.loc["2024-02"].tolist() == [1, 0, 1]
+
+
+def test_compute_matrix_invalid_value(sample_df_woe_by_period):
+    with pytest.raises(ValueError):
+        WoeByPeriod.compute_matrix(
+            sample_df_woe_by_period, "target", "feature", "date", value="bad"
+        )
+
+
+def test_fold_levels_consistent_across_periods():
+    df = pd.DataFrame(
+        {
+            "date": ["2024-01"] * 6 + ["2024-02"] * 6,
+            "feature": ["A", "A", "A", "x1", "x2", "B"] + ["A", "B", "B", "x3", "A", "B"],
+            "target": [1, 0, 1, 0, 1, 0, 0, 1, 0, 1, 1, 0],
+        }
+    )
+
+    result = WoeByPeriod.compute(df, "target", "feature", "date", top_k=2)
+    matrix = WoeByPeriod.compute_matrix(df, "target", "feature", "date", top_k=2)
+
+    assert set(result["feature"]) == {"A", "B", "__OTHER__"}
+    assert matrix.columns.tolist() == ["A", "B", "__OTHER__"]
+    assert result.attrs["fold_report"]["n_folded"] == 3
+    assert matrix.attrs["fold_report"]["folded_rows"] == 3
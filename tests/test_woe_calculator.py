@@ -182,3 +182,223 @@ def test_compute_mapping_matches_table(sample_df_woe_calculator):
 
     for _, row in table.iterrows():
         assert np.isclose(mapping[row["feature"]], row["woe"])
+
+
+def test_categorical_feature_matches_object_feature():
+    df = pd.DataFrame(
+        {
+            "feature": ["A", "A", "B", "B", "B", None],
+            "target": [1, 0, 1, 0, 0, 1],
+        }
+    )
+    df_cat = df.assign(
+        feature=pd.Categorical(df["feature"], categories=["B", "A", "UNUSED"])
+    )
+
+    expected = WoeCalculator.compute_table(df, "target", "feature")
+    result = WoeCalculator.compute_table(df_cat, "target", "feature")
+
+    # categorias não observadas não geram linhas
+    assert "UNUSED" not in result["feature"].astype(object).tolist()
+
+    result["feature"] = result["feature"].astype(object)
+    pd.testing.assert_frame_equal(
+        result.sort_values("n_non_event").reset_index(drop=True),
+        expected.sort_values("n_non_event").reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+# ------------------------------------------------------------------
+# Counting engine
+# ------------------------------------------------------------------
+
+def test_count_events_matches_groupby():
+    df = pd.DataFrame(
+        {
+            "feature": ["B", "A", None, "B", "A", None, "C"],
+            "target": [1, 0, 1, np.nan, 1, 0, 0],
+        }
+    )
+
+    categories, n_event, n_non_event = WoeCalculator.count_events(
+        df["feature"], df["target"]
+    )
+
+    # ordem do groupby(sort=True, dropna=False): ausentes por último;
+    # target ausente conta como não-evento
+    assert categories[:3].tolist() == ["A", "B", "C"]
+    assert pd.isna(categories[3])
+    assert n_event.tolist() == [1, 1, 0, 1]
+    assert n_non_event.tolist() == [1, 1, 1, 1]
+
+
+def test_count_events_reuses_categorical_codes():
+    feature = pd.Series(
+        pd.Categorical(["low", "high", "low", None], categories=["low", "mid", "high"])
+    )
+    target = pd.Series([1, 0, 0, 1])
+
+    categories, n_event, n_non_event = WoeCalculator.count_events(feature, target)
+
+    # ordem das categorias, sem categorias não observadas
+    assert categories[:2].tolist() == ["low", "high"]
+    assert n_event.tolist() == [1, 0, 1]
+    assert n_non_event.tolist() == [1, 1, 0]
+
+
+def test_table_from_counts_matches_compute_table(sample_df_woe_calculator):
+    df = sample_df_woe_calculator
+    categories, n_event, n_non_event = WoeCalculator.count_events(
+        df["feature"], df["target"]
+    )
+
+    result = WoeCalculator.table_from_counts("feature", categories, n_event, n_non_event)
+    expected = WoeCalculator.compute_table(df, "target", "feature")
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_infinite_woe_sets_infinite_iv_total():
+    df = pd.DataFrame(
+        {
+            "feature": ["A", "A", "B", "B", np.nan],
+            "target": [1, 1, 0, 1, 0],
+        }
+    )
+
+    table = WoeCalculator.compute_table(df, "target", "feature", add_totals=False)
+
+    assert np.isinf(table["iv_total"]).all()
+    assert pd.isna(table["feature"].iloc[-1])
+
+
+def test_compute_tables_matches_compute_table():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "weak": rng.choice(["A", "B"], 500),
+            "strong": rng.choice(["X", "Y", None], 500),
+            "target": rng.integers(0, 2, 500),
+        }
+    )
+    df.loc[df["strong"] == "X", "target"] = 1
+
+    for n_jobs in (1, 2):
+        tables, summary = WoeCalculator.compute_tables(
+            df, "target", ["weak", "strong"], n_jobs=n_jobs
+        )
+
+        for feature in ["weak", "strong"]:
+            pd.testing.assert_frame_equal(
+                tables[feature], WoeCalculator.compute_table(df, "target", feature)
+            )
+
+        assert list(summary.columns) == ["feature", "iv", "n_categories"]
+        assert summary["feature"].tolist() == ["strong", "weak"]
+        assert summary["n_categories"].tolist() == [3, 2]
+
+
+def test_compute_tables_validates_columns(sample_df_woe_calculator):
+    with pytest.raises(KeyError):
+        WoeCalculator.compute_tables(sample_df_woe_calculator, "target", ["missing"])
+
+    with pytest.raises(KeyError):
+        WoeCalculator.compute_tables(sample_df_woe_calculator, "missing", ["feature"])
+
+
+# ------------------------------------------------------------------
+# High-cardinality folding
+# ------------------------------------------------------------------
+
+@pytest.fixture
+def high_cardinality_df():
+    rng = np.random.default_rng(3)
+    # poucos níveis frequentes + cauda longa de IDs raros
+    ids = np.concatenate([
+        rng.choice(["m1", "m2", "m3"], 900),
+        np.array([f"tail_{i}" for i in range(100)]),
+        np.array([None] * 20),
+    ])
+    return pd.DataFrame({"merchant": ids, "target": rng.integers(0, 2, len(ids))})
+
+
+def test_fold_top_k(high_cardinality_df):
+    table = WoeCalculator.compute_table(
+        high_cardinality_df, "target", "merchant", top_k=3, add_totals=False
+    )
+
+    # 3 níveis + __OTHER__ + ausentes
+    assert set(table["merchant"].dropna()) == {"m1", "m2", "m3", "__OTHER__"}
+    assert table["merchant"].isna().sum() == 1
+    assert table["n_event"].sum() + table["n_non_event"].sum() == len(high_cardinality_df)
+
+    report = table.attrs["fold_report"]
+    assert report["n_levels"] == 103
+    assert report["n_kept"] == 3
+    assert report["n_folded"] == 100
+    assert report["folded_rows"] == 100
+    assert np.isclose(report["folded_exposure"], 100 / 1020)
+
+
+def test_fold_min_exposure_matches_manual_grouping(high_cardinality_df):
+    df = high_cardinality_df
+    folded = WoeCalculator.compute_table(df, "target", "merchant", min_exposure=0.01)
+
+    manual = df.assign(
+        merchant=df["merchant"].where(
+            df["merchant"].isin(["m1", "m2", "m3"]) | df["merchant"].isna(),
+            "__OTHER__",
+        )
+    )
+    expected = WoeCalculator.compute_table(manual, "target", "merchant")
+
+    pd.testing.assert_frame_equal(
+        folded.sort_values("merchant", key=lambda s: s.astype(str)).reset_index(drop=True),
+        expected.sort_values("merchant", key=lambda s: s.astype(str)).reset_index(drop=True),
+    )
+
+
+def test_fold_levels_validates_params():
+    categories = pd.Index(["A", "B"])
+    with pytest.raises(ValueError):
+        WoeCalculator.fold_levels(categories, np.array([1, 2]), np.array([3, 4]), top_k=0)
+
+    with pytest.raises(ValueError):
+        WoeCalculator.fold_levels(categories, np.array([1, 2]), np.array([3, 4]), min_exposure=2)
+
+
+def test_integer_feature_dense_codes_match_factorize():
+    df = pd.DataFrame(
+        {
+            "feature": np.array([-3, 5, 5, -3, 0, 7, 7, 0], dtype=np.int16),
+            "target": [1, 0, 1, 0, 0, 1, 0, 1],
+        }
+    )
+    table = WoeCalculator.compute_table(df, "target", "feature", add_totals=False)
+    expected = WoeCalculator.compute_table(
+        df.astype({"feature": str}).replace({"feature": {"-3": "a", "0": "b", "5": "c", "7": "d"}}),
+        "target", "feature", add_totals=False,
+    )
+
+    assert list(table["feature"]) == [-3, 0, 5, 7]
+    np.testing.assert_allclose(table["woe"], expected["woe"])
+
+
+def test_integer_feature_dense_codes_do_not_wrap_small_dtypes():
+    df = pd.DataFrame(
+        {
+            "feature": np.array([-100, 100, 5, -100, 100, 5], dtype=np.int8),
+            "target": [1, 0, 1, 0, 0, 1],
+        }
+    )
+    table = WoeCalculator.compute_table(df, "target", "feature", add_totals=False)
+    expected = WoeCalculator.compute_table(
+        df.astype({"feature": np.int64}), "target", "feature", add_totals=False
+    )
+
+    assert sorted(table["feature"]) == [-100, 5, 100]
+    pd.testing.assert_frame_equal(
+        table.astype({"feature": np.int64}).reset_index(drop=True),
+        expected.reset_index(drop=True),
+    )
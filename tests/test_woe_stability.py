@@ -1,8 +1,10 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import pytest
 
-from model_track.stability import WoeStability
+from model_track.stability import WoeCache, WoeStability, benchmark_view
+from model_track.woe import WoeByPeriod
 
 
 def test_missing_date_column_raises(sample_df_woe_stability):
@@ -76,4 +78,224 @@ def test_generate_view_adds_lines_to_axis(sample_df_woe_stability):
         ax=ax,
     )
 
-    assert len(ax.lines) > 0
\ No newline at end of file
+    assert len(ax.lines) > 0
+
+def test_generate_view_with_confidence_bands(sample_df_woe_stability):
+    ws = WoeStability(
+        df=sample_df_woe_stability,
+        date_col="period",
+    )
+
+    fig, ax = plt.subplots()
+
+    ws.generate_view(
+        feature_col="feature_cat",
+        target_col="target",
+        ax=ax,
+        ci=0.9,
+        n_boot=50,
+        random_state=0,
+    )
+
+    assert len(ax.lines) > 0
+    assert len(ax.collections) > 0
+
+
+def test_init_keeps_reference_unless_copy(sample_df_woe_stability):
+    ws = WoeStability(df=sample_df_woe_stability, date_col="period")
+    assert ws.df is sample_df_woe_stability
+
+    ws = WoeStability(df=sample_df_woe_stability, date_col="period", copy=True)
+    assert ws.df is not sample_df_woe_stability
+    pd.testing.assert_frame_equal(ws.df, sample_df_woe_stability)
+
+
+def test_cache_is_shared_across_objects(sample_df_woe_stability):
+    cache = WoeCache(maxsize=8)
+
+    ws = WoeStability(df=sample_df_woe_stability, date_col="period", cache=cache)
+    first = ws.global_table(feature_col="feature_cat", target_col="target")
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # mesmo conteúdo em outro objeto (cópia) -> mesma chave
+    other = WoeStability(
+        df=sample_df_woe_stability.copy(), date_col="period", cache=cache
+    )
+    second = other.global_table(feature_col="feature_cat", target_col="target")
+    assert cache.hits == 1
+    pd.testing.assert_frame_equal(first, second)
+
+    # o resultado devolvido é uma cópia
+    second.loc[0, "woe"] = 99.0
+    third = ws.global_table(feature_col="feature_cat", target_col="target")
+    pd.testing.assert_frame_equal(first, third)
+
+
+def test_cache_covers_view_and_seeded_bands(sample_df_woe_stability):
+    cache = WoeCache()
+    ws = WoeStability(df=sample_df_woe_stability, date_col="period", cache=cache)
+
+    for _ in range(2):
+        fig = ws.generate_view(
+            feature_col="feature_cat", target_col="target",
+            ci=0.9, n_boot=20, random_state=0,
+        )
+        plt.close(fig)
+
+    # period table + bands
+    assert len(cache) == 2
+    assert cache.hits == 2
+
+
+def test_cache_never_returns_stale_tables(sample_df_woe_stability):
+    df = sample_df_woe_stability.copy()
+    flipped = df.copy()
+    flipped["target"] = 1 - flipped["target"]
+    expected = WoeStability(df=flipped, date_col="period").global_table(
+        feature_col="feature_cat", target_col="target"
+    )
+
+    # cache sem cópia explícita: guarda cópia, edições do chamador não vazam
+    ws = WoeStability(df=df, date_col="period", cache=WoeCache())
+    assert ws.df is not df
+    before = ws.global_table(feature_col="feature_cat", target_col="target")
+    df["target"] = 1 - df["target"]
+    pd.testing.assert_frame_equal(
+        ws.global_table(feature_col="feature_cat", target_col="target"), before
+    )
+
+    # copy=False: a coluna é hasheada a cada chamada
+    shared = sample_df_woe_stability.copy()
+    ws = WoeStability(df=shared, date_col="period", copy=False, cache=WoeCache())
+    ws.global_table(feature_col="feature_cat", target_col="target")
+    shared["target"] = 1 - shared["target"]
+    pd.testing.assert_frame_equal(
+        ws.global_table(feature_col="feature_cat", target_col="target"), expected
+    )
+
+
+def test_clear_cache_after_inplace_change(sample_df_woe_stability):
+    cache = WoeCache()
+    ws = WoeStability(df=sample_df_woe_stability, date_col="period", cache=cache)
+
+    before = ws.global_table(feature_col="feature_cat", target_col="target")
+    ws.df.loc[0, "target"] = 1 - ws.df.loc[0, "target"]
+    ws.clear_cache()
+    after = ws.global_table(feature_col="feature_cat", target_col="target")
+
+    assert len(cache) == 1
+    assert not before["woe"].equals(after["woe"])
+
+
+def test_cache_evicts_least_recently_used():
+    cache = WoeCache(maxsize=2)
+    frame = pd.DataFrame({"a": [1]})
+
+    cache.put((("x",), 1), frame)
+    cache.put((("y",), 2), frame)
+    cache.get((("x",), 1))
+    cache.put((("z",), 3), frame)
+
+    assert (("x",), 1) in cache
+    assert (("y",), 2) not in cache
+    assert cache.invalidate("z") == 1
+    assert len(cache) == 1
+
+    with pytest.raises(ValueError):
+        WoeCache(maxsize=0)
+
+
+@pytest.fixture
+def daily_df():
+    rng = np.random.default_rng(0)
+    n = 4000
+    return pd.DataFrame(
+        {
+            "day": rng.choice(pd.date_range("2024-01-01", periods=90, freq="D"), n),
+            "cat": rng.choice(list("abcde"), n),
+            "target": rng.integers(0, 2, n),
+        }
+    )
+
+
+def test_woe_matrix_matches_woe_by_period(daily_df):
+    ws = WoeStability(df=daily_df, date_col="day")
+
+    matrix = ws.woe_matrix("cat", "target")
+    expected = WoeByPeriod.compute_matrix(daily_df, "target", "cat", "day")
+    pd.testing.assert_frame_equal(matrix, expected)
+
+
+def test_woe_matrix_rollup_sums_counts(daily_df):
+    ws = WoeStability(df=daily_df, date_col="day")
+
+    monthly = ws.woe_matrix("cat", "target", rollup="M")
+    rolled = daily_df.assign(day=daily_df["day"].dt.to_period("M").dt.start_time)
+    expected = WoeByPeriod.compute_matrix(rolled, "target", "cat", "day")
+
+    assert len(monthly) == 3
+    pd.testing.assert_frame_equal(monthly, expected)
+
+    with pytest.raises(ValueError):
+        WoeStability(
+            df=daily_df.assign(day=daily_df["day"].astype(str)), date_col="day"
+        ).woe_matrix("cat", "target", rollup="W")
+
+
+def test_generate_view_single_collection(daily_df):
+    ws = WoeStability(df=daily_df, date_col="day")
+    fig, ax = plt.subplots()
+
+    ws.generate_view(
+        "cat", "target", ax=ax, method="collection", rollup="W", legend=False
+    )
+
+    assert len(ax.collections) == 1
+    assert len(ax.collections[0].get_segments()) == 5
+    assert ax.get_legend() is None
+    plt.close(fig)
+
+    with pytest.raises(ValueError):
+        ws.generate_view("cat", "target", method="scatter")
+
+
+def test_generate_view_lines_one_per_category(daily_df):
+    ws = WoeStability(df=daily_df, date_col="day")
+    fig, ax = plt.subplots()
+
+    ws.generate_view("cat", "target", ax=ax, ci=0.9, n_boot=20, random_state=0, rollup="M")
+
+    # 5 categorias + a linha do zero
+    assert len(ax.lines) == 6
+    assert len(ax.collections) == 5
+    assert [t.get_text() for t in ax.get_legend().get_texts()] == list("abcde")
+    plt.close(fig)
+
+
+def test_benchmark_view_reports_timings(daily_df):
+    ws = WoeStability(df=daily_df, date_col="day")
+
+    report = benchmark_view(ws, "cat", "target", n_repeat=1, rollup="W")
+
+    assert report["n_categories"] == 5
+    assert report["n_periods"] == 13
+    timings = ["compute_s", "baseline_s", "lines_s", "collection_s"]
+    assert set(timings) <= set(report)
+    assert all(report[k] > 0 for k in timings)
+    assert report["speedup"] == report["baseline_s"] / min(
+        report["lines_s"], report["collection_s"]
+    )
+
+
+def test_benchmark_view_bypasses_cache_and_rejects_reserved_kwargs(daily_df):
+    cache = WoeCache()
+    ws = WoeStability(df=daily_df, date_col="day", cache=cache)
+
+    benchmark_view(ws, "cat", "target", n_repeat=2, rollup="W")
+
+    assert ws.cache is cache
+    assert len(cache) == 0 and cache.hits == 0
+
+    for kwargs in ({"method": "lines"}, {"ax": None}):
+        with pytest.raises(ValueError):
+            benchmark_view(ws, "cat", "target", **kwargs)
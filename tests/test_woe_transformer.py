@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_track.woe import WoeCalculator, WoeTransformer
+
+
+@pytest.fixture
+def train_df():
+    return pd.DataFrame(
+        {
+            "color": ["red", "red", "blue", "blue", "green", None, None, "green"],
+            "size": ["S", "M", "M", "L", "S", "L", "M", "S"],
+            "target": [1, 0, 1, 0, 0, 1, 0, 1],
+        }
+    )
+
+
+def test_transform_matches_series_map(train_df):
+    transformer = WoeTransformer.fit(train_df, "target", ["color", "size"])
+    result = transformer.transform(train_df)
+
+    for feature in ("color", "size"):
+        mapping = WoeCalculator.compute_mapping(train_df, "target", feature)
+        table = WoeCalculator.compute_table(train_df, "target", feature, add_totals=False)
+        missing_woe = table.loc[table[feature].isna(), "woe"]
+
+        expected = train_df[feature].map(mapping)
+        if len(missing_woe):
+            expected = expected.fillna(missing_woe.iloc[0])
+
+        np.testing.assert_allclose(result[feature].to_numpy(), expected.to_numpy())
+
+    assert result.index.equals(train_df.index)
+
+
+def test_categorical_input_matches_object_input(train_df):
+    transformer = WoeTransformer.fit(train_df, "target", ["color", "size"])
+    df_cat = train_df.astype({"color": "category", "size": "category"})
+
+    pd.testing.assert_frame_equal(transformer.transform(df_cat), transformer.transform(train_df))
+
+
+def test_unseen_and_missing_policies():
+    tables = {"color": {"red": 0.5, "blue": -0.5}}
+    df = pd.DataFrame({"color": ["red", "purple", None]})
+
+    default = WoeTransformer(tables).transform(df)["color"]
+    assert default.iloc[0] == 0.5
+    assert default.iloc[1:].isna().all()
+
+    zero = WoeTransformer(tables, unseen="zero", missing=-1.0).transform(df)["color"]
+    assert zero.tolist() == [0.5, 0.0, -1.0]
+
+    with pytest.raises(ValueError):
+        WoeTransformer(tables, unseen="error").transform(df)
+
+    with pytest.raises(ValueError):
+        WoeTransformer(tables, missing="error").transform(df)
+
+    with pytest.raises(ValueError):
+        WoeTransformer(tables, unseen="bad")
+
+
+def test_table_missing_row_takes_precedence(train_df):
+    table = WoeCalculator.compute_table(train_df, "target", "color")
+    transformer = WoeTransformer({"color": table}, missing="error")
+
+    result = transformer.transform(pd.DataFrame({"color": [None]}))
+
+    expected = table.loc[table["color"].isna(), "woe"].iloc[0]
+    assert result["color"].iloc[0] == expected
+
+
+def test_float32_output_and_column_subset(train_df):
+    transformer = WoeTransformer.fit(train_df, "target", ["color", "size"], dtype=np.float32)
+
+    result = transformer.transform(train_df, columns=["size"])
+
+    assert list(result.columns) == ["size"]
+    assert result["size"].dtype == np.float32
+
+    with pytest.raises(KeyError):
+        transformer.transform(train_df, columns=["unknown"])
+
+    with pytest.raises(KeyError):
+        transformer.transform(train_df.drop(columns="size"))